@@ -0,0 +1,181 @@
+###############################################################################
+#
+# AsyncTable - Classes to run poker tables whose players answer asynchronously.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import asyncio
+import inspect
+
+# Package imports.
+from .player import to_chips
+from .poker_game import Action, Decision, PokerGame, check_call_strategy
+
+
+# Static global variables.
+DEFAULT_ACTION_TIMEOUT = 30.0
+
+
+class AsyncTable:
+    """
+    Class to play hands of a PokerGame on an asyncio event loop.  Each seat's strategy may be a coroutine function
+    (a remote bot, model inference or a human client); the table awaits it while other tables keep playing, so one
+    process can host many slow tables.  Plain strategy functions are called directly.
+
+    """
+
+    def __init__(self, game: PokerGame, action_timeout: float = DEFAULT_ACTION_TIMEOUT):
+        """
+        Constructor.
+
+        :param game: PokerGame with its players and strategies added.
+        :param action_timeout: Float seconds each player has to act, or None to wait forever.
+        """
+        self.game = game
+        self.action_timeout = action_timeout
+        self.timeouts = 0
+
+    def __repr__(self):
+        return f"AsyncTable(players: {len(self.game.player_list)}, hands: {self.game.hands_played})"
+
+    async def request_action(self, decision: Decision):
+        """
+        Asks a player's strategy for their action.  A player who does not answer in time checks, which folds them
+        if they face a bet, as Player.check does.
+
+        :param decision: Decision to act on.
+        :return: Tuple of (Action, amount).
+        """
+        action = self.game.strategies[decision.seat](self.game, decision)
+        if not inspect.isawaitable(action):
+            return action
+        try:
+            return await asyncio.wait_for(action, self.action_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return Action.CHECK, 0
+
+    async def play_hand(self):
+        """
+        Plays one hand.
+
+        :return: List of each seat's net chip change, or None if fewer than two players have chips.
+        """
+        steps = self.game.hand_steps()
+        try:
+            decision = next(steps)
+            while True:
+                decision = steps.send(await self.request_action(decision))
+        except StopIteration as stop:
+            return stop.value
+
+    async def play(self, hands: int):
+        """
+        Plays hands until the count is reached or fewer than two players have chips.
+
+        :param hands: Integer maximum number of hands.
+        :return: Tuple of (hands played, list of each seat's net chip change).
+        """
+        # Stacks are integer minimum units, so their change is exact however many hands are played.
+        starting_stacks = [player.stack_units for player in self.game.player_list]
+        hands_played = 0
+        while hands_played < hands and await self.play_hand() is not None:
+            hands_played += 1
+        return hands_played, [to_chips(player.stack_units - stack)
+                              for player, stack in zip(self.game.player_list, starting_stacks)]
+
+
+async def play_tables(tables: list[AsyncTable], hands: int) -> list:
+    """
+    Plays hands at many tables concurrently.
+
+    :param tables: List of AsyncTable objects.
+    :param hands: Integer maximum number of hands at each table.
+    :return: List of the (hands played, chip changes) tuple of each table, in the order of tables.
+    """
+    return await asyncio.gather(*(table.play(hands) for table in tables))
+
+
+class FakeClient:
+    """
+    Class to stand in for a remote player in tests.  Decisions are queued to a serving task that answers them with a
+    local strategy after a delay, as a client over a network would.  Add the client itself as the player's strategy,
+    and run it inside an async with block (or between start and stop).
+
+    """
+
+    def __init__(self, strategy=check_call_strategy, latency: float = 0.0):
+        """
+        Constructor.
+
+        :param strategy: Callable taking (game, Decision) and returning a tuple of (Action, amount).
+        :param latency: Float seconds the client takes to answer each decision.
+        """
+        self.strategy = strategy
+        self.latency = latency
+        self.requests = 0
+        self._queue = None
+        self._task = None
+
+    def __repr__(self):
+        return f"FakeClient(latency: {self.latency}, requests: {self.requests})"
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    def start(self):
+        """
+        Starts the serving task on the running event loop.
+
+        :return: None
+        """
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._serve())
+
+    async def stop(self):
+        """
+        Stops the serving task.  Decisions still queued are never answered.
+
+        :return: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __call__(self, game: PokerGame, decision: Decision):
+        """
+        Sends a decision to the client and waits for its answer.
+
+        :param game: PokerGame the decision is made in.
+        :param decision: Decision to act on.
+        :return: Tuple of (Action, amount).
+        """
+        if self._task is None:
+            raise RuntimeError("async_table: the fake client has not been started.")
+        answer = asyncio.get_running_loop().create_future()
+        self.requests += 1
+        await self._queue.put((game, decision, answer))
+        return await answer
+
+    async def _serve(self):
+        """
+        Answers queued decisions one at a time, skipping any the table stopped waiting for.
+
+        :return: None
+        """
+        while True:
+            game, decision, answer = await self._queue.get()
+            if self.latency > 0:
+                await asyncio.sleep(self.latency)
+            if not answer.done():
+                answer.set_result(self.strategy(game, decision))
@@ -0,0 +1,84 @@
+###############################################################################
+#
+# BatchEvaluator - Vectorized hand evaluation of many hands at once with NumPy.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import numpy as np
+
+# Package imports.
+from .evaluator import CARD_BITS, CARD_RANK_KEYS, CATEGORY_SHIFT, FLUSH_VALUES, MAX_LOOKUP_CARDS, RANK_KEYS, \
+    RANK_VALUES, RANKS_PER_SUIT, SUIT_MASK
+
+
+# Static global variables.
+DEFAULT_CHUNK_SIZE = 1 << 18
+SUITS_IN_DECK = 4
+
+
+def _build_arrays():
+    """
+    Wraps the evaluator lookup tables in NumPy arrays.  The table arrays are views of the memory mapped table file,
+    so they are not copied and are shared between processes.  The rank table is searched with np.searchsorted.
+
+    :return: Tuple of (card rank keys, card bits, sorted rank keys, rank values, flush values) arrays.
+    """
+    return (np.array(CARD_RANK_KEYS, dtype=np.uint64),
+            np.array(CARD_BITS, dtype=np.uint64),
+            np.frombuffer(RANK_KEYS, dtype=np.uint64),
+            np.frombuffer(RANK_VALUES, dtype=np.uint32),
+            np.frombuffer(FLUSH_VALUES, dtype=np.uint32))
+
+
+CARD_RANK_KEY_ARRAY, CARD_BIT_ARRAY, _SORTED_RANK_KEYS, _RANK_VALUES, _FLUSH_VALUES = _build_arrays()
+
+
+def evaluate_states(rank_keys: np.ndarray, card_masks: np.ndarray) -> np.ndarray:
+    """
+    Evaluates many sets of cards from their rank keys and card masks, the vectorized form of
+    evaluator.evaluate_state.  Callers that share cards between hands, such as a board, can sum the shared part once
+    and add each hand's own cards to it.
+
+    :param rank_keys: (N,) uint64 array, sums of CARD_RANK_KEY_ARRAY over each set.
+    :param card_masks: (N,) uint64 array, sums of CARD_BIT_ARRAY over each set of distinct cards.
+    :return: (N,) int64 array of hand values.
+    """
+    values = _RANK_VALUES[np.searchsorted(_SORTED_RANK_KEYS, rank_keys)].astype(np.int64)
+    for suit in range(SUITS_IN_DECK):
+        suit_masks = (card_masks >> np.uint64(suit * RANKS_PER_SUIT)) & np.uint64(SUIT_MASK)
+        np.maximum(values, _FLUSH_VALUES[suit_masks.astype(np.intp)], out=values)
+    return values
+
+
+def _evaluate_chunk(cards: np.ndarray) -> np.ndarray:
+    """
+    Evaluates a chunk of hands.
+
+    :param cards: (N, k) integer array of card indices, k at most MAX_LOOKUP_CARDS.
+    :return: (N,) int64 array of hand values.
+    """
+    return evaluate_states(CARD_RANK_KEY_ARRAY[cards].sum(axis=1, dtype=np.uint64),
+                           CARD_BIT_ARRAY[cards].sum(axis=1, dtype=np.uint64))
+
+
+def evaluate_batch(cards, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Evaluates many hands at once.  Each row holds the distinct 0-51 card indices of one hand, as given by Card.index.
+    Values agree exactly with Hand.get_hand_rank().
+
+    :param cards: (N, k) integer array-like of card indices, k at most MAX_LOOKUP_CARDS.
+    :param chunk_size: Maximum number of hands evaluated per vectorized step, to bound temporary memory.
+    :return: Tuple of an (N,) int64 array of hand values and an (N,) int8 array of HandType values.
+    """
+    cards = np.asarray(cards, dtype=np.intp)
+    if cards.ndim != 2 or cards.shape[1] > MAX_LOOKUP_CARDS:
+        raise ValueError("evaluate_batch: cards must be an (N, k) array with k at most "
+                         + str(MAX_LOOKUP_CARDS) + ".")
+
+    values = np.empty(cards.shape[0], dtype=np.int64)
+    for start in range(0, cards.shape[0], chunk_size):
+        values[start:start + chunk_size] = _evaluate_chunk(cards[start:start + chunk_size])
+
+    return values, (values >> CATEGORY_SHIFT).astype(np.int8)
@@ -43,11 +43,93 @@ class Suit(Enum):
     DIAMONDS = 4
 
 
+# Static global variables.
+RANKS_PER_SUIT = 13
+CARDS_IN_DECK = 52
+
+
+class CardFace:
+    """
+    Shared, immutable identity of a card.  One CardFace exists for every suit and card type combination, so faces
+    are compared by identity and hashed by their index.  The 52 standard cards are indexed 0-51 in the order
+    generate_deck() creates them: index = (suit - 1) * 13 + (card type - 2).  The hidden card and other non-standard
+    combinations (such as a low ace) are indexed from 52 upwards.
+
+    """
+    __slots__ = ("suit", "type", "index", "bit", "rank_bit", "suit_bit")
+
+    def __init__(self, suit: Suit, card_type: CardType, index: int):
+        """
+        Constructor.  Faces are created once at import, use get_card_face() to look them up.
+
+        :param suit: Suit enumeration of the face.
+        :param card_type: CardType enumeration of the face.
+        :param index: Integer index of the face.
+        """
+        standard = index < CARDS_IN_DECK
+        self.suit = suit
+        self.type = card_type
+        self.index = index
+        self.bit = 1 << index if standard else 0
+        self.rank_bit = 1 << (card_type.value - CardType.TWO.value) if standard else 0
+        self.suit_bit = 1 << (suit.value - Suit.SPADES.value) if standard else 0
+
+    def __repr__(self):
+        """
+        Gets the string representation of the face (ex: 'Jack of Hearts').
+
+        :return: String representation of the face.
+        """
+        return str(self.type.name).capitalize() + " of " + str(self.suit.name).capitalize()
+
+    def __hash__(self):
+        """
+        Hashes the face by its index.
+
+        :return: Integer index of the face.
+        """
+        return self.index
+
+
+def _build_card_faces():
+    """
+    Creates one CardFace for every suit and card type combination.  Standard cards are created first so their
+    indices run 0-51, followed by the hidden card at index 52.
+
+    :return: List of CardFace objects indexed by their index.
+    """
+    standard = [(suit, card_type) for suit in list(Suit)[1:] for card_type in list(CardType)[2:]]
+    other = [(suit, card_type) for suit in Suit for card_type in CardType if (suit, card_type) not in standard]
+    return [CardFace(suit, card_type, index) for index, (suit, card_type) in enumerate(standard + other)]
+
+
+# Interned card faces, indexed by face index, and a lookup by (suit, card type) values.
+CARD_FACES = _build_card_faces()
+HIDDEN_CARD_FACE = CARD_FACES[CARDS_IN_DECK]
+_FACE_LOOKUP = {(face.suit.value, face.type.value): face for face in CARD_FACES}
+
+
+def get_card_face(suit: int, card_type: int) -> CardFace:
+    """
+    Gets the interned face of a suit and card type.
+
+    :param suit: Integer or Suit enumeration of the card suit.
+    :param card_type: Integer or CardType enumeration of the card type.
+    :return: Shared CardFace object.
+    """
+    face = _FACE_LOOKUP.get((suit, card_type))
+    if face is None:
+        face = _FACE_LOOKUP[(Suit(suit).value, CardType(card_type).value)]
+    return face
+
+
 class Card:
     """
-    Class for representing cards in the poker simulation.
+    Class for representing cards in the poker simulation.  A Card is a lightweight view of a shared CardFace that
+    holds the hidden state for whoever holds the card.
 
     """
+    __slots__ = ("face", "hidden")
 
     def __init__(self, suit: int, card_type: int):
         """
@@ -57,8 +139,57 @@ class Card:
         :param card_type: Integer to specify card type.
         """
         self.hidden = True
-        self.suit = Suit(suit)
-        self.type = CardType(card_type)
+        self.face = get_card_face(suit, card_type)
+
+    @classmethod
+    def from_face(cls, face: CardFace):
+        """
+        Creates a hidden card viewing an existing face.
+
+        :param face: CardFace object to view.
+        :return: Hidden Card object.
+        """
+        card = cls.__new__(cls)
+        card.hidden = True
+        card.face = face
+        return card
+
+    @classmethod
+    def from_index(cls, index: int):
+        """
+        Creates a hidden card from its 0-51 index.
+
+        :param index: Integer index of the card.
+        :return: Hidden Card object.
+        """
+        return cls.from_face(CARD_FACES[index])
+
+    @property
+    def suit(self) -> Suit:
+        """
+        Suit enumeration of the card's face, regardless of whether the card is hidden.
+
+        :return: Suit enumeration.
+        """
+        return self.face.suit
+
+    @property
+    def type(self) -> CardType:
+        """
+        CardType enumeration of the card's face, regardless of whether the card is hidden.
+
+        :return: CardType enumeration.
+        """
+        return self.face.type
+
+    @property
+    def index(self) -> int:
+        """
+        Index of the card's face, regardless of whether the card is hidden.  Standard cards are indexed 0-51.
+
+        :return: Integer index.
+        """
+        return self.face.index
 
     def __repr__(self):
         """
@@ -69,7 +200,7 @@ class Card:
         """
         if self.hidden:
             return "Hidden Card"
-        return str(self.type.name).capitalize() + " of " + str(self.suit.name).capitalize()
+        return repr(self.face)
 
     def __eq__(self, other):
         """
@@ -79,7 +210,17 @@ class Card:
         :param other: Card object to be compared.
         :return: Boolean True if the cards are equal, False otherwise.
         """
-        return (not self.hidden) and (self.get_suit() == other.get_suit()) and (self.get_type() == other.get_type())
+        if not isinstance(other, Card):
+            return NotImplemented
+        return (not self.hidden) and (not other.hidden) and (self.face is other.face)
+
+    def __hash__(self):
+        """
+        Hashes the card by its face index, so cards can be used in sets and as dictionary keys.
+
+        :return: Integer hash of the card.
+        """
+        return self.face.index
 
     def is_hidden(self):
         """
@@ -98,7 +239,7 @@ class Card:
         """
         if self.hidden:
             return Suit.HIDDEN
-        return self.suit
+        return self.face.suit
 
     def get_type(self):
         """
@@ -109,7 +250,7 @@ class Card:
         """
         if self.hidden:
             return CardType.HIDDEN
-        return self.type
+        return self.face.type
 
     def reveal_card(self):
         """
@@ -118,3 +259,11 @@ class Card:
         :return: None
         """
         self.hidden = False
+
+    def hide_card(self):
+        """
+        Hides the value of the card again, such as when it is returned to the deck.
+
+        :return: None
+        """
+        self.hidden = True
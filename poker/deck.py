@@ -11,7 +11,7 @@ from enum import Enum
 
 
 # Package imports.
-from .card import Card
+from .card import CARD_FACES, CARDS_IN_DECK, Card
 
 
 # Global constants.
@@ -22,14 +22,43 @@ RIVER_CARD_COUNT = 1
 
 def generate_deck():
     """
-    Generates an unshuffled 52 card standard deck.
+    Generates an unshuffled 52 card standard deck.  The cards are hidden views of the shared card faces.
 
     :return: List of 52 card objects.
     """
-    deck = []
-    for suit in range(1, 5):
-        deck += [Card(suit, card_type) for card_type in range(2, 15)]
-    return deck
+    return [Card.from_face(face) for face in CARD_FACES[:CARDS_IN_DECK]]
+
+
+def _random_below(rng, low: int, high: int) -> int:
+    """
+    Draws a random integer from an RNG of either supported kind.  Python RNGs scale a random float, which is several
+    times faster than randrange, and the bias from 53 bit floats is far below anything a simulation can measure.
+
+    :param rng: random.Random instance, the random module, or a numpy.random.Generator.
+    :param low: Integer lowest value.
+    :param high: Integer bound, one above the highest value.
+    :return: Integer in [low, high).
+    """
+    if hasattr(rng, "integers"):
+        return int(rng.integers(low, high))
+    return low + int(rng.random() * (high - low))
+
+
+def shuffled_decks(count: int, rng=None):
+    """
+    Generates many shuffled decks at once, for simulations that deal many hands together.  Each row is a uniformly
+    random permutation of the 0-51 card indices, shuffled in a single vectorized call.  Requires NumPy.
+
+    :param count: Integer number of decks.
+    :param rng: numpy.random.Generator, random.Random instance or integer seed.  Defaults to fresh entropy.
+    :return: (count, 52) int8 NumPy array of card indices.
+    """
+    import numpy as np
+
+    if hasattr(rng, "getrandbits"):
+        rng = np.random.default_rng(rng.getrandbits(128))
+    rng = np.random.default_rng(rng)
+    return rng.permuted(np.tile(np.arange(CARDS_IN_DECK, dtype=np.int8), (count, 1)), axis=1)
 
 
 class DealType(Enum):
@@ -45,34 +74,154 @@ class DealType(Enum):
 
 class Deck:
     """
-    Class to track all of the cards in the deck.
+    Class to track all of the cards in the deck.  The cards live in a fixed list for the life of the deck, and a deal
+    position marks the next card to deal, so dealing is O(1) and a reset reuses the same card objects.  The position
+    of every card in the list is tracked, so known cards can be taken out of the deck without searching for them.
 
     """
 
-    def __init__(self):
+    def __init__(self, rng=None, lazy_shuffle: bool = False):
         """
         Constructor.
 
+        :param rng: Source of randomness for shuffles: a random.Random instance, a numpy.random.Generator or an
+                    integer seed for a new random.Random.  Defaults to the global random module.
+        :param lazy_shuffle: True to pick each dealt card at random from the undealt cards instead of shuffling the
+                             whole deck on reset.  The deal is just as random, but a hand only pays for the cards it
+                             deals.
         """
+        if rng is None:
+            rng = random
+        elif isinstance(rng, int):
+            rng = random.Random(rng)
+        self.rng = rng
+        self.lazy_shuffle = lazy_shuffle
         self.cards = generate_deck()
+        self._cards_by_index = list(self.cards)
+        self._positions = list(range(CARDS_IN_DECK))
+        self.position = 0
         self.burn_pile = []
         self.community_cards = []
 
     def shuffle(self):
         """
-        Randomly reorders the cards in the deck.
+        Randomly reorders the cards in the deck that have not been dealt, in place with a Fisher-Yates shuffle.
 
         :return: None
         """
-        random.shuffle(self.cards)
+        for index in range(len(self.cards) - 1, self.position, -1):
+            self._swap(index, _random_below(self.rng, self.position, index + 1))
+
+    def _swap(self, first: int, second: int):
+        """
+        Swaps the cards at two positions of the deck, keeping track of where each card is.
+
+        :param first: Integer position in the deck.
+        :param second: Integer position in the deck.
+        :return: None
+        """
+        cards = self.cards
+        cards[first], cards[second] = cards[second], cards[first]
+        self._positions[cards[first].face.index] = first
+        self._positions[cards[second].face.index] = second
+
+    def reset(self, shuffle: bool = True):
+        """
+        Returns every dealt, burned and community card to the deck, hides them again and optionally shuffles, ready
+        for the next hand.  Pockets given to players are returned too, so players should clear them.  No card objects
+        are created.
+
+        :param shuffle: True to shuffle the full deck after returning the cards.  Lazily shuffled decks skip it.
+        :return: None
+        """
+        # Only dealt cards can have been revealed.
+        cards = self.cards
+        for position in range(self.position):
+            cards[position].hide_card()
+        self.position = 0
+        self.burn_pile.clear()
+        self.community_cards.clear()
+        if shuffle and not self.lazy_shuffle:
+            self.shuffle()
+
+    def arrange(self, order):
+        """
+        Puts the deck in a given order, such as a row of shuffled_decks, and returns every card as reset() does.
+
+        :param order: Sequence of the 52 card indices, first to be dealt first.
+        :return: None
+        """
+        if sorted(int(index) for index in order) != list(range(CARDS_IN_DECK)):
+            raise ValueError("Deck: order must hold every card index exactly once.")
+        self.reset(shuffle=False)
+        for position, index in enumerate(order):
+            self.cards[position] = self._cards_by_index[index]
+            self._positions[index] = position
+
+    def remove_cards(self, dead=0):
+        """
+        Takes known cards out of the deck, such as hero's pocket and the board in an equity calculation, so they are
+        never dealt.  Each card is swapped to the dealt part of the deck, so the cost grows with the number of dead
+        cards, not the size of the deck.  Cards already dealt are ignored.
+
+        :param dead: Integer 52 bit mask of card indices, or an iterable of Card objects or card indices.
+        :return: None
+        """
+        if isinstance(dead, int):
+            indices = []
+            while dead:
+                lowest = dead & -dead
+                indices.append(lowest.bit_length() - 1)
+                dead ^= lowest
+        else:
+            indices = [card.face.index if isinstance(card, Card) else int(card) for card in dead]
+        if any(not 0 <= index < CARDS_IN_DECK for index in indices):
+            raise ValueError("Deck: dead cards must be card indices from 0 to " + str(CARDS_IN_DECK - 1) + ".")
+
+        for index in indices:
+            card_position = self._positions[index]
+            if card_position >= self.position:
+                self._swap(self.position, card_position)
+                self.position += 1
+
+    def draw_cards(self, count: int) -> list[Card]:
+        """
+        Deals count random cards from the undealt part of the deck with a partial Fisher-Yates shuffle: only the
+        positions being dealt are shuffled, so the cost is O(count) and the deck does not need shuffling first.
+
+        :param count: Integer number of cards to deal.
+        :return: List of card objects.
+        """
+        if count > self.cards_remaining():
+            raise IndexError("Deck: not enough cards left to deal " + str(count) + ".")
+        end = len(self.cards)
+        for position in range(self.position, self.position + count):
+            self._swap(position, _random_below(self.rng, position, end))
+        drawn = self.cards[self.position:self.position + count]
+        self.position += count
+        return drawn
+
+    def cards_remaining(self) -> int:
+        """
+        Gets the number of cards left to deal.
+
+        :return: Integer number of cards.
+        """
+        return len(self.cards) - self.position
 
     def deal_card(self) -> Card:
         """
-        Removes the next card from the deck and returns it.
+        Deals the next card from the deck and returns it.
 
         :return: Card object from the deck
         """
-        return self.cards.pop(0)
+        if self.position >= len(self.cards):
+            raise IndexError("Deck: no cards left to deal.")
+        if self.lazy_shuffle:
+            self._swap(self.position, _random_below(self.rng, self.position, len(self.cards)))
+        card = self.cards[self.position]
+        self.position += 1
+        return card
 
     def burn_card(self):
         """
@@ -82,35 +231,39 @@ class Deck:
         """
         self.burn_pile.append(self.deal_card())
 
+    def _deal_community_cards(self, count: int):
+        """
+        Burns a card, then deals and reveals community cards.
+
+        :param count: Integer number of community cards to deal.
+        :return: None
+        """
+        self.burn_card()
+        for _ in range(count):
+            card = self.deal_card()
+            card.reveal_card()
+            self.community_cards.append(card)
+
     def deal_flop(self):
         """
         Deals the flop. Automatically burns a card before the flop is dealt.
 
         :return: None
         """
-        self.burn_card()
-        for card in range(FLOP_CARD_COUNT):
-            self.community_cards.append(self.deal_card())
-            self.community_cards[card].reveal_card()
+        self._deal_community_cards(FLOP_CARD_COUNT)
 
     def deal_turn(self):
         """
-        Deals the turn. Automatically burns a card before the flop is dealt.
+        Deals the turn. Automatically burns a card before the turn is dealt.
 
         :return: None
         """
-        self.burn_card()
-        for card in range(TURN_CARD_COUNT):
-            self.community_cards.append(self.deal_card())
-            self.community_cards[card].reveal_card()
+        self._deal_community_cards(TURN_CARD_COUNT)
 
     def deal_river(self):
         """
-        Deals the turn. Automatically burns a card before the flop is dealt.
+        Deals the river. Automatically burns a card before the river is dealt.
 
         :return: None
         """
-        self.burn_card()
-        for card in range(TURN_CARD_COUNT):
-            self.community_cards.append(self.deal_card())
-            self.community_cards[card].reveal_card()
+        self._deal_community_cards(RIVER_CARD_COUNT)
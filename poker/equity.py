@@ -0,0 +1,575 @@
+###############################################################################
+#
+# Equity - Functions to estimate how often a hand wins against other hands.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import math
+import time
+from itertools import chain, combinations
+from statistics import NormalDist, stdev
+
+import numpy as np
+
+# Package imports.
+from .batch_evaluator import CARD_BIT_ARRAY, CARD_RANK_KEY_ARRAY, evaluate_states
+from .card import CARDS_IN_DECK, RANKS_PER_SUIT, Card
+from .evaluator import CARD_BITS, CARD_RANK_KEYS
+from .hand_range import HandRange
+from .isomorphism import SUITS_IN_DECK
+
+
+# Static global variables.
+CARDS_IN_POCKET = 2
+CARDS_ON_BOARD = 5
+DEFAULT_TRIALS = 100000
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_HALF_WIDTH = 0.005
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_MAX_TRIALS = 1 << 24
+DEFAULT_BATCH_SIZE = 1 << 13
+MIN_BATCHES = 8
+MAX_REDRAW_PASSES = 1000
+
+
+class EquityResult:
+    """
+    Class to hold the outcome counts of hero's hand over a number of runouts.
+
+    """
+
+    def __init__(self, wins: int = 0, ties: int = 0, losses: int = 0, tie_share: float = 0.0):
+        """
+        Constructor.
+
+        :param wins: Integer number of runouts hero wins outright.
+        :param ties: Integer number of runouts hero ties for the best hand.
+        :param losses: Integer number of runouts hero loses.
+        :param tie_share: Float sum of hero's share of the pot over tied runouts (1/2 for a two way tie, etc.).
+        """
+        self.wins = wins
+        self.ties = ties
+        self.losses = losses
+        self.tie_share = tie_share
+
+    def __repr__(self):
+        return (f"EquityResult(win: {self.win:.4f}, tie: {self.tie:.4f}, loss: {self.loss:.4f}, "
+                f"equity: {self.equity:.4f}, trials: {self.trials})")
+
+    @property
+    def trials(self) -> int:
+        """
+        Total number of runouts counted.
+
+        :return: Integer number of runouts.
+        """
+        return self.wins + self.ties + self.losses
+
+    @property
+    def win(self) -> float:
+        """
+        Fraction of runouts hero wins outright.
+
+        :return: Float between 0 and 1.
+        """
+        return self.wins / self.trials if self.trials else 0.0
+
+    @property
+    def tie(self) -> float:
+        """
+        Fraction of runouts hero ties for the best hand.
+
+        :return: Float between 0 and 1.
+        """
+        return self.ties / self.trials if self.trials else 0.0
+
+    @property
+    def loss(self) -> float:
+        """
+        Fraction of runouts hero loses.
+
+        :return: Float between 0 and 1.
+        """
+        return self.losses / self.trials if self.trials else 0.0
+
+    @property
+    def equity(self) -> float:
+        """
+        Hero's expected share of the pot, counting wins as 1 and ties as hero's share of the split.
+
+        :return: Float between 0 and 1.
+        """
+        return (self.wins + self.tie_share) / self.trials if self.trials else 0.0
+
+    def add(self, other):
+        """
+        Adds the counts of another result into this one.
+
+        :param other: EquityResult to merge.
+        :return: None.
+        """
+        self.wins += other.wins
+        self.ties += other.ties
+        self.losses += other.losses
+        self.tie_share += other.tie_share
+
+
+class AdaptiveEquityResult(EquityResult):
+    """
+    Class to hold the outcome counts of an adaptive estimate, with the precision it reached.
+
+    """
+
+    def __init__(self, wins: int = 0, ties: int = 0, losses: int = 0, tie_share: float = 0.0,
+                 standard_error: float = float("inf"), half_width: float = float("inf"), converged: bool = False):
+        """
+        Constructor.
+
+        :param wins: Integer number of runouts hero wins outright.
+        :param ties: Integer number of runouts hero ties for the best hand.
+        :param losses: Integer number of runouts hero loses.
+        :param tie_share: Float sum of hero's share of the pot over tied runouts.
+        :param standard_error: Float standard error of the equity, infinite until enough batches are sampled.
+        :param half_width: Float half-width of the confidence interval of the equity.
+        :param converged: True if sampling stopped because the target half-width was reached.
+        """
+        super().__init__(wins, ties, losses, tie_share)
+        self.standard_error = standard_error
+        self.half_width = half_width
+        self.converged = converged
+
+    def __repr__(self):
+        return (f"AdaptiveEquityResult(equity: {self.equity:.4f} +/- {self.half_width:.4f}, "
+                f"standard error: {self.standard_error:.4f}, trials: {self.trials}, converged: {self.converged})")
+
+
+def card_indices(cards) -> list[int]:
+    """
+    Converts cards to their 0-51 indices.  Integers are passed through, so callers may mix both forms.
+
+    :param cards: Iterable of Card objects or integer card indices.
+    :return: List of integer card indices.
+    """
+    return [card.face.index if isinstance(card, Card) else int(card) for card in cards]
+
+
+def _check_cards(hero: list[int], villains: list, board: list[int], dead: list[int]) -> list[int]:
+    """
+    Checks that the known cards form a valid spot.
+
+    :param hero: List of hero's card indices.
+    :param villains: List of each villain's card indices or HandRange.  Ranges hold no known cards.
+    :param board: List of board card indices.
+    :param dead: List of dead card indices.
+    :return: List of every known card index.
+    """
+    fixed_villains = [villain for villain in villains if not isinstance(villain, HandRange)]
+    if len(hero) != CARDS_IN_POCKET or any(len(villain) != CARDS_IN_POCKET for villain in fixed_villains):
+        raise ValueError("equity: every pocket must hold exactly " + str(CARDS_IN_POCKET) + " cards.")
+    if not villains:
+        raise ValueError("equity: at least one villain is required.")
+    if len(board) > CARDS_ON_BOARD:
+        raise ValueError("equity: the board cannot hold more than " + str(CARDS_ON_BOARD) + " cards.")
+
+    known = hero + [index for villain in fixed_villains for index in villain] + board + dead
+    if any(index < 0 or index >= CARDS_IN_DECK for index in known) or len(set(known)) != len(known):
+        raise ValueError("equity: known cards must be distinct cards of a standard deck.")
+    return known
+
+
+def sample_runouts(rng: np.random.Generator, live: np.ndarray, count: int, draw: int,
+                   first: np.ndarray = None) -> np.ndarray:
+    """
+    Draws count independent runouts of draw cards from the live cards, with a vectorized partial Fisher-Yates
+    shuffle: only the first draw positions of each row are shuffled.  Rows are stored flat as int8 so each swap is
+    a single gather and scatter.
+
+    :param rng: NumPy random generator.
+    :param live: (n,) int8 array of card indices that may be dealt.
+    :param count: Integer number of runouts.
+    :param draw: Integer number of cards in each runout.
+    :param first: Optional (count,) array of positions in live of each runout's first card.  Defaults to random.
+    :return: (count, draw) int8 array of card indices.
+    """
+    decks = np.tile(live, count)
+    row_starts = np.arange(count) * live.size
+    for position in range(draw):
+        if position == 0 and first is not None:
+            swap = row_starts + first
+        else:
+            swap = row_starts + rng.integers(position, live.size, size=count)
+        current = row_starts + position
+        picked = decks[swap]
+        decks[swap] = decks[current]
+        decks[current] = picked
+    return decks.reshape(count, live.size)[:, :draw]
+
+
+def _pocket_sums(pocket):
+    """
+    Sums the rank keys and card bits of a pocket.
+
+    :param pocket: List of card indices, or an (N, 2) array holding a pocket per runout.
+    :return: Tuple of (rank key, card mask), as uint64 scalars or (N,) uint64 arrays.
+    """
+    if isinstance(pocket, np.ndarray):
+        return (CARD_RANK_KEY_ARRAY[pocket].sum(axis=1, dtype=np.uint64),
+                CARD_BIT_ARRAY[pocket].sum(axis=1, dtype=np.uint64))
+    return (np.uint64(sum(CARD_RANK_KEYS[index] for index in pocket)),
+            np.uint64(sum(CARD_BITS[index] for index in pocket)))
+
+
+def score_runouts(hero: list[int], villains: list, board: list[int], runouts: np.ndarray,
+                  weights: np.ndarray = None) -> EquityResult:
+    """
+    Evaluates every player over a set of runouts and counts hero's outcomes.  The board and runout are summed once
+    per runout and shared by every player.
+
+    :param hero: List of hero's card indices.
+    :param villains: List of each villain's card indices, or of (N, 2) arrays holding the villain's pocket per runout.
+    :param board: List of board card indices.
+    :param runouts: (N, k) array of the card indices completing the board.
+    :param weights: Optional (N,) integer array of how many runouts each row stands for.  Defaults to one each.
+    :return: EquityResult of the runouts.
+    """
+    board_key, board_mask = _pocket_sums(board)
+    board_keys = CARD_RANK_KEY_ARRAY[runouts].sum(axis=1, dtype=np.uint64) + board_key
+    board_masks = CARD_BIT_ARRAY[runouts].sum(axis=1, dtype=np.uint64) + board_mask
+
+    def pocket_values(pocket) -> np.ndarray:
+        pocket_key, pocket_mask = _pocket_sums(pocket)
+        return evaluate_states(board_keys + pocket_key, board_masks + pocket_mask)
+
+    hero_values = pocket_values(hero)
+    villain_values = np.stack([pocket_values(villain) for villain in villains])
+    best_villain = villain_values.max(axis=0)
+
+    if weights is None:
+        weights = np.ones(hero_values.size, dtype=np.int64)
+
+    tied = hero_values == best_villain
+    tied_players = 1 + (villain_values == hero_values).sum(axis=0)
+    return EquityResult(wins=int(weights[hero_values > best_villain].sum()),
+                        ties=int(weights[tied].sum()),
+                        losses=int(weights[hero_values < best_villain].sum()),
+                        tie_share=float((weights[tied] / tied_players[tied]).sum()))
+
+
+def _sample_range_pockets(rng: np.random.Generator, live: np.ndarray, count: int, draw: int, villains: list):
+    """
+    Draws runouts together with a combo for every villain given as a HandRange.  Combos are drawn by weight, and
+    rows where two drawn combos share a card, or the runout holds a card of a drawn combo, are drawn again until
+    every row is a valid deal.  Ranges that can only rarely be dealt together raise ValueError after
+    MAX_REDRAW_PASSES passes rather than sampling forever.
+
+    :param rng: NumPy random generator.
+    :param live: (n,) int8 array of card indices not held by hero, a known villain pocket, the board or dead cards.
+    :param count: Integer number of runouts.
+    :param draw: Integer number of cards in each runout.
+    :param villains: List of each villain's card indices, or HandRange without combos blocked by the known cards.
+    :return: Tuple of the (count, draw) runouts and the villains, each HandRange replaced by a (count, 2) array.
+    """
+    ranges = [villain for villain in villains if isinstance(villain, HandRange)]
+    positions = [villain_range.sample_indices(rng, count) for villain_range in ranges]
+    runouts = sample_runouts(rng, live, count, draw)
+
+    rows = np.arange(count)
+    for _ in range(MAX_REDRAW_PASSES):
+        if not rows.size:
+            break
+        # Redraw everything in the rows that collided on the last pass.
+        used = CARD_BIT_ARRAY[runouts[rows]].sum(axis=1, dtype=np.uint64)
+        collided = np.zeros(rows.size, dtype=bool)
+        for villain_range, position in zip(ranges, positions):
+            masks = villain_range.masks[position[rows]]
+            collided |= (used & masks) != 0
+            used |= masks
+        rows = rows[collided]
+        for villain_range, position in zip(ranges, positions):
+            position[rows] = villain_range.sample_indices(rng, rows.size)
+        runouts[rows] = sample_runouts(rng, live, rows.size, draw)
+    else:
+        if rows.size:
+            raise ValueError("equity: villain ranges were still colliding after " + str(MAX_REDRAW_PASSES)
+                             + " redraws.")
+
+    combos = iter([villain_range.combos[position] for villain_range, position in zip(ranges, positions)])
+    return runouts, [next(combos) if isinstance(villain, HandRange) else villain for villain in villains]
+
+
+def _ranges_dealable(ranges: list[HandRange]) -> bool:
+    """
+    Checks that the ranges have weighted combos that can all be dealt at once, without sharing a card.  Searches the
+    combos depth first, smallest range first, remembering the dealt cards of searches that failed.
+
+    :param ranges: List of HandRange, without combos blocked by the known cards.
+    :return: True if some combination of weighted combos, one per range, shares no card.
+    """
+    combo_masks = sorted(({int(mask) for mask in villain_range.masks[villain_range.weights > 0]}
+                          for villain_range in ranges), key=len)
+    failed = set()
+
+    def deal(depth: int, used: int) -> bool:
+        if depth == len(combo_masks):
+            return True
+        if (depth, used) in failed:
+            return False
+        for mask in combo_masks[depth]:
+            if not mask & used and deal(depth + 1, used | mask):
+                return True
+        failed.add((depth, used))
+        return False
+
+    return deal(0, 0)
+
+
+def _prepare_spot(hero, villains, board, dead) -> tuple:
+    """
+    Converts and checks the cards of a spot for sampling.  Villain ranges lose the combos blocked by the known cards.
+
+    :param hero: Hero's two pocket cards, as Card objects or card indices.
+    :param villains: List of each villain's two pocket cards or HandRange.
+    :param board: Community cards already dealt.
+    :param dead: Cards known to be out of the deck.
+    :return: Tuple of (hero, villains, board, live) with cards as indices and live an int8 array of undealt cards.
+    """
+    hero = card_indices(hero)
+    villains = [villain if isinstance(villain, HandRange) else card_indices(villain) for villain in villains]
+    board = card_indices(board)
+    dead = card_indices(dead)
+    known = set(_check_cards(hero, villains, board, dead))
+
+    live = np.array([index for index in range(CARDS_IN_DECK) if index not in known], dtype=np.int8)
+    villains = [villain.remove_blocked(known) if isinstance(villain, HandRange) else villain for villain in villains]
+    if any(isinstance(villain, HandRange) and not villain.weights.sum() > 0 for villain in villains):
+        raise ValueError("equity: every villain range needs a weighted combo the known cards do not block.")
+    if not _ranges_dealable([villain for villain in villains if isinstance(villain, HandRange)]):
+        raise ValueError("equity: the villain ranges cannot all be dealt without sharing a card.")
+    return hero, villains, board, live
+
+
+def monte_carlo_equity(hero, villains, board=(), dead=(), trials: int = DEFAULT_TRIALS, seed=None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> EquityResult:
+    """
+    Estimates hero's equity against one or more villains by sampling random runouts of the board.  A villain may be
+    a known pocket or a HandRange; a range loses the combos blocked by the known cards, then a combo is drawn by
+    weight for every trial.  Sampling and evaluation work on integer card indices in vectorized chunks.
+
+    :param hero: Hero's two pocket cards, as Card objects or card indices.
+    :param villains: List of each villain's two pocket cards or HandRange.
+    :param board: Community cards already dealt, zero to five cards.
+    :param dead: Cards known to be out of the deck, such as folded or burned cards.
+    :param trials: Integer number of runouts to sample.
+    :param seed: Seed or numpy.random.Generator for reproducible sampling.
+    :param chunk_size: Maximum number of runouts sampled and evaluated per vectorized step.
+    :return: EquityResult of hero's outcomes.
+    """
+    hero, villains, board, live = _prepare_spot(hero, villains, board, dead)
+    rng = np.random.default_rng(seed)
+    draw = CARDS_ON_BOARD - len(board)
+    ranged = any(isinstance(villain, HandRange) for villain in villains)
+
+    result = EquityResult()
+    for start in range(0, trials, chunk_size):
+        count = min(chunk_size, trials - start)
+        if ranged:
+            runouts, pockets = _sample_range_pockets(rng, live, count, draw, villains)
+        else:
+            runouts, pockets = sample_runouts(rng, live, count, draw), villains
+        result.add(score_runouts(hero, pockets, board, runouts))
+    return result
+
+
+def _sample_batch(rng: np.random.Generator, live: np.ndarray, count: int, draw: int, stratified: bool) -> np.ndarray:
+    """
+    Draws a batch of runouts for adaptive_equity.  Stratified batches deal every live card as the first card equally
+    often, so count must be a multiple of the number of live cards.
+
+    :param rng: NumPy random generator.
+    :param live: (n,) int8 array of card indices that may be dealt.
+    :param count: Integer number of runouts.
+    :param draw: Integer number of cards in each runout.
+    :param stratified: True to stratify the first card of the runouts.
+    :return: (count, draw) int8 array of card indices.
+    """
+    first = None
+    if stratified and draw:
+        first = np.tile(np.arange(live.size), count // live.size)
+    return sample_runouts(rng, live, count, draw, first)
+
+
+def adaptive_equity(hero, villains, board=(), dead=(), half_width: float = DEFAULT_HALF_WIDTH,
+                    confidence: float = DEFAULT_CONFIDENCE, time_budget: float = None,
+                    max_trials: int = DEFAULT_MAX_TRIALS, seed=None, batch_size: int = DEFAULT_BATCH_SIZE,
+                    stratified: bool = False):
+    """
+    Estimates hero's equity like monte_carlo_equity, sampling batches of runouts until the confidence interval of
+    the equity is narrow enough, the time budget runs out or max_trials is reached.  The standard error is estimated
+    from the spread of the batch equities (batch means), so it stays valid with stratified sampling.
+
+    :param hero: Hero's two pocket cards, as Card objects or card indices.
+    :param villains: List of each villain's two pocket cards or HandRange.
+    :param board: Community cards already dealt, zero to five cards.
+    :param dead: Cards known to be out of the deck, such as folded or burned cards.
+    :param half_width: Float target half-width of the confidence interval of the equity.
+    :param confidence: Float confidence level of the interval, such as 0.95.
+    :param time_budget: Optional float number of seconds after which sampling stops.
+    :param max_trials: Integer maximum number of runouts to sample.
+    :param seed: Seed or numpy.random.Generator for reproducible sampling.
+    :param batch_size: Integer number of runouts per batch.  Rounded up to a multiple of the live cards when stratified.
+    :param stratified: True to deal every live card as the first runout card equally often in each batch.
+    :return: AdaptiveEquityResult of hero's outcomes with the standard error of the equity.
+    """
+    start_time = time.perf_counter()
+    hero, villains, board, live = _prepare_spot(hero, villains, board, dead)
+    if stratified and any(isinstance(villain, HandRange) for villain in villains):
+        raise ValueError("equity: stratified sampling needs every villain pocket to be known.")
+    if not 0 < confidence < 1:
+        raise ValueError("equity: confidence must be between 0 and 1.")
+
+    rng = np.random.default_rng(seed)
+    draw = CARDS_ON_BOARD - len(board)
+    multiple = live.size if stratified else 1
+    batch_size = -(-batch_size // multiple) * multiple
+    z_score = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    result = AdaptiveEquityResult()
+    batch_equities = []
+    while result.trials + batch_size <= max(max_trials, batch_size):
+        if any(isinstance(villain, HandRange) for villain in villains):
+            runouts, pockets = _sample_range_pockets(rng, live, batch_size, draw, villains)
+        else:
+            runouts, pockets = _sample_batch(rng, live, batch_size, draw, stratified), villains
+        batch = score_runouts(hero, pockets, board, runouts)
+        result.add(batch)
+        batch_equities.append(batch.equity)
+
+        if len(batch_equities) >= MIN_BATCHES:
+            result.standard_error = stdev(batch_equities) / math.sqrt(len(batch_equities))
+            result.half_width = z_score * result.standard_error
+            if result.half_width <= half_width:
+                result.converged = True
+                break
+        if time_budget is not None and time.perf_counter() - start_time >= time_budget:
+            break
+    return result
+
+
+def _suit_class_runouts(suits: list[int], ranks: list[int], count: int):
+    """
+    Enumerates one representative per class of runouts that deal count cards into a group of interchangeable suits.
+    Each suit's cards are a subset of the live ranks, and relabelling the suits only reorders those subsets, so the
+    representatives are the subsets taken in non-increasing order, weighted by their number of distinct orderings.
+
+    :param suits: List of the interchangeable suits, numbered from 0 in card index order.
+    :param ranks: List of the live ranks, numbered from 0, shared by every suit of the group.
+    :param count: Integer number of cards to deal into the group.
+    :return: Tuple of an (N, count) int8 array of representative card indices and an (N,) int64 array of weights.
+    """
+    # Subsets are ordered by size, then by their ranks, so a representative lists them largest first.
+    subsets = [subset for size in range(count + 1) for subset in combinations(ranks, size)]
+    runouts = []
+    weights = []
+
+    def deal(position: int, last: int, remaining: int, cards: list[int], weight: int, run: int):
+        if position == len(suits):
+            if not remaining:
+                runouts.append(cards)
+                weights.append(weight)
+            return
+        suit_offset = suits[position] * RANKS_PER_SUIT
+        for index in range(last, -1, -1):
+            subset = subsets[index]
+            if len(subset) > remaining:
+                continue
+            # A subset equal to the previous suit's adds a repeat, dividing the number of distinct orderings.
+            repeat = run + 1 if position and index == last else 1
+            deal(position + 1, index, remaining - len(subset), cards + [suit_offset + rank for rank in subset],
+                 weight * (position + 1) // repeat, repeat)
+
+    deal(0, len(subsets) - 1, count, [], 1, 0)
+    return np.array(runouts, dtype=np.int8).reshape(len(runouts), count), np.array(weights, dtype=np.int64)
+
+
+def _canonical_runouts(known_groups: list[list[int]], live: list[int], draw: int):
+    """
+    Enumerates one representative per class of runouts that are equivalent under a suit relabelling that leaves every
+    known group of cards unchanged.  Each representative is weighted by the size of its class, so the weighted runouts
+    count every runout exactly once.  Such a relabelling can only swap suits that hold the same ranks of every group,
+    so the suits split into groups of interchangeable suits.  The representatives of each group are enumerated
+    directly and combined across groups, and without interchangeable suits every runout is its own class.
+
+    :param known_groups: List of the known card groups (hero, each villain, board, dead) as card index lists.
+    :param live: List of card indices that may be dealt.
+    :param draw: Integer number of cards in each runout.
+    :return: Tuple of an (N, draw) int8 array of representative runouts and an (N,) int64 array of weights.
+    """
+    suit_groups = {}
+    for suit in range(SUITS_IN_DECK):
+        profile = tuple(frozenset(index % RANKS_PER_SUIT for index in group if index // RANKS_PER_SUIT == suit)
+                        for group in known_groups)
+        suit_groups.setdefault(profile, []).append(suit)
+    suit_groups = list(suit_groups.values())
+
+    if all(len(suits) == 1 for suits in suit_groups):
+        runouts = np.fromiter(chain.from_iterable(combinations(live, draw)), dtype=np.int8).reshape(-1, draw)
+        return runouts, np.ones(len(runouts), dtype=np.int64)
+
+    # Interchangeable suits hold the same known ranks, so they also share their live ranks.
+    live_set = set(live)
+    group_ranks = [[rank for rank in range(RANKS_PER_SUIT) if suits[0] * RANKS_PER_SUIT + rank in live_set]
+                   for suits in suit_groups]
+
+    def combine(group: int, remaining: int):
+        if group == len(suit_groups):
+            return np.empty((1, 0), dtype=np.int8), np.ones(1, dtype=np.int64)
+        if group == len(suit_groups) - 1:
+            return _suit_class_runouts(suit_groups[group], group_ranks[group], remaining)
+
+        runout_parts = []
+        weight_parts = []
+        for count in range(remaining + 1):
+            head_runouts, head_weights = _suit_class_runouts(suit_groups[group], group_ranks[group], count)
+            tail_runouts, tail_weights = combine(group + 1, remaining - count)
+            if not len(head_runouts) or not len(tail_runouts):
+                continue
+            # Every representative of this group pairs with every representative of the remaining groups.
+            runout_parts.append(np.concatenate([np.repeat(head_runouts, len(tail_runouts), axis=0),
+                                                np.tile(tail_runouts, (len(head_runouts), 1))], axis=1))
+            weight_parts.append(np.outer(head_weights, tail_weights).reshape(-1))
+        if not runout_parts:
+            return np.empty((0, remaining), dtype=np.int8), np.empty(0, dtype=np.int64)
+        return np.concatenate(runout_parts), np.concatenate(weight_parts)
+
+    return combine(0, draw)
+
+
+def exact_equity(hero, villains, board=(), dead=(), chunk_size: int = DEFAULT_CHUNK_SIZE) -> EquityResult:
+    """
+    Computes hero's exact equity by enumerating every runout of the board.  Runouts that are the same up to a
+    relabelling of suits, given the known cards, are evaluated once and weighted, which shrinks the enumeration
+    whenever suits are interchangeable.  Intended for spots on the flop or turn, where the runouts are few.
+
+    :param hero: Hero's two pocket cards, as Card objects or card indices.
+    :param villains: List of each villain's two pocket cards.
+    :param board: Community cards already dealt, zero to five cards.
+    :param dead: Cards known to be out of the deck, such as folded or burned cards.
+    :param chunk_size: Maximum number of runouts evaluated per vectorized step.
+    :return: EquityResult with exact counts over every runout.
+    """
+    hero = card_indices(hero)
+    villains = [card_indices(villain) for villain in villains]
+    board = card_indices(board)
+    dead = card_indices(dead)
+    known = set(_check_cards(hero, villains, board, dead))
+
+    live = [index for index in range(CARDS_IN_DECK) if index not in known]
+    runouts, weights = _canonical_runouts([hero] + villains + [board, dead], live, CARDS_ON_BOARD - len(board))
+
+    result = EquityResult()
+    for start in range(0, len(runouts), chunk_size):
+        result.add(score_runouts(hero, villains, board, runouts[start:start + chunk_size],
+                                 weights[start:start + chunk_size]))
+    return result
@@ -0,0 +1,394 @@
+###############################################################################
+#
+# Evaluator - Lookup tables to score a set of cards with a single integer.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+
+# Package imports.
+from .card import CARD_FACES, CARDS_IN_DECK, RANKS_PER_SUIT, CardType
+
+
+# Static global variables.
+MAX_LOOKUP_CARDS = 7
+CARDS_IN_BEST_HAND = 5
+SUIT_MASK = (1 << RANKS_PER_SUIT) - 1
+LOWEST_TYPE = CardType.TWO.value
+
+# Layout of an evaluated hand value.  The hand category lives in the high bits and the card types of the five best
+# cards are packed below it, four bits each, from most to least significant.  Comparing two values as integers
+# therefore compares the hands, including kickers.
+CATEGORY_SHIFT = 20
+KICKER_BITS = 4
+KICKER_MASK = (1 << KICKER_BITS) - 1
+
+# Hand categories.  These values mirror the hand.HandType enumeration.
+HIGH_CARD = 1
+PAIR = 2
+TWO_PAIR = 3
+TRIPS = 4
+STRAIGHT = 5
+FLUSH = 6
+FULL_HOUSE = 7
+QUADS = 8
+STRAIGHT_FLUSH = 9
+ROYAL_FLUSH = 10
+
+# Each rank gets three bits in the rank key, enough to count up to four cards of that rank.
+RANK_KEY_BITS = 3
+
+# Table file layout: a 64 byte header, then the sorted rank keys (uint64), the rank values (uint32) and the flush
+# values (uint32).  The header holds a magic string, the layout version, the two table lengths and a SHA-256 of the
+# rest of the file.  Bump TABLE_VERSION whenever the table contents or layout change.
+TABLE_MAGIC = b"PKREVAL\0"
+TABLE_VERSION = 1
+TABLE_PATH_ENVIRONMENT = "POKER_EVALUATOR_TABLES"
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "evaluator_tables.bin")
+_TABLE_HEADER = struct.Struct("<8sIII32s12x")
+
+
+def pack_value(category: int, card_types: list[int]) -> int:
+    """
+    Packs a hand category and up to five card type values into a single integer.  Missing card types are packed as
+    zero, matching CardType.HIDDEN.
+
+    :param category: Integer hand category.
+    :param card_types: List of card type values of the best hand, ordered as they should be compared.
+    :return: Integer hand value.
+    """
+    value = category
+    for i in range(CARDS_IN_BEST_HAND):
+        value = (value << KICKER_BITS) | (card_types[i] if i < len(card_types) else 0)
+    return value
+
+
+def _find_straight_top(rank_mask: int) -> int:
+    """
+    Finds the highest straight in a 13 bit rank mask.
+
+    :param rank_mask: Integer with bit r set if rank r is present.
+    :return: Integer CardType value of the highest card in the straight, or 0 if there is no straight.
+    """
+    for top in range(RANKS_PER_SUIT - 1, CARDS_IN_BEST_HAND - 2, -1):
+        window = ((1 << CARDS_IN_BEST_HAND) - 1) << (top - CARDS_IN_BEST_HAND + 1)
+        if rank_mask & window == window:
+            return top + LOWEST_TYPE
+
+    # Check for the wheel, where the ace plays low.
+    wheel = (1 << (RANKS_PER_SUIT - 1)) | ((1 << (CARDS_IN_BEST_HAND - 1)) - 1)
+    if rank_mask & wheel == wheel:
+        return CardType.FIVE.value
+
+    return 0
+
+
+def _straight_types(top: int) -> list[int]:
+    """
+    Gets the card type values of a straight, highest to lowest.  A five high straight ends with a low ace.
+
+    :param top: Integer CardType value of the highest card in the straight.
+    :return: List of five card type values.
+    """
+    return list(range(top, top - CARDS_IN_BEST_HAND, -1))
+
+
+def _flush_value(rank_mask: int) -> int:
+    """
+    Evaluates the cards of a single suit.
+
+    :param rank_mask: Integer with bit r set if the suit holds rank r.
+    :return: Integer hand value of the straight flush or flush, or 0 if there are fewer than five cards.
+    """
+    if bin(rank_mask).count("1") < CARDS_IN_BEST_HAND:
+        return 0
+
+    top = _find_straight_top(rank_mask)
+    if top == CardType.ACE.value:
+        return pack_value(ROYAL_FLUSH, _straight_types(top))
+    if top:
+        return pack_value(STRAIGHT_FLUSH, _straight_types(top))
+
+    card_types = [rank + LOWEST_TYPE for rank in range(RANKS_PER_SUIT - 1, -1, -1) if rank_mask & (1 << rank)]
+    return pack_value(FLUSH, card_types[:CARDS_IN_BEST_HAND])
+
+
+def _rank_value(counts: list[int]) -> int:
+    """
+    Evaluates a multiset of ranks, ignoring suits.  Hand types are checked in the same order as Hand.evaluate_hand.
+
+    :param counts: List of 13 integers, the number of cards held of each rank.
+    :return: Integer hand value.
+    """
+    # Card type values of every card, high to low, and (count, card type) groups ordered by count then type.
+    types = []
+    groups = []
+    rank_mask = 0
+    for rank in range(RANKS_PER_SUIT - 1, -1, -1):
+        count = counts[rank]
+        if count:
+            types += [rank + LOWEST_TYPE] * count
+            groups.append((count, rank + LOWEST_TYPE))
+            rank_mask |= 1 << rank
+    groups.sort(reverse=True)
+
+    def kickers(used: list[int], count: int) -> list[int]:
+        return [card_type for card_type in types if card_type not in used][:count]
+
+    if groups and groups[0][0] == 4:
+        quads = groups[0][1]
+        return pack_value(QUADS, [quads] * 4 + kickers([quads], 1))
+
+    if groups and groups[0][0] == 3 and len(groups) > 1 and groups[1][0] >= 2:
+        trips = groups[0][1]
+        pair = max(card_type for count, card_type in groups[1:] if count >= 2)
+        return pack_value(FULL_HOUSE, [trips] * 3 + [pair] * 2)
+
+    top = _find_straight_top(rank_mask)
+    if top:
+        return pack_value(STRAIGHT, _straight_types(top))
+
+    if groups and groups[0][0] == 3:
+        trips = groups[0][1]
+        return pack_value(TRIPS, [trips] * 3 + kickers([trips], 2))
+
+    pairs = [card_type for count, card_type in groups if count == 2]
+    if len(pairs) >= 2:
+        return pack_value(TWO_PAIR, [pairs[0]] * 2 + [pairs[1]] * 2 + kickers(pairs[:2], 1))
+    if pairs:
+        return pack_value(PAIR, [pairs[0]] * 2 + kickers(pairs[:1], 3))
+
+    return pack_value(HIGH_CARD, types[:CARDS_IN_BEST_HAND])
+
+
+def _fill_rank_table(table: dict[int, int], rank: int, remaining: int, key: int, counts: list[int]):
+    """
+    Adds every rank multiset of at most remaining more cards to the table, with at most four cards of each rank.
+    Ranks below rank have already been assigned in counts and key.
+
+    :param table: Dictionary of rank key to hand value, updated in place.
+    :param rank: Integer rank currently being assigned.
+    :param remaining: Integer number of cards that may still be assigned.
+    :param key: Integer rank key of the ranks assigned so far.
+    :param counts: List of 13 integers, updated in place.
+    :return: None.
+    """
+    if rank == RANKS_PER_SUIT or remaining == 0:
+        table[key] = _rank_value(counts)
+        return
+
+    for count in range(min(4, remaining) + 1):
+        counts[rank] = count
+        _fill_rank_table(table, rank + 1, remaining - count, key + (count << (RANK_KEY_BITS * rank)), counts)
+    counts[rank] = 0
+
+
+def _build_rank_table() -> dict[int, int]:
+    """
+    Builds the table mapping a rank key to the value of the best non-flush hand.
+
+    :return: Dictionary of rank key to hand value.
+    """
+    table = {}
+    _fill_rank_table(table, 0, MAX_LOOKUP_CARDS, 0, [0] * RANKS_PER_SUIT)
+    return table
+
+
+def _build_flush_table() -> list[int]:
+    """
+    Builds the table mapping a 13 bit single suit rank mask to the value of its flush or straight flush.
+
+    :return: List of hand values indexed by rank mask.
+    """
+    return [_flush_value(rank_mask) for rank_mask in range(1 << RANKS_PER_SUIT)]
+
+
+def _build_table_arrays():
+    """
+    Builds the lookup tables in the layout of the table file.
+
+    :return: Tuple of (sorted rank keys, rank values, flush values) arrays.
+    """
+    rank_table = _build_rank_table()
+    rank_keys = array("Q", sorted(rank_table))
+    rank_values = array("I", [rank_table[key] for key in rank_keys])
+    return rank_keys, rank_values, array("I", _build_flush_table())
+
+
+def get_table_path() -> str:
+    """
+    Gets the path of the table file, from the POKER_EVALUATOR_TABLES environment variable if it is set.
+
+    :return: String path of the table file.
+    """
+    return os.environ.get(TABLE_PATH_ENVIRONMENT, DEFAULT_TABLE_PATH)
+
+
+def write_tables(path: str = None) -> str:
+    """
+    Generates the lookup tables and writes them to the table file.  The file is written to a temporary name and
+    then moved into place, so processes reading the old file are never exposed to a partial write.
+
+    :param path: String path of the table file.  Defaults to get_table_path().
+    :return: String path the tables were written to.
+    """
+    path = path or get_table_path()
+    rank_keys, rank_values, flush_values = _build_table_arrays()
+    payload = rank_keys.tobytes() + rank_values.tobytes() + flush_values.tobytes()
+    header = _TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, len(rank_keys), len(flush_values),
+                                hashlib.sha256(payload).digest())
+
+    temp_path = path + "." + str(os.getpid()) + ".tmp"
+    try:
+        with open(temp_path, "wb") as table_file:
+            table_file.write(header + payload)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return path
+
+
+def _read_tables(path: str):
+    """
+    Memory maps the table file and checks its header and checksum.  The returned views share the mapped pages, so
+    forked processes that load the same file share one copy of the tables.
+
+    :param path: String path of the table file.
+    :return: Tuple of (sorted rank keys, rank values, flush values) memoryviews, or None if the file is missing,
+    from another version, or corrupt.
+    """
+    try:
+        with open(path, "rb") as table_file:
+            mapped = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) < _TABLE_HEADER.size:
+        return None
+    magic, version, rank_count, flush_count, checksum = _TABLE_HEADER.unpack_from(mapped)
+    rank_end = _TABLE_HEADER.size + 8 * rank_count
+    value_end = rank_end + 4 * rank_count
+    flush_end = value_end + 4 * flush_count
+    if magic != TABLE_MAGIC or version != TABLE_VERSION or len(mapped) != flush_end:
+        return None
+
+    view = memoryview(mapped)
+    if hashlib.sha256(view[_TABLE_HEADER.size:]).digest() != checksum:
+        return None
+
+    return (view[_TABLE_HEADER.size:rank_end].cast("Q"),
+            view[rank_end:value_end].cast("I"),
+            view[value_end:flush_end].cast("I"))
+
+
+def load_tables(path: str = None, write: bool = False):
+    """
+    Loads the lookup tables from the table file.  If the file is missing or stale the tables are generated in memory,
+    and only written to the file when asked, since the package directory may be read only.
+
+    :param path: String path of the table file.  Defaults to get_table_path().
+    :param write: True to write generated tables to the file.  Generated tables are still used if the write fails.
+    :return: Tuple of (sorted rank keys, rank values, flush values) sequences.
+    """
+    path = path or get_table_path()
+    tables = _read_tables(path)
+    if tables is not None:
+        return tables
+
+    if write:
+        try:
+            tables = _read_tables(write_tables(path))
+        except OSError:
+            tables = None
+    return tables if tables is not None else _build_table_arrays()
+
+
+# Per card contributions, indexed by card index.
+CARD_RANK_KEYS = [1 << (RANK_KEY_BITS * (index % RANKS_PER_SUIT)) for index in range(CARDS_IN_DECK)]
+CARD_BITS = [face.bit for face in CARD_FACES[:CARDS_IN_DECK]]
+
+# The mapped views are shared between processes that load the same file.  The batch evaluator reads every table
+# from them, and the scalar path reads the flush table from them, which indexes as fast as a list.  Finding a rank
+# key in the sorted view takes a binary search several times slower than a dictionary lookup, so the scalar path
+# keeps a dictionary of the rank table, which each process builds and holds on its own.
+RANK_KEYS, RANK_VALUES, FLUSH_VALUES = load_tables()
+RANK_TABLE = dict(zip(RANK_KEYS, RANK_VALUES))
+FLUSH_TABLE = FLUSH_VALUES
+
+
+def evaluate_state(rank_key: int, card_mask: int) -> int:
+    """
+    Evaluates a set of cards from its rank key and card mask.  Both are plain sums over the cards, so callers can
+    maintain them incrementally.
+
+    :param rank_key: Sum of CARD_RANK_KEYS for every card in the set.
+    :param card_mask: Bitwise or of CARD_BITS for every card in the set.
+    :return: Integer hand value.  Higher values are stronger hands.
+    """
+    value = RANK_TABLE[rank_key]
+
+    # Only one suit can hold a flush in seven cards, but taking the maximum keeps this correct for any set.
+    flush_value = FLUSH_TABLE[card_mask & SUIT_MASK]
+    if flush_value > value:
+        value = flush_value
+    flush_value = FLUSH_TABLE[(card_mask >> RANKS_PER_SUIT) & SUIT_MASK]
+    if flush_value > value:
+        value = flush_value
+    flush_value = FLUSH_TABLE[(card_mask >> (2 * RANKS_PER_SUIT)) & SUIT_MASK]
+    if flush_value > value:
+        value = flush_value
+    flush_value = FLUSH_TABLE[card_mask >> (3 * RANKS_PER_SUIT)]
+    if flush_value > value:
+        value = flush_value
+    return value
+
+
+def evaluate(indices) -> int:
+    """
+    Evaluates up to seven cards given by their indices.
+
+    :param indices: Iterable of distinct integer card indices.
+    :return: Integer hand value.  Higher values are stronger hands.
+    """
+    rank_key = 0
+    card_mask = 0
+    for index in indices:
+        rank_key += CARD_RANK_KEYS[index]
+        card_mask |= CARD_BITS[index]
+    return evaluate_state(rank_key, card_mask)
+
+
+def get_category(value: int) -> int:
+    """
+    Gets the hand category of a hand value.
+
+    :param value: Integer hand value.
+    :return: Integer hand category, matching a hand.HandType value.
+    """
+    return value >> CATEGORY_SHIFT
+
+
+def main():
+    """
+    Command line entry point.  Regenerates the table file, for when it is missing, stale, or should be moved.
+
+    :return: None.
+    """
+    parser = argparse.ArgumentParser(description="Rebuild the poker hand evaluator lookup tables.")
+    parser.add_argument("path", nargs="?", default=None,
+                        help="Table file to write. Defaults to $" + TABLE_PATH_ENVIRONMENT + " or " + DEFAULT_TABLE_PATH)
+    arguments = parser.parse_args()
+    print("Wrote evaluator tables to", write_tables(arguments.path))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,13 @@
 #
 
 # Standard packages
-from collections import Counter
+from collections import Counter, OrderedDict
 from functools import partial
 
 # Package imports.
 from .card import *
+from .evaluator import CARD_RANK_KEYS, CARDS_IN_BEST_HAND, CATEGORY_SHIFT, KICKER_BITS, KICKER_MASK, \
+    MAX_LOOKUP_CARDS, SUIT_MASK, evaluate_state, pack_value
 
 # static global variables
 CARDS_IN_STRAIGHT = 5
@@ -21,6 +23,7 @@ CARDS_IN_QUADS = 4
 MAX_CARDS_IN_HAND = 5
 PAIRS_IN_TWO_PAIR = 2
 PAIRS_IN_ONE_PAIR = 1
+DEFAULT_CACHE_SIZE = 1 << 16
 
 
 class HandType(Enum):
@@ -41,6 +44,156 @@ class HandType(Enum):
     ROYAL_FLUSH = 10
 
 
+class HandRank(int):
+    """
+    Totally ordered strength of a hand.  The HandType value is packed in the high bits, followed by the card types of
+    the five best cards in the order they are compared, so a stronger hand always has a larger HandRank, including
+    kickers.  Being an int, a HandRank is hashable and players can be ranked with a plain max() or sort().
+
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        """
+        Gets the string representation of the hand rank (ex: 'HandRank(PAIR, KING, KING, ACE, TEN, FOUR)').
+
+        :return: String representation of the hand rank.
+        """
+        return "HandRank(" + ", ".join([self.hand_type.name] + [kicker.name for kicker in self.kickers]) + ")"
+
+    @classmethod
+    def from_cards(cls, hand_type: HandType, card_list: list[Card]):
+        """
+        Creates the hand rank of a hand type and the list of cards making up the best hand.
+
+        :param hand_type: HandType enumeration of the hand.
+        :param card_list: List of up to five card objects, ordered as they should be compared.
+        :return: HandRank of the hand.
+        """
+        card_types = [card.get_type().value for card in card_list]
+
+        # A five high straight lists its ace last, where it plays low.
+        if hand_type in (HandType.STRAIGHT, HandType.STRAIGHT_FLUSH) and card_types[-1] == CardType.ACE.value:
+            card_types[-1] = CardType.LOW_ACE.value
+
+        return cls(pack_value(hand_type.value, card_types))
+
+    @property
+    def hand_type(self) -> HandType:
+        """
+        Gets the hand type packed in the rank.
+
+        :return: HandType enumeration.
+        """
+        return HandType(self >> CATEGORY_SHIFT)
+
+    @property
+    def kickers(self) -> list[CardType]:
+        """
+        Gets the card types of the best hand packed in the rank, in comparison order.  Unused slots are omitted.
+
+        :return: List of up to five CardType enumerations.
+        """
+        kickers = []
+        for i in range(CARDS_IN_BEST_HAND - 1, -1, -1):
+            card_type = (self >> (KICKER_BITS * i)) & KICKER_MASK
+            if card_type:
+                kickers.append(CardType(card_type))
+        return kickers
+
+
+class EvaluationCache:
+    """
+    Bounded least recently used cache of hand ranks, keyed by the 52 bit mask of the revealed cards.
+
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Constructor.
+
+        :param maxsize: Maximum number of hand ranks kept before the least recently used one is evicted.
+        """
+        if maxsize < 1:
+            raise ValueError("EvaluationCache: maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._ranks = OrderedDict()
+
+    def __repr__(self):
+        return f"EvaluationCache(size: {len(self._ranks)}/{self.maxsize}, hits: {self.hits}, misses: {self.misses})"
+
+    def __len__(self):
+        return len(self._ranks)
+
+    def evaluate(self, rank_key: int, card_mask: int) -> HandRank:
+        """
+        Gets the hand rank of a set of cards, evaluating and storing it if it is not cached.
+
+        :param rank_key: Rank key of the cards, see evaluator.evaluate_state.
+        :param card_mask: 52 bit mask of the cards, used as the cache key.
+        :return: HandRank of the cards.
+        """
+        rank = self._ranks.get(card_mask)
+        if rank is not None:
+            self.hits += 1
+            self._ranks.move_to_end(card_mask)
+            return rank
+
+        self.misses += 1
+        rank = HandRank(evaluate_state(rank_key, card_mask))
+        self._ranks[card_mask] = rank
+        if len(self._ranks) > self.maxsize:
+            self._ranks.popitem(last=False)
+        return rank
+
+    def clear(self):
+        """
+        Removes every cached hand rank and resets the hit and miss counters.
+
+        :return: None.
+        """
+        self._ranks.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Process wide evaluation cache used by every Hand, or None when caching is disabled.
+_evaluation_cache = None
+
+
+def enable_evaluation_cache(maxsize: int = DEFAULT_CACHE_SIZE) -> EvaluationCache:
+    """
+    Turns on hand rank caching for every Hand in this process, replacing any existing cache.
+
+    :param maxsize: Maximum number of cached hand ranks.
+    :return: The new EvaluationCache, for reading its hit and miss counters.
+    """
+    global _evaluation_cache
+    _evaluation_cache = EvaluationCache(maxsize)
+    return _evaluation_cache
+
+
+def disable_evaluation_cache():
+    """
+    Turns off hand rank caching for this process.
+
+    :return: None.
+    """
+    global _evaluation_cache
+    _evaluation_cache = None
+
+
+def get_evaluation_cache():
+    """
+    Gets the process wide evaluation cache.
+
+    :return: EvaluationCache, or None if caching is disabled.
+    """
+    return _evaluation_cache
+
+
 def _find_multiples(card_list: list[Card], count: int):
     """
     Search algorithm to determine if there are count multiples of cards in the card list. If there are enough
@@ -352,16 +505,17 @@ def _get_flush_list(card_list: list[Card]):
 def _get_straight_list(card_list: list[Card]):
     """
     Gets a list of card objects that are in a row, ordered highest value to lowest. Cards must exist in provided
-    card_list.
+    card_list.  In a five high straight the ace is placed last, where it plays low.
 
     :param card_list: List of card objects. Should be sorted high to low and hidden cards filtered before function call.
     :return: List of card objects, up to length MAX_CARDS_IN_LIST.
     """
 
-    # If there is an ace at the start of the list, add a low ace at the end of the list (of same suit).
-    if card_list[0].get_type() == CardType.ACE:
-        card_list.append(Card(card_list[0].get_suit(), 1))
-        card_list[-1].reveal_card()
+    # Walk the card values, repeating a leading ace at the end of the list as a low ace.
+    card_values = [card.get_type().value for card in card_list]
+    if card_values and card_values[0] == CardType.ACE.value:
+        card_list = card_list + card_list[:1]
+        card_values.append(CardType.LOW_ACE.value)
 
     # Find the start value of the straight
     if len(card_list) >= CARDS_IN_STRAIGHT:
@@ -369,14 +523,14 @@ def _get_straight_list(card_list: list[Card]):
 
         for i in range(1, len(card_list)):
             # If the previous card is one bigger than the current card, add the current card to the list
-            if card_list[i].get_type().value == card_list[i - 1].get_type().value - 1:
+            if card_values[i] == card_values[i - 1] - 1:
                 return_list.append(card_list[i])
 
                 if len(return_list) >= 5:
                     return return_list
 
             # If the previous card is not the same as current card, the straight is broken and should be reset.
-            elif card_list[i].get_type().value != card_list[i - 1].get_type().value:
+            elif card_values[i] != card_values[i - 1]:
                 return_list = [card_list[i]]
 
     # Straight not found, raise error.
@@ -415,14 +569,25 @@ class Hand:
     #
     ###########################################################################
 
-    def __init__(self):
+    def __init__(self, use_lookup_table: bool = True):
         """
         Constructor.
 
+        :param use_lookup_table: Boolean True to evaluate hands with the lookup table evaluator, False to use the
+        search algorithms.  Hands with more than MAX_LOOKUP_CARDS cards always use the search algorithms.
         """
+        self.use_lookup_table = use_lookup_table
         self.hand_type = HandType(0)
+        self.hand_rank = HandRank(0)
         self.card_list = []
-        self.best_hand = []
+        self._best_hand = []
+
+        # Running lookup table state of the revealed cards, updated as cards are added.
+        self._rank_key = 0
+        self._card_mask = 0
+        self._card_count = 0
+        self._lookup_valid = True
+        self._hidden_cards = []
 
     def __repr__(self):
         """
@@ -432,6 +597,18 @@ class Hand:
         """
         return str(self.hand_type.name).replace("_", " ").capitalize()
 
+    @property
+    def best_hand(self) -> list[Card]:
+        """
+        List of up to 5 cards that create the best hand, ordered as they are compared.  On the lookup table path the
+        list is only built the first time it is accessed after evaluate_hand.
+
+        :return: List of card objects.
+        """
+        if self._best_hand is None:
+            self._best_hand = self._build_best_hand()
+        return self._best_hand
+
     def get_hand_type(self) -> HandType:
         """
         Returns the hand type enumeration that represents the hand.
@@ -441,13 +618,34 @@ class Hand:
         # should evaluate_hand be called here? Maybe if the current HandType is NOT_EVALUATED?
         return self.hand_type
 
+    def get_hand_rank(self) -> HandRank:
+        """
+        Returns the hand rank that orders the hand against other hands, including kickers.
+
+        :return: HandRank of the hand.  HandRank(0) if the hand has not been evaluated.
+        """
+        return self.hand_rank
+
     def evaluate_hand(self):
         """
-        Determines the strength of the hand to update the hand_type enumeration.
+        Determines the strength of the hand to update the hand_type enumeration and the hand_rank.
 
         :return: None.
         """
 
+        # The lookup table scores the running state of the revealed cards, and its value carries the hand type in
+        # the high bits.  Cards that were hidden when added are picked up here if they have since been revealed.
+        if self._hidden_cards:
+            self._track_revealed_cards()
+        if self.use_lookup_table and self._lookup_valid and self._card_count <= MAX_LOOKUP_CARDS:
+            if _evaluation_cache is None:
+                self.hand_rank = HandRank(evaluate_state(self._rank_key, self._card_mask))
+            else:
+                self.hand_rank = _evaluation_cache.evaluate(self._rank_key, self._card_mask)
+            self.hand_type = HandType(self.hand_rank >> CATEGORY_SHIFT)
+            self._best_hand = None
+            return
+
         # Prepare the card list by removing hidden cards and sorting cards by type from high to low.
         self._filter_hidden_cards()
         self._sort_cards()
@@ -482,6 +680,7 @@ class Hand:
                     break
 
         self._update_hand_list()
+        self.hand_rank = HandRank.from_cards(self.hand_type, self._best_hand)
 
     def append_card_list(self, card_list: list[Card]):
         """
@@ -495,6 +694,8 @@ class Hand:
         # make sure that all of the elements are cards before adding
         if all(type(card) is Card for card in card_list):
             self.card_list += card_list
+            for card in card_list:
+                self._track_card(card)
 
     def add_card(self, card: Card):
         """
@@ -505,6 +706,7 @@ class Hand:
         """
         if type(card) is Card:
             self.card_list.append(card)
+            self._track_card(card)
 
     def clear_card_list(self):
         """
@@ -513,6 +715,11 @@ class Hand:
         :return: None.
         """
         self.card_list = []
+        self._rank_key = 0
+        self._card_mask = 0
+        self._card_count = 0
+        self._lookup_valid = True
+        self._hidden_cards = []
 
     ###########################################################################
     #
@@ -527,6 +734,41 @@ class Hand:
         :return: None.
         """
         self.card_list = [card for card in self.card_list if not card.is_hidden()]
+        self._hidden_cards = []
+
+    def _track_card(self, card: Card):
+        """
+        Adds a card to the running lookup table state.  Hidden cards are set aside until they are revealed.
+
+        :param card: Card object that was added to the card list.
+        :return: None.
+        """
+        if card.hidden:
+            self._hidden_cards.append(card)
+            return
+
+        face = card.face
+        self._card_count += 1
+
+        # Non-standard or repeated cards cannot be looked up, so the search algorithms are used instead.
+        if face.bit == 0 or self._card_mask & face.bit:
+            self._lookup_valid = False
+            return
+
+        self._rank_key += CARD_RANK_KEYS[face.index]
+        self._card_mask |= face.bit
+
+    def _track_revealed_cards(self):
+        """
+        Adds the cards that were hidden when added to the hand, but have since been revealed, to the running lookup
+        table state.
+
+        :return: None.
+        """
+        hidden_cards = self._hidden_cards
+        self._hidden_cards = []
+        for card in hidden_cards:
+            self._track_card(card)
 
     def _sort_cards(self):
         """
@@ -542,18 +784,45 @@ class Hand:
 
         :return: None.
         """
+        card_list = self.card_list
 
         # Depending on the hand that was detected, call the corresponding get list function.
-        hand_type_dict = {HandType.ROYAL_FLUSH:    partial(_get_straight_flush_list, self.card_list),
-                          HandType.STRAIGHT_FLUSH: partial(_get_straight_flush_list, self.card_list),
-                          HandType.QUADS:          partial(_get_set_list, self.card_list, CARDS_IN_QUADS),
-                          HandType.FULL_HOUSE:     partial(_get_full_house_list, self.card_list),
-                          HandType.FLUSH:          partial(_get_flush_list, self.card_list),
-                          HandType.STRAIGHT:       partial(_get_straight_list, self.card_list),
-                          HandType.TRIPS:          partial(_get_set_list, self.card_list, CARDS_IN_TRIPS),
-                          HandType.TWO_PAIR:       partial(_get_pair_list, self.card_list, PAIRS_IN_TWO_PAIR),
-                          HandType.PAIR:           partial(_get_pair_list, self.card_list, PAIRS_IN_ONE_PAIR),
-                          HandType.HIGH_CARD:      partial(_get_high_card_list, self.card_list, MAX_CARDS_IN_HAND),
-                          HandType.NOT_EVALUATED:  partial(_get_high_card_list, self.card_list, MAX_CARDS_IN_HAND)}
-
-        self.best_hand = hand_type_dict[self.hand_type]()
+        hand_type_dict = {HandType.ROYAL_FLUSH:    partial(_get_straight_flush_list, card_list),
+                          HandType.STRAIGHT_FLUSH: partial(_get_straight_flush_list, card_list),
+                          HandType.QUADS:          partial(_get_set_list, card_list, CARDS_IN_QUADS),
+                          HandType.FULL_HOUSE:     partial(_get_full_house_list, card_list),
+                          HandType.FLUSH:          partial(_get_flush_list, card_list),
+                          HandType.STRAIGHT:       partial(_get_straight_list, card_list),
+                          HandType.TRIPS:          partial(_get_set_list, card_list, CARDS_IN_TRIPS),
+                          HandType.TWO_PAIR:       partial(_get_pair_list, card_list, PAIRS_IN_TWO_PAIR),
+                          HandType.PAIR:           partial(_get_pair_list, card_list, PAIRS_IN_ONE_PAIR),
+                          HandType.HIGH_CARD:      partial(_get_high_card_list, card_list, MAX_CARDS_IN_HAND),
+                          HandType.NOT_EVALUATED:  partial(_get_high_card_list, card_list, MAX_CARDS_IN_HAND)}
+
+        self._best_hand = hand_type_dict[self.hand_type]()
+
+    def _build_best_hand(self):
+        """
+        Builds best_hand from the hand rank found by the lookup table.  The rank already holds the card types of the
+        best hand in order, so each is matched to an unused revealed card, restricted to the flush suit for flushes.
+
+        :return: List of up to 5 card objects.
+        """
+        card_list = [card for card in self.card_list if not card.hidden]
+
+        if self.hand_type in (HandType.FLUSH, HandType.STRAIGHT_FLUSH, HandType.ROYAL_FLUSH):
+            for suit in range(4):
+                if bin((self._card_mask >> (suit * RANKS_PER_SUIT)) & SUIT_MASK).count("1") >= CARDS_IN_FLUSH:
+                    card_list = [card for card in card_list if card.face.suit.value == suit + 1]
+                    break
+
+        best_hand = []
+        for card_type in self.hand_rank.kickers:
+            # A low ace is played by the ace itself.
+            if card_type is CardType.LOW_ACE:
+                card_type = CardType.ACE
+            for card in card_list:
+                if card.face.type is card_type and card not in best_hand:
+                    best_hand.append(card)
+                    break
+        return best_hand
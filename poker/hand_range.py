@@ -0,0 +1,212 @@
+###############################################################################
+#
+# HandRange - A class for representing a weighted range of two card hands.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import numpy as np
+
+# Package imports.
+from .card import RANKS_PER_SUIT, Card
+
+
+# Static global variables.
+RANK_CHARACTERS = "23456789TJQKA"
+SUIT_CHARACTERS = "shcd"
+SUITS_IN_DECK = 4
+WEIGHT_SEPARATOR = ":"
+
+
+def _index(rank: int, suit: int) -> int:
+    """
+    Gets the card index of a 0-12 rank and 0-3 suit.
+
+    :param rank: Integer rank, 0 for a two up to 12 for an ace.
+    :param suit: Integer suit, 0 for spades up to 3 for diamonds.
+    :return: Integer card index.
+    """
+    return suit * RANKS_PER_SUIT + rank
+
+
+def _class_combos(high: int, low: int, suited) -> list[tuple[int, int]]:
+    """
+    Gets the combos of a starting hand class.
+
+    :param high: Integer rank of the higher card.
+    :param low: Integer rank of the lower card.
+    :param suited: True for suited combos, False for offsuit combos, None for both.  Ignored for pairs.
+    :return: List of (card index, card index) tuples.
+    """
+    combos = []
+    for first_suit in range(SUITS_IN_DECK):
+        for second_suit in range(SUITS_IN_DECK):
+            if high == low and second_suit <= first_suit:
+                continue
+            if high != low and suited is not None and (first_suit == second_suit) != suited:
+                continue
+            combos.append((_index(high, first_suit), _index(low, second_suit)))
+    return combos
+
+
+def parse_class(text: str):
+    """
+    Parses a starting hand class such as 'AKs', 'T9o', 'QJ' or '77'.
+
+    :param text: String of the hand class.
+    :return: Tuple of (high rank, low rank, suited), where suited is True, False or None for both.
+    """
+    if len(text) not in (2, 3) or text[0] not in RANK_CHARACTERS or text[1] not in RANK_CHARACTERS:
+        raise ValueError("HandRange: could not parse hand class '" + text + "'.")
+
+    first, second = RANK_CHARACTERS.index(text[0]), RANK_CHARACTERS.index(text[1])
+    suited = None
+    if len(text) == 3:
+        if text[2] not in "so" or first == second:
+            raise ValueError("HandRange: could not parse hand class '" + text + "'.")
+        suited = text[2] == "s"
+    return max(first, second), min(first, second), suited
+
+
+def _parse_token(token: str) -> list[tuple[int, int]]:
+    """
+    Parses one comma separated part of a range, without its weight.
+
+    :param token: String such as 'TT+', 'AQs+', 'A5s-A2s', '22-55', 'KJo' or 'AhKh'.
+    :return: List of (card index, card index) tuples.
+    """
+    # A specific combo, such as 'AhKh'.
+    if len(token) == 4 and token[1] in SUIT_CHARACTERS and token[3] in SUIT_CHARACTERS:
+        if token[0] not in RANK_CHARACTERS or token[2] not in RANK_CHARACTERS:
+            raise ValueError("HandRange: could not parse combo '" + token + "'.")
+        first = _index(RANK_CHARACTERS.index(token[0]), SUIT_CHARACTERS.index(token[1]))
+        second = _index(RANK_CHARACTERS.index(token[2]), SUIT_CHARACTERS.index(token[3]))
+        if first == second:
+            raise ValueError("HandRange: combo '" + token + "' repeats a card.")
+        return [(first, second)]
+
+    # A span between two classes, such as '22-55' or 'A5s-A2s'.
+    if "-" in token:
+        start, end = token.split("-", 1)
+        start_high, start_low, start_suited = parse_class(start)
+        end_high, end_low, end_suited = parse_class(end)
+        if start_high == start_low and end_high == end_low:
+            ranks = range(min(start_high, end_high), max(start_high, end_high) + 1)
+            return [combo for rank in ranks for combo in _class_combos(rank, rank, None)]
+        if start_high != end_high or start_suited != end_suited or start_high in (start_low, end_low):
+            raise ValueError("HandRange: could not parse span '" + token + "'.")
+        lows = range(min(start_low, end_low), max(start_low, end_low) + 1)
+        return [combo for low in lows for combo in _class_combos(start_high, low, start_suited)]
+
+    # A class and every better class with the same high card, such as 'TT+' or 'AQs+'.
+    if token.endswith("+"):
+        high, low, suited = parse_class(token[:-1])
+        if high == low:
+            return [combo for rank in range(low, RANKS_PER_SUIT) for combo in _class_combos(rank, rank, None)]
+        return [combo for kicker in range(low, high) for combo in _class_combos(high, kicker, suited)]
+
+    high, low, suited = parse_class(token)
+    return _class_combos(high, low, suited)
+
+
+class HandRange:
+    """
+    Class for representing a weighted range of two card hands.  Combos are stored as an (M, 2) int8 array of card
+    indices with an (M,) array of weights and an (M,) array of 52 bit card masks, so blocking and sampling are array
+    operations.
+
+    """
+
+    def __init__(self, combos=None, weights=None):
+        """
+        Constructor.
+
+        :param combos: (M, 2) array-like of card indices.  Defaults to an empty range.
+        :param weights: (M,) array-like of non-negative weights.  Defaults to 1 for every combo.
+        """
+        self.combos = np.asarray(combos if combos is not None else np.empty((0, 2)), dtype=np.int8).reshape(-1, 2)
+        self.weights = (np.ones(len(self.combos)) if weights is None
+                        else np.asarray(weights, dtype=np.float64).reshape(-1))
+        if len(self.weights) != len(self.combos):
+            raise ValueError("HandRange: combos and weights must have the same length.")
+        self.masks = ((np.uint64(1) << self.combos[:, 0].astype(np.uint64))
+                      | (np.uint64(1) << self.combos[:, 1].astype(np.uint64)))
+
+    def __repr__(self):
+        return f"HandRange(combos: {len(self)}, weight: {self.weights.sum():g})"
+
+    def __len__(self):
+        return len(self.combos)
+
+    @classmethod
+    def parse(cls, text: str):
+        """
+        Parses a range in standard notation: comma separated classes ('AKs', 'KJo', 'QT', '77'), classes and every
+        better kicker or pair ('TT+', 'AQs+'), spans ('22-55', 'A5s-A2s') and specific combos ('AhKh').  A part may
+        end with ':weight' to weight its combos, and a combo listed twice keeps its last weight.
+
+        :param text: String of the range, such as 'TT+, AQs+, KJo'.
+        :return: HandRange of the parsed combos.
+        """
+        combo_weights = {}
+        for token in text.replace(" ", "").split(","):
+            if not token:
+                continue
+            weight = 1.0
+            if WEIGHT_SEPARATOR in token:
+                token, weight_text = token.split(WEIGHT_SEPARATOR, 1)
+                weight = float(weight_text)
+                if weight < 0:
+                    raise ValueError("HandRange: weight of '" + token + "' cannot be negative.")
+            for first, second in _parse_token(token):
+                combo_weights[(max(first, second), min(first, second))] = weight
+
+        return cls(list(combo_weights), list(combo_weights.values()))
+
+    @classmethod
+    def from_pocket(cls, pocket: list[Card]):
+        """
+        Creates a range holding a single known pocket, such as Player.get_pocket().
+
+        :param pocket: List of two card objects.
+        :return: HandRange of one combo.
+        """
+        return cls([[card.face.index for card in pocket]])
+
+    def remove_blocked(self, cards=None, mask: int = 0):
+        """
+        Gets the range without the combos that share a card with the given cards.
+
+        :param cards: Iterable of Card objects or card indices that are known to be dealt.
+        :param mask: Integer 52 bit mask of further dealt cards.
+        :return: New HandRange of the unblocked combos.
+        """
+        for card in cards or ():
+            mask |= 1 << (card.face.index if isinstance(card, Card) else int(card))
+        keep = (self.masks & np.uint64(mask)) == 0
+        return HandRange(self.combos[keep], self.weights[keep])
+
+    def sample_indices(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """
+        Draws combos with probability proportional to their weight.
+
+        :param rng: NumPy random generator.
+        :param count: Integer number of combos to draw.
+        :return: (count,) array of positions in combos.
+        """
+        cumulative = np.cumsum(self.weights)
+        if not len(self) or cumulative[-1] <= 0:
+            raise ValueError("HandRange: cannot sample from a range without weighted combos.")
+        positions = np.searchsorted(cumulative, rng.random(count) * cumulative[-1], side="right")
+        return np.minimum(positions, len(self) - 1)
+
+    def sample_pocket(self, rng=None) -> list[Card]:
+        """
+        Draws a combo and creates its cards, ready to be given to a Player with add_card.
+
+        :param rng: Seed or numpy.random.Generator.
+        :return: List of two hidden card objects.
+        """
+        combo = self.combos[self.sample_indices(np.random.default_rng(rng), 1)[0]]
+        return [Card.from_index(int(index)) for index in combo]
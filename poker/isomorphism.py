@@ -0,0 +1,176 @@
+###############################################################################
+#
+# Isomorphism - Functions to map boards and hole cards to a canonical form under suit relabelling.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+from itertools import combinations, permutations
+
+# Package imports.
+from .card import CARDS_IN_DECK, RANKS_PER_SUIT, Card
+
+
+# Static global variables.
+SUITS_IN_DECK = 4
+CARDS_ON_FLOP = 3
+CANONICAL_FLOPS = 1755
+SUIT_BITS = (1 << RANKS_PER_SUIT) - 1
+
+# Every relabelling of the suits.  permutation[s] is the new suit of cards of suit s, with suits numbered from 0 in
+# card index order (spades, hearts, clubs, diamonds).
+SUIT_PERMUTATIONS = list(permutations(range(SUITS_IN_DECK)))
+_flop_indices = None
+
+
+def _indices(cards) -> list[int]:
+    """
+    Converts cards to their 0-51 indices.
+
+    :param cards: Iterable of Card objects or integer card indices.
+    :return: List of integer card indices.
+    """
+    return [card.face.index if isinstance(card, Card) else int(card) for card in cards]
+
+
+def permute_index(index: int, permutation: tuple) -> int:
+    """
+    Relabels the suit of a card, keeping its rank.
+
+    :param index: Integer card index.
+    :param permutation: Tuple of the new suit of each suit.
+    :return: Integer index of the relabelled card.
+    """
+    suit, rank = divmod(index, RANKS_PER_SUIT)
+    return permutation[suit] * RANKS_PER_SUIT + rank
+
+
+def permute_cards(cards, permutation: tuple) -> list[int]:
+    """
+    Relabels the suits of several cards.  Applying the permutation returned by canonicalize to the original cards
+    gives the canonical cards.
+
+    :param cards: Iterable of Card objects or card indices.
+    :param permutation: Tuple of the new suit of each suit.
+    :return: List of relabelled card indices.
+    """
+    return [permute_index(index, permutation) for index in _indices(cards)]
+
+
+def _card_mask(indices: list[int]) -> int:
+    """
+    Gets the 52 bit mask of a set of distinct cards.
+
+    :param indices: List of card indices.
+    :return: Integer card mask.
+    """
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def _mask_indices(mask: int) -> list[int]:
+    """
+    Gets the card indices set in a card mask, lowest first.
+
+    :param mask: Integer card mask.
+    :return: List of card indices.
+    """
+    return [index for index in range(CARDS_IN_DECK) if mask >> index & 1]
+
+
+def _canonical_masks(hole_mask: int, board_mask: int):
+    """
+    Finds the suit relabelling giving the smallest (board, hole) pair of card masks.  Boards and hole cards that
+    are the same up to a relabelling of suits share this smallest pair, so it identifies their class.
+
+    :param hole_mask: Integer card mask of the hole cards.
+    :param board_mask: Integer card mask of the board.
+    :return: Tuple of (canonical hole mask, canonical board mask, permutation).
+    """
+    hole_suits = [(hole_mask >> (suit * RANKS_PER_SUIT)) & SUIT_BITS for suit in range(SUITS_IN_DECK)]
+    board_suits = [(board_mask >> (suit * RANKS_PER_SUIT)) & SUIT_BITS for suit in range(SUITS_IN_DECK)]
+
+    best = None
+    for permutation in SUIT_PERMUTATIONS:
+        board_image = 0
+        hole_image = 0
+        for suit, new_suit in enumerate(permutation):
+            board_image |= board_suits[suit] << (new_suit * RANKS_PER_SUIT)
+            hole_image |= hole_suits[suit] << (new_suit * RANKS_PER_SUIT)
+        if best is None or (board_image, hole_image) < best[:2]:
+            best = (board_image, hole_image, permutation)
+    return best[1], best[0], best[2]
+
+
+def canonicalize(hole=(), board=()):
+    """
+    Maps hole cards and a board to their canonical form under suit relabelling.  Any two sets of hole cards and
+    boards that differ only by a relabelling of suits map to the same canonical cards, so strategically identical
+    spots share one form.  The board may be a flop, turn or river, and either part may be empty.
+
+    :param hole: Iterable of Card objects or card indices held by the player.
+    :param board: Iterable of Card objects or card indices on the board.
+    :return: Tuple of (canonical hole indices, canonical board indices, permutation), card indices sorted lowest
+             first, and permutation mapping each original suit to its canonical suit.
+    """
+    hole_mask, board_mask, permutation = _canonical_masks(_card_mask(_indices(hole)), _card_mask(_indices(board)))
+    return _mask_indices(hole_mask), _mask_indices(board_mask), permutation
+
+
+def canonical_key(hole=(), board=()):
+    """
+    Gets an integer key of the canonical form of hole cards and a board, for keying caches and tables.
+
+    :param hole: Iterable of Card objects or card indices held by the player.
+    :param board: Iterable of Card objects or card indices on the board.
+    :return: Tuple of (integer key, permutation), the key holding the canonical board mask above the canonical hole
+             mask.
+    """
+    hole_mask, board_mask, permutation = _canonical_masks(_card_mask(_indices(hole)), _card_mask(_indices(board)))
+    return board_mask << CARDS_IN_DECK | hole_mask, permutation
+
+
+def _build_flop_indices() -> dict[int, int]:
+    """
+    Enumerates every flop and numbers the distinct canonical flops in order of their card masks.
+
+    :return: Dictionary mapping each canonical flop mask to its index.
+    """
+    masks = set()
+    for flop in combinations(range(CARDS_IN_DECK), CARDS_ON_FLOP):
+        masks.add(_canonical_masks(0, _card_mask(flop))[1])
+    return {mask: index for index, mask in enumerate(sorted(masks))}
+
+
+def flop_index(flop):
+    """
+    Gets the index of a flop among the 1,755 flops that are distinct under suit relabelling.  The index is dense, so
+    it can address an array of per-flop values.  The numbering is built on first use.
+
+    :param flop: Iterable of three Card objects or card indices.
+    :return: Tuple of (integer index from 0 to 1754, permutation mapping each original suit to its canonical suit).
+    """
+    global _flop_indices
+
+    indices = _indices(flop)
+    if len(set(indices)) != CARDS_ON_FLOP:
+        raise ValueError("isomorphism: a flop must hold " + str(CARDS_ON_FLOP) + " distinct cards.")
+    if _flop_indices is None:
+        _flop_indices = _build_flop_indices()
+
+    _, board_mask, permutation = _canonical_masks(0, _card_mask(indices))
+    return _flop_indices[board_mask], permutation
+
+
+def canonical_flops() -> list[list[int]]:
+    """
+    Gets a representative of every canonical flop.
+
+    :return: List of 1,755 lists of three card indices, ordered by flop_index.
+    """
+    if _flop_indices is None:
+        flop_index(range(CARDS_ON_FLOP))
+    return [_mask_indices(mask) for mask in _flop_indices]
@@ -0,0 +1,98 @@
+###############################################################################
+#
+# Parallel - Functions to spread equity and simulation work across processes.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import multiprocessing
+import os
+
+import numpy as np
+
+# Package imports.
+from . import evaluator
+from .equity import DEFAULT_TRIALS, EquityResult, card_indices, monte_carlo_equity
+from .hand_range import HandRange
+
+
+# Static global variables.
+DEFAULT_TASK_SIZE = 1 << 18
+
+
+def _initialize_worker():
+    """
+    Runs once in each worker process.  The evaluator tables are loaded when this module is imported, inherited by
+    forked workers and loaded again by spawned ones.  Reading every byte of them here faults the mapped pages in
+    before the first task, so tasks never pay for loading them.
+
+    :return: None.
+    """
+    for table in (evaluator.RANK_KEYS, evaluator.RANK_VALUES, evaluator.FLUSH_VALUES):
+        np.frombuffer(table, dtype=np.uint8).sum()
+
+
+def map_tasks(function, tasks: list, processes: int = None) -> list:
+    """
+    Runs a module level function over a list of tasks in a pool of worker processes.  Results are returned in task
+    order, so merging them gives the same answer whatever the number of workers.
+
+    :param function: Picklable function taking one task.
+    :param tasks: List of picklable task arguments.
+    :param processes: Integer number of worker processes.  Defaults to the CPU count; 1 runs in this process.
+    :return: List of results, one per task.
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(tasks) <= 1:
+        return [function(task) for task in tasks]
+
+    with multiprocessing.Pool(min(processes, len(tasks)), initializer=_initialize_worker) as pool:
+        return pool.map(function, tasks, chunksize=1)
+
+
+def _equity_task(task: tuple) -> tuple:
+    """
+    Worker task for parallel_equity.
+
+    :param task: Tuple of (hero, villains, board, dead, trials, seed sequence).
+    :return: Tuple of (wins, ties, losses, tie share).
+    """
+    hero, villains, board, dead, trials, seed_sequence = task
+    result = monte_carlo_equity(hero, villains, board, dead, trials, np.random.default_rng(seed_sequence))
+    return result.wins, result.ties, result.losses, result.tie_share
+
+
+def parallel_equity(hero, villains, board=(), dead=(), trials: int = DEFAULT_TRIALS, seed: int = None,
+                    processes: int = None, task_size: int = DEFAULT_TASK_SIZE) -> EquityResult:
+    """
+    Estimates hero's equity like monte_carlo_equity, with the trials split across worker processes.  The trials are
+    cut into tasks of task_size, and each task samples from its own random stream spawned from seed.  Because the
+    tasks and their streams do not depend on the number of processes, a given seed gives identical counts for any
+    worker count.
+
+    :param hero: Hero's two pocket cards, as Card objects or card indices.
+    :param villains: List of each villain's two pocket cards or HandRange.
+    :param board: Community cards already dealt, zero to five cards.
+    :param dead: Cards known to be out of the deck.
+    :param trials: Integer number of runouts to sample.
+    :param seed: Integer seed for reproducible results.  None draws fresh entropy.
+    :param processes: Integer number of worker processes.  Defaults to the CPU count.
+    :param task_size: Integer number of trials per task.
+    :return: EquityResult of hero's outcomes.
+    """
+    # Convert cards before pickling, so tasks only carry integers.
+    hero = card_indices(hero)
+    villains = [villain if isinstance(villain, HandRange) else card_indices(villain) for villain in villains]
+    board = card_indices(board)
+    dead = card_indices(dead)
+
+    task_trials = [min(task_size, trials - start) for start in range(0, trials, task_size)]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(task_trials))
+    tasks = [(hero, villains, board, dead, count, seed_sequence)
+             for count, seed_sequence in zip(task_trials, seed_sequences)]
+
+    result = EquityResult()
+    for wins, ties, losses, tie_share in map_tasks(_equity_task, tasks, processes):
+        result.add(EquityResult(wins, ties, losses, tie_share))
+    return result
@@ -5,16 +5,48 @@
 # Author - Ryan Muetzel (@pretzelryan)
 #
 
+# Standard packages.
+import math
+
 # Package imports
 from .card import *
 
 
 CARDS_IN_POCKET = 2
+# Chips are counted in integer minimum units, this many per chip.
+UNITS_PER_CHIP = 100
+
+
+def to_units(amount: float) -> int:
+    """
+    Converts a chip amount to the integer minimum units used for all accounting.  Integer and float amounts are both
+    accepted, and only the floating point error of a float amount is rounded away.
+
+    :param amount: Amount of chips.
+    :return: Integer amount of minimum units.
+    """
+    scaled = amount * UNITS_PER_CHIP
+    units = round(scaled)
+    if not math.isclose(scaled, units, rel_tol=1e-9, abs_tol=1e-9):
+        raise ValueError("player: " + str(amount) + " chips is not a whole number of minimum units.")
+    return units
+
+
+def to_chips(units: int) -> float:
+    """
+    Converts integer minimum units back to a chip amount.
+
+    :param units: Integer amount of minimum units.
+    :return: Float amount of chips.
+    """
+    return units / UNITS_PER_CHIP
 
 
 class Player:
     """
     A class to represent users in the game, and allow them to interact with the game.
+    The stack is held in stack_units as integer minimum units (UNITS_PER_CHIP per chip), so totals stay exact over
+    any number of hands.  Amounts given to and returned by the betting methods are in chips.
     Betting methods are designed to return a float if the user is remaining active, or None if the player folds.
 
     """
@@ -28,12 +60,12 @@ class Player:
         """
 
         self.name = name
-        self.stack = stack
+        self.stack_units = to_units(stack)
         self.pocket = []
         self.active = True
 
     def __repr__(self):
-        return f"{self.name} (Stack: {self.stack})"
+        return f"{self.name} (Stack: {self.get_stack()})"
 
     def get_pocket(self):
         """
@@ -49,7 +81,7 @@ class Player:
 
         :return: Float of player's chips.
         """
-        return self.stack
+        return to_chips(self.stack_units)
 
     def is_player_active(self):
         """
@@ -77,7 +109,16 @@ class Player:
 
         :return: None
         """
-        self.pocket = []
+        self.pocket.clear()
+
+    def start_hand(self):
+        """
+        Readies the player for a new hand: clears their pocket and makes them active again.
+
+        :return: None
+        """
+        self.pocket.clear()
+        self.active = True
 
     def fold(self):
         """
@@ -88,6 +129,21 @@ class Player:
         self.active = False
         return None
 
+    def pay(self, units: int) -> int:
+        """
+        Takes minimum units from the player's stack, all-in if the stack is short.  Used by the game engine, which
+        counts in minimum units.
+
+        :param units: Integer amount of minimum units.
+        :return: Integer amount of minimum units taken.
+        """
+        if units < self.stack_units:
+            self.stack_units -= units
+            return units
+        paid = self.stack_units
+        self.stack_units = 0
+        return paid
+
     def bet(self, amount: float):
         """
         Player puts in the first bet of the current betting round. Cannot bet if a bet has already been placed.
@@ -96,11 +152,7 @@ class Player:
         :param amount: Float amount of chips the player is betting.
         :return: Float amount bet.
         """
-        if amount < self.stack:
-            self.stack -= amount
-            return amount
-        else:
-            return self.all_in()
+        return to_chips(self.pay(to_units(amount)))
 
     def call_raise(self, current_bet: float, amount: float):
         """
@@ -126,11 +178,7 @@ class Player:
         :param current_bet: Float amount of chips that other players have bet.
         :return: Float amount of chips this player is matching with.
         """
-        if current_bet < self.stack:
-            self.stack -= current_bet
-            return current_bet
-        else:
-            return self.all_in()
+        return to_chips(self.pay(to_units(current_bet)))
 
     def check(self, current_bet: float):
         """
@@ -149,6 +197,4 @@ class Player:
 
         :return: Float amount bet.
         """
-        chips_bet = self.stack
-        self.stack = 0
-        return chips_bet
+        return to_chips(self.pay(self.stack_units))
@@ -5,45 +5,347 @@
 # Author - Ryan Muetzel (@pretzelryan)
 #
 
+# Standard packages.
+from enum import Enum
+from typing import NamedTuple
+
 # Package imports.
 from .card import Card
-from .player import Player
-from .pot import Pot
+from .player import Player, to_chips, to_units
+from .pot import Pot, build_pots, settle_pots
 from .deck import Deck
+from .showdown import rank_pockets, showdown
+
+
+# Static global variables.
+DEFAULT_SMALL_BLIND = 1
+DEFAULT_BIG_BLIND = 2
+HEADS_UP_PLAYERS = 2
+
+
+class Action(Enum):
+    """
+    Enumeration for the actions a player can take when it is their turn to act.
+
+    """
+    FOLD = 0
+    CHECK = 1
+    CALL = 2
+    RAISE = 3
+    ALL_IN = 4
+
+
+class Decision(NamedTuple):
+    """
+    A player's turn to act, as given to their strategy.
+
+    """
+    seat: int
+    player: Player
+    to_call: float
+    min_raise_to: float
+    can_raise: bool
+
+
+def check_call_strategy(game, decision: Decision):
+    """
+    Strategy that never folds or raises: checks when it can and calls otherwise.
+
+    :param game: PokerGame the decision is made in.
+    :param decision: Decision to act on.
+    :return: Tuple of (Action, amount).
+    """
+    return (Action.CALL if decision.to_call else Action.CHECK), 0
 
 
 class PokerGame:
     """
-    TODO: Docs
+    Class to run no-limit hold'em hands between the seated players.  A hand runs as a generator of decisions
+    (hand_steps), so it can be driven by strategy callbacks (play_hand) or by any other driver that sends actions
+    back.  The deck and the per-seat betting lists are reused between hands.  Chips are counted in integer minimum
+    units, as player stacks are, and converted to chips for the blinds, decisions, strategy amounts and results.
 
     """
 
-    def __init__(self):
+    def __init__(self, small_blind: float = DEFAULT_SMALL_BLIND, big_blind: float = DEFAULT_BIG_BLIND, rng=None):
+        """
+        Constructor.
+
+        :param small_blind: Amount of the small blind.
+        :param big_blind: Amount of the big blind, also the minimum bet.
+        :param rng: Source of randomness for the deck, as accepted by Deck.
+        """
         self.player_list = []
+        self.strategies = []
         self.pot_list = [Pot()]
-        self.deck = Deck()
+        self.deck = Deck(rng, lazy_shuffle=True)
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self._small_blind_units = to_units(small_blind)
+        self._big_blind_units = to_units(big_blind)
+        self.button = -1
+        self.hands_played = 0
+
+        # Per-seat state of the current hand, sized when players join.
+        self.street_bets = []
+        self.contributions = []
+        self._acted = []
+        self._in_hand = 0
+        self._chips_at_start = 0
 
-    def add_player(self, player: Player):
+    def add_player(self, player: Player, strategy=check_call_strategy):
         """
         Adds specified player to the game.
 
         :param player: Player object to join the game
+        :param strategy: Callable taking (game, Decision) and returning a tuple of (Action, amount), where amount is
+                         the total the player raises to on this street.  Used by play_hand.
         :return: None
         """
         self.player_list.append(player)
+        self.strategies.append(strategy)
+        self.street_bets.append(0)
+        self.contributions.append(0)
+        self._acted.append(False)
 
     def remove_player(self, player: Player):
         """
-        Removes specified player from the game.
+        Removes specified player from the game.  Should not be called during a hand.
 
         :param player: Player object to be removed.
         :return: None
         """
         if player in self.player_list:
-            self.player_list.remove(player)
+            seat = self.player_list.index(player)
+            for seat_list in (self.player_list, self.strategies, self.street_bets, self.contributions, self._acted):
+                del seat_list[seat]
+            if seat <= self.button:
+                self.button -= 1
+
+    def deal_players(self, order: list[int] = None):
+        """
+        Deals two pocket cards to each seated player, one at a time starting left of the button.
 
-    def deal_players(self):
-        pass
+        :param order: List of the seats in the hand, in dealing order.  Defaults to every seat after the button.
+        :return: None
+        """
+        if order is None:
+            order = [(self.button + offset) % len(self.player_list) for offset in range(1, len(self.player_list) + 1)]
+        for _ in range(2):
+            for seat in order:
+                self.player_list[seat].add_card(self.deck.deal_card())
 
     def evaluate_hands(self):
-        pass
+        """
+        Ranks the hands of every active player against the community cards.
+
+        :return: List of lists of player objects, strongest hand first.  Players in the same list tie.
+        """
+        return showdown(self.deck.community_cards, self.player_list)
+
+    def play_hand(self):
+        """
+        Plays one hand, asking each player's strategy for their actions.
+
+        :return: List of each seat's net chip change, or None if fewer than two players have chips.
+        """
+        steps = self.hand_steps()
+        try:
+            decision = next(steps)
+            while True:
+                decision = steps.send(self.strategies[decision.seat](self, decision))
+        except StopIteration as stop:
+            return stop.value
+
+    def hand_steps(self):
+        """
+        Plays one hand as a generator.  Each yielded Decision is a player's turn, and the driver sends back a tuple
+        of (Action, amount) for it.  Invalid actions are corrected rather than rejected: checking facing a bet folds,
+        as Player.check does, raises below the minimum are raised to it, and raises that are not allowed are calls.
+        Amounts are converted to integer minimum units as they come in.  Once the hand is paid out, the stacks of
+        every seat are checked against their total at the start of the hand, which is an exact integer comparison.
+
+        :return: List of each seat's net chip change, as the generator's return value, or None if the hand could
+                 not start.
+        """
+        order = self._start_hand()
+        if order is None:
+            return None
+
+        heads_up = len(order) == HEADS_UP_PLAYERS
+        self._post_blind(order[-1] if heads_up else order[0], self._small_blind_units)
+        self._post_blind(order[0] if heads_up else order[1], self._big_blind_units)
+        self.deal_players(order)
+
+        # Heads up, the button posts the small blind and acts first before the flop and last after it.
+        first_to_act = len(order) - 1 if heads_up else 2 % len(order)
+        yield from self._betting_round(order, first_to_act, max(self._big_blind_units, max(self.street_bets)))
+
+        for deal_street in (self.deck.deal_flop, self.deck.deal_turn, self.deck.deal_river):
+            if self._in_hand == 1:
+                break
+            deal_street()
+            for seat in order:
+                self.street_bets[seat] = 0
+            yield from self._betting_round(order, 0, 0)
+
+        return self._settle(order)
+
+    def _start_hand(self):
+        """
+        Resets the deck, players and betting state, and moves the button to the next player with chips.
+
+        :return: List of the seats in the hand, starting left of the button and ending on it, or None if fewer than
+                 two players have chips.
+        """
+        seat_count = len(self.player_list)
+        for seat, player in enumerate(self.player_list):
+            player.start_hand()
+            self.street_bets[seat] = 0
+            self.contributions[seat] = 0
+            if player.get_stack() <= 0:
+                player.fold()
+
+        if sum(player.is_player_active() for player in self.player_list) < HEADS_UP_PLAYERS:
+            return None
+
+        self.button = (self.button + 1) % seat_count
+        while not self.player_list[self.button].is_player_active():
+            self.button = (self.button + 1) % seat_count
+        order = [(self.button + offset) % seat_count for offset in range(1, seat_count + 1)]
+        order = [seat for seat in order if self.player_list[seat].is_player_active()]
+
+        self.deck.reset()
+        # The main pot collects every bet during the hand, and is split into side pots when the hand is settled.
+        main_pot = self.pot_list[0]
+        del self.pot_list[1:]
+        main_pot.reset()
+        for seat in order:
+            main_pot.add_player(self.player_list[seat])
+        self._in_hand = len(order)
+        self._chips_at_start = sum(player.stack_units for player in self.player_list)
+        self.hands_played += 1
+        return order
+
+    def _put_in(self, seat: int, amount: int):
+        """
+        Records chips a player has put in the pot.
+
+        :param seat: Integer seat of the player.
+        :param amount: Integer minimum units, already taken from the player's stack.
+        :return: None
+        """
+        self.street_bets[seat] += amount
+        self.contributions[seat] += amount
+        self.pot_list[0].add_units(amount)
+
+    def _post_blind(self, seat: int, amount: int):
+        """
+        Posts a blind, all-in if the player is short.
+
+        :param seat: Integer seat of the player.
+        :param amount: Integer minimum units of the blind.
+        :return: None
+        """
+        self._put_in(seat, self.player_list[seat].pay(amount))
+
+    def _betting_round(self, order: list[int], first: int, current_bet: int):
+        """
+        Runs a betting round as a generator of decisions.  The round ends once every player who can act has acted
+        and matched the current bet, or only one player is left in the hand.  A raise smaller than the minimum (an
+        all-in for less) does not reopen the betting to players who have already acted.
+
+        :param order: List of the seats in the hand.
+        :param first: Integer position in order of the first player to act.
+        :param current_bet: Integer minimum units to match at the start of the round, the big blind before the flop.
+        :return: None
+        """
+        players = self.player_list
+        street_bets = self.street_bets
+        acted = self._acted
+        for seat in order:
+            acted[seat] = False
+
+        # Betting is over if at most one player can still put chips in and they have nothing to call.  The loop reads
+        # player attributes directly, as it runs for every decision of every hand.
+        able = [seat for seat in order if players[seat].active and players[seat].stack_units > 0]
+        if len(able) == 0 or (len(able) == 1 and street_bets[able[0]] >= current_bet):
+            return
+
+        seat_count = len(order)
+        min_raise = self._big_blind_units
+        position = first % seat_count
+        idle = 0
+        while idle < seat_count and self._in_hand > 1:
+            seat = order[position]
+            position = position + 1 if position + 1 < seat_count else 0
+            player = players[seat]
+            stack = player.stack_units
+            if not player.active or stack <= 0 or (acted[seat] and street_bets[seat] >= current_bet):
+                idle += 1
+                continue
+            idle = 0
+
+            to_call = current_bet - street_bets[seat]
+            can_raise = not acted[seat] and stack > to_call
+            action, amount = yield Decision(seat, player, to_chips(min(to_call, stack)),
+                                            to_chips(current_bet + min_raise), can_raise)
+            acted[seat] = True
+
+            if (action is Action.RAISE or action is Action.ALL_IN) and not can_raise:
+                action = Action.CALL
+            if action is Action.FOLD or (action is Action.CHECK and to_call > 0):
+                player.fold()
+                self._in_hand -= 1
+                continue
+            if action is Action.CHECK or to_call <= 0 and action is Action.CALL:
+                continue
+            if action is Action.CALL:
+                self._put_in(seat, player.pay(to_call))
+                continue
+            if action is Action.ALL_IN:
+                self._put_in(seat, player.pay(stack))
+            else:
+                raise_to = max(to_units(amount), current_bet + min_raise)
+                self._put_in(seat, player.pay(raise_to - street_bets[seat]))
+
+            # A full raise sets the new minimum raise and lets everyone act again.
+            if street_bets[seat] > current_bet:
+                if street_bets[seat] - current_bet >= min_raise:
+                    min_raise = street_bets[seat] - current_bet
+                    for other in order:
+                        acted[other] = other == seat
+                current_bet = street_bets[seat]
+
+    def _settle(self, order: list[int]) -> list:
+        """
+        Pays out the pot.  The main pot is split into side pots by contribution, so all-in players only win what they
+        could match, and each pot goes to the best hand among its eligible players.  Ties split a pot, with odd chips
+        going to the winners closest left of the button.  The settled pots are left in pot_list.
+
+        :param order: List of the seats in the hand, starting left of the button.
+        :return: List of each seat's net chip change.
+        """
+        players = self.player_list
+        contributions = self.contributions
+        contenders = [players[seat] for seat in order if players[seat].is_player_active()]
+        if len(contenders) > 1:
+            ranks = dict(zip(contenders, rank_pockets(self.deck.community_cards,
+                                                      [player.get_pocket() for player in contenders])))
+        else:
+            ranks = {contenders[0]: 0}
+
+        pots = build_pots([players[seat] for seat in order], [contributions[seat] for seat in order])
+        self.pot_list = pots or [Pot()]
+        winnings = settle_pots(pots, ranks)
+
+        net = []
+        for seat, player in enumerate(players):
+            won = winnings.get(player, 0)
+            player.stack_units += won
+            net.append(to_chips(won - contributions[seat]))
+
+        # Chips are integers, so conservation is an exact comparison cheap enough to make on every hand.
+        if sum(player.stack_units for player in players) != self._chips_at_start:
+            raise RuntimeError("poker_game: the chips paid out did not match the chips put in.")
+        return net
@@ -6,12 +6,13 @@
 #
 
 # Package imports.
-from .player import Player
+from .player import Player, to_chips, to_units
 
 
 class Pot:
     """
-    A class to track the money and players in each pot/side pot.
+    A class to track the money and players in each pot/side pot.  The total is held in pot_units as integer minimum units, as
+    player stacks are.
 
     """
 
@@ -20,7 +21,7 @@ class Pot:
         Constructor.
 
         """
-        self.pot_total = float(0)
+        self.pot_units = 0
         self.player_list = []
         self.betting_active = True
 
@@ -33,7 +34,7 @@ class Pot:
 
         :return: Float for the total number of chips.
         """
-        return self.pot_total
+        return to_chips(self.pot_units)
 
     def add_player(self, player: Player):
         """
@@ -44,5 +45,112 @@ class Pot:
         """
         self.player_list.append(player)
 
-    # TODO: Add money to pot
-    # TODO: Evaluate pot winner (Maybe do outside of this class)
+    def add_chips(self, amount: float):
+        """
+        Adds chips to the pot.
+
+        :param amount: Float amount of chips.
+        :return: None
+        """
+        self.pot_units += to_units(amount)
+
+    def add_units(self, units: int):
+        """
+        Adds integer minimum units to the pot.  Used by the game engine, which counts in minimum units.
+
+        :param units: Integer amount of minimum units.
+        :return: None
+        """
+        self.pot_units += units
+
+    def reset(self):
+        """
+        Empties the pot of chips and players for a new hand.
+
+        :return: None
+        """
+        self.pot_units = 0
+        self.player_list.clear()
+        self.betting_active = True
+
+    def split(self, ranks: dict) -> list:
+        """
+        Splits the pot among the eligible players with the best hand.  Odd chips go one each to the winners earliest
+        in the pot's player list.
+
+        :param ranks: Dictionary of each eligible player to their hand value.  Higher values are better hands.
+        :return: List of tuples of (player, integer minimum units won).
+        """
+        best = max(ranks[player] for player in self.player_list)
+        winners = [player for player in self.player_list if ranks[player] == best]
+        share, odd_chips = divmod(self.pot_units, len(winners))
+        return [(winner, share + 1 if index < odd_chips else share) for index, winner in enumerate(winners)]
+
+
+def build_pots(players: list[Player], contributions: list) -> list[Pot]:
+    """
+    Splits the chips put in during a hand into the main pot and side pots.  Contributions are sorted once, and each
+    distinct contribution peels off a layer holding that much more from every player who put in at least as much, so
+    an all-in player is only eligible for the layers they could match.  Folded players' chips stay in the pots, but
+    folded players are not eligible.  Layers with the same eligible players are merged, and chips no active player
+    matched go to the last pot.  The eligible players of each layer are the active players left in the sorted order,
+    so the players are never scanned again.
+
+    :param players: List of player objects in the hand, in the order odd chips are given out.
+    :param contributions: List of the integer minimum units each player put in, parallel to players.
+    :return: List of Pot objects, main pot first, each listing its eligible players in the order of players.
+    """
+    count = len(players)
+    # Players are numbered by their position in players, so sorting by that number restores the button order.
+    order = sorted(range(count), key=contributions.__getitem__)
+    active_order = [index for index in order if players[index].active]
+    pots = []
+    previous = 0
+    carried = 0
+    first_active = 0
+    for position, index in enumerate(order):
+        level = contributions[index]
+        if level <= previous:
+            continue
+        # Every player from this position on in the sorted order put in at least this level.
+        layer = carried + (level - previous) * (count - position)
+        previous = level
+
+        # Active players who put in less than this level drop out of the sorted suffix.
+        while first_active < len(active_order) and contributions[active_order[first_active]] < level:
+            first_active += 1
+        eligible_count = len(active_order) - first_active
+        if not eligible_count:
+            if pots:
+                pots[-1].add_units(layer)
+                carried = 0
+            else:
+                carried = layer
+            continue
+        carried = 0
+
+        if pots and len(pots[-1].player_list) == eligible_count:
+            # Eligible players only ever drop out, so an equal count means the same players.
+            pots[-1].add_units(layer)
+            continue
+        pot = Pot()
+        pot.add_units(layer)
+        for eligible in sorted(active_order[first_active:]):
+            pot.add_player(players[eligible])
+        pots.append(pot)
+    return pots
+
+
+def settle_pots(pots: list[Pot], ranks: dict) -> dict:
+    """
+    Splits every pot among its best hands.
+
+    :param pots: List of Pot objects, as built by build_pots.
+    :param ranks: Dictionary of each player still in the hand to their hand value.  Higher values are better hands.
+    :return: Dictionary of each winning player to their total integer minimum units won.
+    """
+    winnings = {}
+    for pot in pots:
+        for player, chips in pot.split(ranks):
+            winnings[player] = winnings.get(player, 0) + chips
+    return winnings
@@ -0,0 +1,319 @@
+###############################################################################
+#
+# Preflop - A table of all-in preflop equities for the 169 starting hand classes.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+# Package imports.
+from .batch_evaluator import CARD_BIT_ARRAY, CARD_RANK_KEY_ARRAY, evaluate_states
+from .card import CARDS_IN_DECK, RANKS_PER_SUIT, Card
+from .equity import CARDS_IN_POCKET, CARDS_ON_BOARD, DEFAULT_CHUNK_SIZE, sample_runouts, score_runouts
+from .hand_range import RANK_CHARACTERS, parse_class
+from .parallel import map_tasks
+
+
+# Static global variables.
+STARTING_HAND_CLASSES = RANKS_PER_SUIT * RANKS_PER_SUIT
+MAX_OPPONENTS = 9
+TABLE_COLUMNS = STARTING_HAND_CLASSES + MAX_OPPONENTS
+DEFAULT_HEADS_UP_TRIALS = 1 << 21
+DEFAULT_MULTIWAY_TRIALS = 1 << 17
+TABLE_PATH_ENVIRONMENT = "POKER_PREFLOP_TABLE"
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "preflop_equity.npy")
+
+
+def class_index(high: int, low: int, suited: bool) -> int:
+    """
+    Gets the index of a starting hand class in the 13 by 13 grid: pairs on the diagonal, suited hands with the high
+    rank as the row and offsuit hands with the high rank as the column.
+
+    :param high: Integer rank of the higher card, 0 for a two up to 12 for an ace.
+    :param low: Integer rank of the lower card.
+    :param suited: True if both cards share a suit.  Ignored for pairs.
+    :return: Integer class index, 0 to 168.
+    """
+    if suited and high != low:
+        return high * RANKS_PER_SUIT + low
+    return low * RANKS_PER_SUIT + high
+
+
+def _build_class_names() -> list[str]:
+    """
+    Names every starting hand class, such as 'AA', 'AKs' or 'T9o'.
+
+    :return: List of 169 strings ordered by class index.
+    """
+    names = [""] * STARTING_HAND_CLASSES
+    for high in range(RANKS_PER_SUIT):
+        for low in range(high + 1):
+            name = RANK_CHARACTERS[high] + RANK_CHARACTERS[low]
+            if high == low:
+                names[class_index(high, low, False)] = name
+            else:
+                names[class_index(high, low, True)] = name + "s"
+                names[class_index(high, low, False)] = name + "o"
+    return names
+
+
+CLASS_NAMES = _build_class_names()
+_table = None
+
+
+def hand_class(hand) -> int:
+    """
+    Gets the starting hand class of a pocket.
+
+    :param hand: Two Card objects or card indices, a class name such as 'AKs', or a class index.
+    :return: Integer class index, 0 to 168.
+    """
+    if isinstance(hand, (int, np.integer)):
+        if not 0 <= hand < STARTING_HAND_CLASSES:
+            raise ValueError("preflop: class index must be between 0 and " + str(STARTING_HAND_CLASSES - 1) + ".")
+        return int(hand)
+
+    if isinstance(hand, str):
+        high, low, suited = parse_class(hand)
+        if suited is None and high != low:
+            raise ValueError("preflop: class '" + hand + "' must be marked suited or offsuit.")
+        return class_index(high, low, suited)
+
+    first, second = [card.face.index if isinstance(card, Card) else int(card) for card in hand]
+    first_rank, second_rank = first % RANKS_PER_SUIT, second % RANKS_PER_SUIT
+    return class_index(max(first_rank, second_rank), min(first_rank, second_rank),
+                       first // RANKS_PER_SUIT == second // RANKS_PER_SUIT)
+
+
+def _class_representative(index: int) -> list[int]:
+    """
+    Gets one pocket of a class.  Every pocket of a class has the same equity against random hands, so one stands for
+    all of them.
+
+    :param index: Integer class index.
+    :return: List of two card indices, in spades and hearts.
+    """
+    row, column = divmod(index, RANKS_PER_SUIT)
+    if row > column:
+        return [row, column]
+    return [column, RANKS_PER_SUIT + row]
+
+
+def _build_pocket_classes() -> np.ndarray:
+    """
+    Maps every pair of card indices to its class.
+
+    :return: (52, 52) int16 array of class indices.
+    """
+    ranks = np.arange(CARDS_IN_DECK) % RANKS_PER_SUIT
+    suits = np.arange(CARDS_IN_DECK) // RANKS_PER_SUIT
+    high = np.maximum.outer(ranks, ranks)
+    low = np.minimum.outer(ranks, ranks)
+    suited = (suits[:, None] == suits[None, :]) & (high != low)
+    return np.where(suited, high * RANKS_PER_SUIT + low, low * RANKS_PER_SUIT + high).astype(np.int16)
+
+
+_POCKET_CLASSES = _build_pocket_classes()
+
+
+def _heads_up_task(task: tuple) -> np.ndarray:
+    """
+    Worker task for build_table.  Deals the class representative against random pockets, and bins the outcomes by
+    the class of the villain's pocket, so one pass fills a whole row of the heads up table.
+
+    :param task: Tuple of (class index, trials, seed sequence).
+    :return: (2, 169) float64 array of hero's summed pot share and the number of trials against each class.
+    """
+    index, trials, seed_sequence = task
+    rng = np.random.default_rng(seed_sequence)
+    hero = _class_representative(index)
+    live = np.array([card for card in range(CARDS_IN_DECK) if card not in hero], dtype=np.int8)
+
+    totals = np.zeros((2, STARTING_HAND_CLASSES))
+    for start in range(0, trials, DEFAULT_CHUNK_SIZE):
+        count = min(DEFAULT_CHUNK_SIZE, trials - start)
+        deals = sample_runouts(rng, live, count, CARDS_ON_BOARD + CARDS_IN_POCKET)
+        board_keys = CARD_RANK_KEY_ARRAY[deals[:, :CARDS_ON_BOARD]].sum(axis=1, dtype=np.uint64)
+        board_masks = CARD_BIT_ARRAY[deals[:, :CARDS_ON_BOARD]].sum(axis=1, dtype=np.uint64)
+        villain = deals[:, CARDS_ON_BOARD:].astype(np.intp)
+
+        hero_values = evaluate_states(board_keys + CARD_RANK_KEY_ARRAY[hero].sum(dtype=np.uint64),
+                                      board_masks + CARD_BIT_ARRAY[hero].sum(dtype=np.uint64))
+        villain_values = evaluate_states(board_keys + CARD_RANK_KEY_ARRAY[villain].sum(axis=1, dtype=np.uint64),
+                                         board_masks + CARD_BIT_ARRAY[villain].sum(axis=1, dtype=np.uint64))
+        shares = (hero_values > villain_values) + 0.5 * (hero_values == villain_values)
+
+        classes = _POCKET_CLASSES[villain[:, 0], villain[:, 1]]
+        totals[0] += np.bincount(classes, weights=shares, minlength=STARTING_HAND_CLASSES)
+        totals[1] += np.bincount(classes, minlength=STARTING_HAND_CLASSES)
+    return totals
+
+
+def _multiway_task(task: tuple) -> float:
+    """
+    Worker task for build_table.  Deals the class representative against a number of random pockets.
+
+    :param task: Tuple of (class index, number of opponents, trials, seed sequence).
+    :return: Float equity of the class.
+    """
+    index, opponents, trials, seed_sequence = task
+    rng = np.random.default_rng(seed_sequence)
+    hero = _class_representative(index)
+    live = np.array([card for card in range(CARDS_IN_DECK) if card not in hero], dtype=np.int8)
+
+    share = 0.0
+    for start in range(0, trials, DEFAULT_CHUNK_SIZE):
+        count = min(DEFAULT_CHUNK_SIZE, trials - start)
+        deals = sample_runouts(rng, live, count, CARDS_ON_BOARD + CARDS_IN_POCKET * opponents)
+        villains = [deals[:, position:position + CARDS_IN_POCKET]
+                    for position in range(CARDS_ON_BOARD, deals.shape[1], CARDS_IN_POCKET)]
+        result = score_runouts(hero, villains, [], deals[:, :CARDS_ON_BOARD])
+        share += result.wins + result.tie_share
+    return share / trials
+
+
+def build_table(heads_up_trials: int = DEFAULT_HEADS_UP_TRIALS, multiway_trials: int = DEFAULT_MULTIWAY_TRIALS,
+                seed: int = 0, processes: int = None) -> np.ndarray:
+    """
+    Estimates the preflop equity table by sampling complete deals, with one task per class and opponent count run
+    in parallel.  Every task samples from its own random stream spawned from seed, so the table does not depend on
+    the number of processes.  The heads up estimates of a class against another and of the reverse matchup are
+    averaged, so the table is exactly antisymmetric: hero's and villain's equity always add up to one.
+
+    :param heads_up_trials: Integer number of deals per class against a random pocket, spread over the 169 classes.
+    :param multiway_trials: Integer number of deals per class and number of opponents.
+    :param seed: Integer seed of the random streams.
+    :param processes: Integer number of worker processes.  Defaults to the CPU count.
+    :return: (169, 178) float32 array.  Column j < 169 is the equity against class j, and column 168 + n is the
+             equity against n random pockets.
+    """
+    heads_up_seeds, multiway_seeds = np.random.SeedSequence(seed).spawn(2)
+    heads_up_tasks = [(index, heads_up_trials, seed_sequence)
+                      for index, seed_sequence in enumerate(heads_up_seeds.spawn(STARTING_HAND_CLASSES))]
+    multiway_tasks = [(index, opponents, multiway_trials, seed_sequence)
+                      for (index, opponents), seed_sequence in
+                      zip([(index, opponents) for index in range(STARTING_HAND_CLASSES)
+                           for opponents in range(1, MAX_OPPONENTS + 1)],
+                          multiway_seeds.spawn(STARTING_HAND_CLASSES * MAX_OPPONENTS))]
+
+    totals = np.stack(map_tasks(_heads_up_task, heads_up_tasks, processes))
+    shares = totals[:, 0] + (totals[:, 1] - totals[:, 0]).T
+    counts = totals[:, 1] + totals[:, 1].T
+
+    table = np.empty((STARTING_HAND_CLASSES, TABLE_COLUMNS), dtype=np.float32)
+    table[:, :STARTING_HAND_CLASSES] = np.divide(shares, counts, out=np.full_like(shares, 0.5), where=counts > 0)
+    table[:, STARTING_HAND_CLASSES:] = np.array(map_tasks(_multiway_task, multiway_tasks, processes)).reshape(
+        STARTING_HAND_CLASSES, MAX_OPPONENTS)
+    return table
+
+
+def get_table_path() -> str:
+    """
+    Gets the path of the table file, from the POKER_PREFLOP_TABLE environment variable if it is set.
+
+    :return: String path of the table file.
+    """
+    return os.environ.get(TABLE_PATH_ENVIRONMENT, DEFAULT_TABLE_PATH)
+
+
+def write_table(path: str = None, table: np.ndarray = None, **build_arguments) -> str:
+    """
+    Writes the table file, written to a temporary name and then moved into place.  Clears the loaded table, so the
+    next lookup reads the new file.
+
+    :param path: String path of the table file.  Defaults to get_table_path().
+    :param table: Table to write.  Defaults to a new table from build_table(**build_arguments).
+    :return: String path the table was written to.
+    """
+    global _table
+
+    path = path or get_table_path()
+    table = build_table(**build_arguments) if table is None else table
+    if table.shape != (STARTING_HAND_CLASSES, TABLE_COLUMNS):
+        raise ValueError("preflop: table must have shape " + str((STARTING_HAND_CLASSES, TABLE_COLUMNS)) + ".")
+
+    handle, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as table_file:
+            np.save(table_file, table.astype(np.float32))
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+    _table = None
+    return path
+
+
+def get_table() -> np.ndarray:
+    """
+    Gets the preflop table, memory mapping the table file on first use.
+
+    :return: (169, 178) float32 array, as described in build_table.
+    """
+    global _table
+
+    if _table is None:
+        path = get_table_path()
+        if not os.path.exists(path):
+            raise FileNotFoundError("preflop: no table at '" + path + "'. Build it with 'python -m poker.preflop'.")
+        table = np.load(path, mmap_mode="r")
+        if table.shape != (STARTING_HAND_CLASSES, TABLE_COLUMNS):
+            raise ValueError("preflop: table at '" + path + "' is stale. Rebuild it with 'python -m poker.preflop'.")
+        _table = table
+    return _table
+
+
+def heads_up_equity(hero, villain) -> float:
+    """
+    Gets hero's all-in preflop equity against a villain, averaged over every pocket of both classes.
+
+    :param hero: Hero's pocket, class name or class index, as accepted by hand_class.
+    :param villain: Villain's pocket, class name or class index.
+    :return: Float equity between 0 and 1.
+    """
+    return float(get_table()[hand_class(hero), hand_class(villain)])
+
+
+def random_equity(hero, opponents: int = 1) -> float:
+    """
+    Gets hero's all-in preflop equity against a number of random pockets.
+
+    :param hero: Hero's pocket, class name or class index, as accepted by hand_class.
+    :param opponents: Integer number of opponents, 1 to 9.
+    :return: Float equity between 0 and 1.
+    """
+    if not 1 <= opponents <= MAX_OPPONENTS:
+        raise ValueError("preflop: opponents must be between 1 and " + str(MAX_OPPONENTS) + ".")
+    return float(get_table()[hand_class(hero), STARTING_HAND_CLASSES + opponents - 1])
+
+
+def main():
+    """
+    Command line entry point.  Builds the table file.
+
+    :return: None.
+    """
+    parser = argparse.ArgumentParser(description="Build the preflop equity table.")
+    parser.add_argument("path", nargs="?", default=None,
+                        help="Table file to write. Defaults to $" + TABLE_PATH_ENVIRONMENT + " or " + DEFAULT_TABLE_PATH)
+    parser.add_argument("--heads-up-trials", type=int, default=DEFAULT_HEADS_UP_TRIALS,
+                        help="Deals per class against a random pocket.")
+    parser.add_argument("--multiway-trials", type=int, default=DEFAULT_MULTIWAY_TRIALS,
+                        help="Deals per class and number of opponents.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random streams.")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes. Defaults to the CPU count.")
+    arguments = parser.parse_args()
+    print("Wrote preflop table to", write_table(arguments.path, heads_up_trials=arguments.heads_up_trials,
+                                                multiway_trials=arguments.multiway_trials, seed=arguments.seed,
+                                                processes=arguments.processes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+###############################################################################
+#
+# RangeEquity - Functions to compute combo against combo equities of two hand ranges.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+from itertools import combinations
+
+import numpy as np
+
+# Package imports.
+from .batch_evaluator import CARD_BIT_ARRAY, CARD_RANK_KEY_ARRAY, evaluate_states
+from .card import CARDS_IN_DECK
+from .equity import CARDS_ON_BOARD, card_indices, sample_runouts
+from .hand_range import HandRange
+
+
+# Static global variables.
+MAX_EXACT_DRAW = 2
+DEFAULT_RUNOUTS = 4096
+MAX_PAIR_CELLS = 1 << 24
+_BLOCKED_VALUE = -1
+_UNBEATABLE_VALUE = np.iinfo(np.int32).max
+
+
+class RangeEquity:
+    """
+    Class to hold the combo against combo equities of two ranges on a board, with their weighted aggregates.
+
+    """
+
+    def __init__(self, hero_range: HandRange, villain_range: HandRange, matrix: np.ndarray):
+        """
+        Constructor.
+
+        :param hero_range: HandRange of hero's combos, without combos blocked by the board.
+        :param villain_range: HandRange of villain's combos, without combos blocked by the board.
+        :param matrix: (M, N) float64 array of the equity of each hero combo against each villain combo.  Pairs that
+                       share a card are NaN.
+        """
+        self.hero_range = hero_range
+        self.villain_range = villain_range
+        self.matrix = matrix
+
+        # Each pair is weighted by both combo weights, and pairs that share a card cannot be dealt.
+        self.pair_weights = np.where(np.isnan(matrix), 0.0, np.outer(hero_range.weights, villain_range.weights))
+        self._weighted = np.nan_to_num(matrix) * self.pair_weights
+
+    def __repr__(self):
+        return (f"RangeEquity(hero combos: {len(self.hero_range)}, villain combos: {len(self.villain_range)}, "
+                f"equity: {self.equity:.4f})")
+
+    @property
+    def hero_equities(self) -> np.ndarray:
+        """
+        Equity of each hero combo against the villain range.
+
+        :return: (M,) float64 array.  Combos that every villain combo blocks are NaN.
+        """
+        totals = self.pair_weights.sum(axis=1)
+        return np.divide(self._weighted.sum(axis=1), totals, out=np.full(totals.shape, np.nan), where=totals > 0)
+
+    @property
+    def villain_equities(self) -> np.ndarray:
+        """
+        Equity of each villain combo against the hero range.
+
+        :return: (N,) float64 array.  Combos that every hero combo blocks are NaN.
+        """
+        totals = self.pair_weights.sum(axis=0)
+        villain_weighted = self.pair_weights.sum(axis=0) - self._weighted.sum(axis=0)
+        return np.divide(villain_weighted, totals, out=np.full(totals.shape, np.nan), where=totals > 0)
+
+    @property
+    def equity(self) -> float:
+        """
+        Hero's equity with both ranges dealt by weight.
+
+        :return: Float between 0 and 1.
+        """
+        total = self.pair_weights.sum()
+        return float(self._weighted.sum() / total) if total > 0 else float("nan")
+
+
+def _combo_values(combos: np.ndarray, board_keys: np.ndarray, board_masks: np.ndarray,
+                  runout_masks: np.ndarray) -> np.ndarray:
+    """
+    Evaluates every combo over every runout.
+
+    :param combos: (M, 2) array of card indices.
+    :param board_keys: (R,) uint64 array of the rank keys of each completed board.
+    :param board_masks: (R,) uint64 array of the card masks of each completed board.
+    :param runout_masks: (R,) uint64 array of the card masks of each runout alone.
+    :return: (M, R) int32 array of hand values, _BLOCKED_VALUE where the runout holds a card of the combo.
+    """
+    combos = combos.astype(np.intp)
+    combo_keys = CARD_RANK_KEY_ARRAY[combos].sum(axis=1, dtype=np.uint64)
+    combo_masks = CARD_BIT_ARRAY[combos].sum(axis=1, dtype=np.uint64)
+
+    # Hand values fit in 32 bits, which halves the memory of the pairwise comparisons.
+    values = np.full((len(combos), len(board_keys)), _BLOCKED_VALUE, dtype=np.int32)
+    open_runouts = (combo_masks[:, None] & runout_masks[None, :]) == 0
+    rows, columns = np.nonzero(open_runouts)
+    values[rows, columns] = evaluate_states(combo_keys[rows] + board_keys[columns],
+                                            combo_masks[rows] + board_masks[columns])
+    return values
+
+
+def range_equity_matrix(hero_range: HandRange, villain_range: HandRange, board=(), dead=(), exact: bool = None,
+                        runouts: int = DEFAULT_RUNOUTS, seed=None) -> RangeEquity:
+    """
+    Computes the equity of every hero combo against every villain combo on a board.  Each combo is evaluated once per
+    runout, and the pairs are compared from those values, so the evaluation cost grows with the number of combos
+    rather than the number of pairs.  A pair only counts the runouts that hold neither combo's cards.
+
+    :param hero_range: HandRange of hero's combos.
+    :param villain_range: HandRange of villain's combos.
+    :param board: Community cards already dealt, zero to five cards.
+    :param dead: Cards known to be out of the deck.
+    :param exact: True to enumerate every runout, False to sample them.  Defaults to enumerating when at most two
+                  board cards are left to come.
+    :param runouts: Integer number of runouts to sample when not exact.
+    :param seed: Seed or numpy.random.Generator for sampling runouts.
+    :return: RangeEquity of the matrix and its weighted aggregates.
+    """
+    board = card_indices(board)
+    dead = card_indices(dead)
+    known = board + dead
+    if len(board) > CARDS_ON_BOARD or len(set(known)) != len(known):
+        raise ValueError("range_equity: the board and dead cards must be at most " + str(CARDS_ON_BOARD)
+                         + " board cards and distinct.")
+    hero_range = hero_range.remove_blocked(known)
+    villain_range = villain_range.remove_blocked(known)
+
+    # Runouts are dealt from every card not on the board or dead.  Combos that hold a runout card skip it.
+    draw = CARDS_ON_BOARD - len(board)
+    live = np.array([index for index in range(CARDS_IN_DECK) if index not in known], dtype=np.int8)
+    if exact if exact is not None else draw <= MAX_EXACT_DRAW:
+        runout_cards = np.array(list(combinations(live.tolist(), draw)), dtype=np.intp).reshape(-1, draw)
+    else:
+        runout_cards = sample_runouts(np.random.default_rng(seed), live, runouts, draw).astype(np.intp)
+
+    runout_masks = CARD_BIT_ARRAY[runout_cards].sum(axis=1, dtype=np.uint64)
+    board_keys = CARD_RANK_KEY_ARRAY[runout_cards].sum(axis=1, dtype=np.uint64) + np.uint64(
+        CARD_RANK_KEY_ARRAY[board].sum())
+    board_masks = runout_masks + np.uint64(CARD_BIT_ARRAY[board].sum())
+
+    hero_values = _combo_values(hero_range.combos, board_keys, board_masks, runout_masks)
+    villain_values = _combo_values(villain_range.combos, board_keys, board_masks, runout_masks)
+
+    # A blocked villain value above every hand and a blocked hero value below every hand never win or tie, so only
+    # runouts open to both combos are counted.
+    villain_values[villain_values == _BLOCKED_VALUE] = _UNBEATABLE_VALUE
+    hero_open = (hero_values != _BLOCKED_VALUE).astype(np.float64)
+    villain_open = (villain_values != _UNBEATABLE_VALUE).astype(np.float64)
+    counts = hero_open @ villain_open.T
+
+    shares = np.zeros(counts.shape)
+    step = max(1, MAX_PAIR_CELLS // max(1, counts.size))
+    for start in range(0, len(runout_cards), step):
+        hero_chunk = hero_values[:, None, start:start + step]
+        villain_chunk = villain_values[None, :, start:start + step]
+        # A win counts once in each count and a tie in one, so half their sum is the pot share.
+        shares += 0.5 * (np.count_nonzero(hero_chunk > villain_chunk, axis=2)
+                         + np.count_nonzero(hero_chunk >= villain_chunk, axis=2))
+
+    overlap = (hero_range.masks[:, None] & villain_range.masks[None, :]) != 0
+    matrix = np.divide(shares, counts, out=np.full(counts.shape, np.nan), where=~overlap & (counts > 0))
+    return RangeEquity(hero_range, villain_range, matrix)
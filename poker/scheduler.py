@@ -0,0 +1,213 @@
+###############################################################################
+#
+# Scheduler - Functions to simulate many independent tables across worker processes.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard packages.
+import multiprocessing
+import os
+import random
+
+# Package imports.
+from .player import to_chips
+
+
+# Static global variables.
+DEFAULT_TABLES_PER_TASK = 16
+CANCEL_CHECK_INTERVAL = 64
+_cancel_event = None
+
+
+class TableResult:
+    """
+    Class to hold what one simulated table produced.  Only names and numbers are kept, so results are cheap to send
+    between processes.
+
+    """
+
+    def __init__(self, table_id: int, hands_played: int, unit_deltas: dict):
+        """
+        Constructor.
+
+        :param table_id: Integer id of the table.
+        :param hands_played: Integer number of hands played at the table.
+        :param unit_deltas: Dictionary of each player's name to their net change in integer minimum units.
+        """
+        self.table_id = table_id
+        self.hands_played = hands_played
+        self.unit_deltas = unit_deltas
+
+    def __repr__(self):
+        return f"TableResult(table: {self.table_id}, hands: {self.hands_played})"
+
+    @property
+    def chip_deltas(self) -> dict:
+        """
+        Each player's net chip change.
+
+        :return: Dictionary of each player's name to their net chip change.
+        """
+        return {name: to_chips(units) for name, units in self.unit_deltas.items()}
+
+
+class SimulationTotals:
+    """
+    Class to aggregate the results of many tables.  Totals are summed in integer minimum units, so they are exact.
+
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+
+        """
+        self.tables = 0
+        self.hands_played = 0
+        self.unit_deltas = {}
+
+    def __repr__(self):
+        return f"SimulationTotals(tables: {self.tables}, hands: {self.hands_played})"
+
+    @property
+    def chip_deltas(self) -> dict:
+        """
+        Each player's net chip change over every table.
+
+        :return: Dictionary of each player's name to their net chip change.
+        """
+        return {name: to_chips(units) for name, units in self.unit_deltas.items()}
+
+    def add(self, result: TableResult):
+        """
+        Adds a table's result into the totals.
+
+        :param result: TableResult to merge.
+        :return: None
+        """
+        self.tables += 1
+        self.hands_played += result.hands_played
+        for name, units in result.unit_deltas.items():
+            self.unit_deltas[name] = self.unit_deltas.get(name, 0) + units
+
+
+def play_table(game, hands: int, cancel_event=None):
+    """
+    Plays hands at one table until the budget is spent, fewer than two players have chips, or the simulation is
+    cancelled.
+
+    :param game: PokerGame to play.
+    :param hands: Integer maximum number of hands.
+    :param cancel_event: Optional event that stops play once set.  Checked every CANCEL_CHECK_INTERVAL hands.
+    :return: Tuple of (hands played, list of each seat's net change in integer minimum units).
+    """
+    # Stacks are integer minimum units, so their change is the exact result of every hand played.
+    starting_stacks = [player.stack_units for player in game.player_list]
+    hands_played = 0
+    for hand in range(hands):
+        if cancel_event is not None and hand % CANCEL_CHECK_INTERVAL == 0 and cancel_event.is_set():
+            break
+        if game.play_hand() is None:
+            break
+        hands_played += 1
+    return hands_played, [player.stack_units - stack for player, stack in zip(game.player_list, starting_stacks)]
+
+
+def _play_tables(task: tuple, cancel_event=None) -> list[TableResult]:
+    """
+    Builds and plays a chunk of tables.
+
+    :param task: Tuple of (table factory, list of table ids, hands per table, seed).
+    :param cancel_event: Optional event that stops play once set.
+    :return: List of TableResult, one per table played.
+    """
+    table_factory, table_ids, hands, seed = task
+    results = []
+    for table_id in table_ids:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        # Each table's stream depends only on the seed and its id, so results do not depend on the chunking.
+        game = table_factory(table_id, random.Random(str(seed) + ":" + str(table_id)))
+        hands_played, deltas = play_table(game, hands, cancel_event)
+        unit_deltas = {}
+        for player, delta in zip(game.player_list, deltas):
+            unit_deltas[player.name] = unit_deltas.get(player.name, 0) + delta
+        results.append(TableResult(table_id, hands_played, unit_deltas))
+    return results
+
+
+def _initialize_worker(cancel_event):
+    """
+    Runs once in each worker process, keeping the shared cancellation event for the tasks.
+
+    :param cancel_event: multiprocessing.Event, or None.
+    :return: None.
+    """
+    global _cancel_event
+    _cancel_event = cancel_event
+
+
+def _table_task(task: tuple) -> list[TableResult]:
+    """
+    Worker task for run_tables.
+
+    :param task: Tuple of (table factory, list of table ids, hands per table, seed).
+    :return: List of TableResult.
+    """
+    return _play_tables(task, _cancel_event)
+
+
+def run_tables(table_factory, tables: int, hands_per_table: int, processes: int = None, seed: int = 0,
+               tables_per_task: int = DEFAULT_TABLES_PER_TASK, cancel_event=None):
+    """
+    Simulates independent tables across a pool of worker processes, yielding each table's result as soon as its
+    chunk finishes.  Tables are built inside the workers by table_factory, so no game objects are sent between
+    processes.  Setting cancel_event stops every worker within a few hands, and results of tables already played are
+    still yielded; closing the generator early shuts the pool down.
+
+    :param table_factory: Picklable module level function taking (table id, random.Random) and returning a
+                          PokerGame with its players seated.  The random.Random should seed the game and strategies.
+    :param tables: Integer number of tables.
+    :param hands_per_table: Integer maximum number of hands at each table.
+    :param processes: Integer number of worker processes.  Defaults to the CPU count; 1 runs in this process.
+    :param seed: Integer seed.  Each table's random stream is derived from it and the table id.
+    :param tables_per_task: Integer number of tables per task sent to a worker.
+    :param cancel_event: Optional multiprocessing.Event to cancel the simulation.
+    :return: Generator of TableResult, in completion order.
+    """
+    table_ids = list(range(tables))
+    tasks = [(table_factory, table_ids[start:start + tables_per_task], hands_per_table, seed)
+             for start in range(0, tables, tables_per_task)]
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield from _play_tables(task, cancel_event)
+        return
+
+    with multiprocessing.Pool(min(processes, len(tasks)), initializer=_initialize_worker,
+                              initargs=(cancel_event,)) as pool:
+        for results in pool.imap_unordered(_table_task, tasks):
+            yield from results
+
+
+def run_simulation(table_factory, tables: int, hands_per_table: int, processes: int = None, seed: int = 0,
+                   tables_per_task: int = DEFAULT_TABLES_PER_TASK, cancel_event=None) -> SimulationTotals:
+    """
+    Simulates independent tables like run_tables and aggregates their results.
+
+    :param table_factory: Picklable function taking (table id, random.Random) and returning a PokerGame.
+    :param tables: Integer number of tables.
+    :param hands_per_table: Integer maximum number of hands at each table.
+    :param processes: Integer number of worker processes.  Defaults to the CPU count.
+    :param seed: Integer seed.
+    :param tables_per_task: Integer number of tables per task sent to a worker.
+    :param cancel_event: Optional multiprocessing.Event to cancel the simulation.
+    :return: SimulationTotals of every table played.
+    """
+    totals = SimulationTotals()
+    for result in run_tables(table_factory, tables, hands_per_table, processes, seed, tables_per_task,
+                             cancel_event):
+        totals.add(result)
+    return totals
@@ -0,0 +1,61 @@
+###############################################################################
+#
+# Showdown - Functions to rank every player's hand against a shared board.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Package imports.
+from .card import Card
+from .evaluator import CARD_RANK_KEYS, evaluate_state
+from .player import Player
+
+
+def rank_pockets(community_cards: list[Card], pockets: list[list[Card]]) -> list[int]:
+    """
+    Evaluates several pockets against the same community cards.  The board's rank key and card mask are computed
+    once, so each pocket only adds its own cards before the table lookup.  Cards are read by face, so the board is
+    counted even if a community card has not been revealed.
+
+    :param community_cards: List of up to five community card objects.
+    :param pockets: List of pockets, each a list of card objects.
+    :return: List of integer hand values, one per pocket, comparable with HandRank.
+    """
+    board_key = 0
+    board_mask = 0
+    for card in community_cards:
+        board_key += CARD_RANK_KEYS[card.face.index]
+        board_mask |= card.face.bit
+
+    ranks = []
+    for pocket in pockets:
+        rank_key = board_key
+        card_mask = board_mask
+        for card in pocket:
+            rank_key += CARD_RANK_KEYS[card.face.index]
+            card_mask |= card.face.bit
+        ranks.append(evaluate_state(rank_key, card_mask))
+    return ranks
+
+
+def showdown(community_cards: list[Card], players: list[Player]) -> list[list[Player]]:
+    """
+    Ranks every active player's pocket with the community cards.  Players are grouped by equal hand strength and the
+    groups are ordered strongest first, so the first group holds the winners and a group of several players is a
+    tie that splits the pot.
+
+    :param community_cards: List of community card objects, such as Deck.community_cards.
+    :param players: List of player objects.  Players that have folded are ignored.
+    :return: List of lists of player objects, strongest hand first.
+    """
+    active_players = [player for player in players if player.is_player_active()]
+    ranks = rank_pockets(community_cards, [player.get_pocket() for player in active_players])
+
+    groups = []
+    last_rank = None
+    for rank, player in sorted(zip(ranks, active_players), key=lambda pair: pair[0], reverse=True):
+        if rank != last_rank:
+            groups.append([])
+            last_rank = rank
+        groups[-1].append(player)
+    return groups
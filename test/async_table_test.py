@@ -0,0 +1,94 @@
+###############################################################################
+#
+# Testing file to verify the asyncio table runner is working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import asyncio
+import time
+import unittest
+
+# Package imports.
+from poker import async_table
+from poker import player
+from poker import poker_game
+
+
+def raise_strategy(game, decision):
+    if decision.can_raise:
+        return poker_game.Action.RAISE, decision.min_raise_to
+    return poker_game.Action.CALL, 0
+
+
+class TestAsyncTable(unittest.TestCase):
+    def test_timeout_folds(self):
+        async def run():
+            game = poker_game.PokerGame(small_blind=1, big_blind=2, rng=1)
+            slow = async_table.FakeClient(raise_strategy, latency=1.0)
+            game.add_player(player.Player("Slow", 100), slow)
+            game.add_player(player.Player("Fast", 100))
+            table = async_table.AsyncTable(game, action_timeout=0.01)
+            async with slow:
+                return await table.play_hand(), table.timeouts
+
+        result, timeouts = asyncio.run(run())
+        # The slow button faces the big blind and times out, so they fold their small blind.
+        self.assertEqual(result, [-1, 1], "TEST1: a timed out player facing a bet did not fold.")
+        self.assertEqual(timeouts, 1, "TEST2: the timeout was not counted.")
+
+    def test_timeout_checks(self):
+        async def run():
+            game = poker_game.PokerGame(rng=2)
+            slow = async_table.FakeClient(latency=1.0)
+            game.add_player(player.Player("Caller", 100))
+            game.add_player(player.Player("Slow", 100), slow)
+            table = async_table.AsyncTable(game, action_timeout=0.01)
+            async with slow:
+                await table.play_hand()
+            return game, table.timeouts
+
+        game, timeouts = asyncio.run(run())
+        # The slow big blind only ever faces no bet, so every timeout checks and the hand reaches showdown.
+        self.assertTrue(game.player_list[1].is_player_active(), "TEST3: a timed out player with no bet folded.")
+        self.assertEqual(timeouts, 4, "TEST4: the slow player did not time out once per street.")
+
+    def test_concurrent_tables(self):
+        async def run():
+            tables = []
+            clients = []
+            for seat in range(200):
+                game = poker_game.PokerGame(rng=seat)
+                for name in ("A", "B", "C"):
+                    client = async_table.FakeClient(latency=0.005)
+                    clients.append(client)
+                    game.add_player(player.Player(name, 100), client)
+                tables.append(async_table.AsyncTable(game, action_timeout=1.0))
+            for client in clients:
+                client.start()
+            try:
+                return await async_table.play_tables(tables, 3)
+            finally:
+                for client in clients:
+                    await client.stop()
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), 200, "TEST5: not every table returned a result.")
+        for hands, deltas in results:
+            self.assertEqual(hands, 3, "TEST6: a table did not play every hand.")
+            self.assertEqual(sum(deltas), 0, "TEST7: chips were created or lost.")
+        # Serially, 200 tables of slow players would wait for minutes rather than seconds.
+        self.assertLess(elapsed, 20, "TEST8: tables did not wait for their players concurrently.")
+
+    def test_unstarted_client(self):
+        client = async_table.FakeClient()
+        with self.assertRaises(RuntimeError, msg="TEST9: an unstarted client accepted a decision."):
+            asyncio.run(client(None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+###############################################################################
+#
+# Testing file to verify the batch evaluator agrees with the hand class.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Package imports.
+from poker import hand
+from poker import card
+
+if np is not None:
+    from poker import batch_evaluator
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestBatchEvaluator(unittest.TestCase):
+    def test_agrees_with_hand(self):
+        rng = random.Random(4321)
+        rows = [rng.sample(range(52), 7) for _ in range(2000)]
+        values, hand_types = batch_evaluator.evaluate_batch(np.array(rows))
+
+        for row, value, hand_type in zip(rows, values.tolist(), hand_types.tolist()):
+            new_hand = hand.Hand()
+            for index in row:
+                new_card = card.Card.from_index(index)
+                new_card.reveal_card()
+                new_hand.add_card(new_card)
+            new_hand.evaluate_hand()
+
+            self.assertEqual(value, new_hand.get_hand_rank(), "TEST1: batch value disagrees with Hand for " + str(row))
+            self.assertEqual(hand_type, new_hand.get_hand_type().value, "TEST2: batch HandType disagrees with Hand "
+                                                                        "for " + str(row))
+
+    def test_chunking(self):
+        cards = np.argsort(np.random.default_rng(7).random((1000, 52)), axis=1)[:, :6]
+        whole, _ = batch_evaluator.evaluate_batch(cards)
+        chunked, _ = batch_evaluator.evaluate_batch(cards, chunk_size=64)
+        self.assertTrue((whole == chunked).all(), "TEST3: chunked evaluation changed the results.")
+
+    def test_shape_error(self):
+        with self.assertRaises(ValueError, msg="TEST4: evaluate_batch accepted eight card hands."):
+            batch_evaluator.evaluate_batch(np.zeros((3, 8), dtype=int))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,6 +48,30 @@ class TestHand(unittest.TestCase):
         self.assertEqual(new_card.get_type(), card.CardType.TWO,
                          "TEST6: get_suit did not return correct suit after reveal.")
 
+    def test_shared_face(self):
+        first_card = card.Card(2, 11)
+        second_card = card.Card(2, 11)
+        first_card.reveal_card()
+        self.assertIs(first_card.face, second_card.face, "TEST7: cards of the same value did not share a face.")
+        self.assertTrue(second_card.is_hidden(), "TEST8: revealing one card revealed another view of its face.")
+
+    def test_face_bits(self):
+        new_card = card.Card(2, 11)     # Jack of Hearts
+        self.assertEqual(new_card.index, 22, "TEST9: Jack of Hearts did not have index 22.")
+        self.assertEqual(new_card.face.rank_bit, 1 << 9, "TEST10: Jack of Hearts had the wrong rank bit.")
+        self.assertEqual(new_card.face.suit_bit, 1 << 1, "TEST11: Jack of Hearts had the wrong suit bit.")
+
+    def test_hash(self):
+        card_set = set()
+        for _ in range(2):
+            new_card = card.Card(3, 14)
+            new_card.reveal_card()
+            card_set.add(new_card)
+        self.assertEqual(len(card_set), 1, "TEST12: equal cards did not hash to the same set entry.")
+        other_card = card.Card.from_index(new_card.index)
+        other_card.reveal_card()
+        self.assertIn(other_card, {new_card: 1}, "TEST13: equal card was not found as a dictionary key.")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,126 @@
+###############################################################################
+#
+# Testing file to verify deck class is working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Package imports.
+from poker import deck
+
+
+class TestDeck(unittest.TestCase):
+    def test_dealing(self):
+        new_deck = deck.Deck()
+        self.assertEqual(new_deck.deal_card().index, 0, "TEST1: an unshuffled deck did not deal the Two of Spades.")
+        self.assertEqual(new_deck.cards_remaining(), 51, "TEST2: dealing did not move past the card.")
+        for _ in range(51):
+            new_deck.deal_card()
+        with self.assertRaises(IndexError, msg="TEST3: an empty deck dealt a card."):
+            new_deck.deal_card()
+
+    def test_community_cards(self):
+        new_deck = deck.Deck()
+        new_deck.shuffle()
+        new_deck.deal_flop()
+        new_deck.deal_turn()
+        new_deck.deal_river()
+        self.assertEqual(len(new_deck.community_cards), 5, "TEST4: the board did not hold five cards.")
+        self.assertEqual(len(new_deck.burn_pile), 3, "TEST5: a card was not burned before each street.")
+        self.assertFalse(any(card.is_hidden() for card in new_deck.community_cards),
+                         "TEST6: a community card was not revealed.")
+        self.assertTrue(all(card.is_hidden() for card in new_deck.burn_pile), "TEST7: a burned card was revealed.")
+
+    def test_reset(self):
+        new_deck = deck.Deck()
+        cards = list(new_deck.cards)
+        new_deck.shuffle()
+        new_deck.deal_flop()
+        new_deck.deal_turn()
+        new_deck.reset()
+
+        self.assertEqual(new_deck.cards_remaining(), 52, "TEST8: reset did not return every card.")
+        self.assertEqual(len(new_deck.community_cards + new_deck.burn_pile), 0, "TEST9: reset left cards on the table.")
+        self.assertTrue(all(card.is_hidden() for card in new_deck.cards), "TEST10: reset left a card revealed.")
+        self.assertEqual({id(card) for card in new_deck.cards}, {id(card) for card in cards},
+                         "TEST11: reset created new card objects.")
+
+    def test_shuffle_undealt(self):
+        new_deck = deck.Deck()
+        dealt = [new_deck.deal_card() for _ in range(10)]
+        new_deck.shuffle()
+        self.assertEqual([id(card) for card in new_deck.cards[:10]], [id(card) for card in dealt],
+                         "TEST12: shuffling moved cards that were already dealt.")
+        self.assertEqual(sorted(card.index for card in new_deck.cards), list(range(52)),
+                         "TEST13: shuffling lost or repeated a card.")
+
+    def test_seeded_shuffles(self):
+        first = deck.Deck(rng=7)
+        second = deck.Deck(rng=random.Random(7))
+        first.shuffle()
+        second.shuffle()
+        self.assertEqual([card.index for card in first.cards], [card.index for card in second.cards],
+                         "TEST14: the same seed did not give the same shuffle.")
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_numpy_generator(self):
+        first = deck.Deck(rng=np.random.default_rng(3))
+        second = deck.Deck(rng=np.random.default_rng(3))
+        first.reset()
+        second.reset()
+        self.assertEqual([card.index for card in first.cards], [card.index for card in second.cards],
+                         "TEST15: the same numpy generator seed did not give the same shuffle.")
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_shuffled_decks(self):
+        decks = deck.shuffled_decks(1000, rng=5)
+        self.assertEqual(decks.shape, (1000, 52), "TEST16: shuffled_decks did not give one row per deck.")
+        self.assertTrue((np.sort(decks, axis=1) == np.arange(52)).all(), "TEST17: a row is not a permutation.")
+        self.assertTrue((decks == deck.shuffled_decks(1000, rng=5)).all(), "TEST18: the same seed changed decks.")
+        # Each card leads about 1000 / 52 decks.
+        self.assertLess(np.bincount(decks[:, 0], minlength=52).max(), 60, "TEST19: the first card is not uniform.")
+
+        new_deck = deck.Deck()
+        new_deck.arrange(decks[0])
+        self.assertEqual([card.index for card in new_deck.cards], decks[0].tolist(),
+                         "TEST20: arrange did not put the deck in order.")
+        with self.assertRaises(ValueError, msg="TEST21: arrange accepted an order repeating a card."):
+            new_deck.arrange([0] * 52)
+
+    def test_dead_cards(self):
+        # Aces of Spades and Hearts as a mask, and the King of Spades as a card index.
+        new_deck = deck.Deck(rng=11)
+        new_deck.remove_cards((1 << 12) | (1 << 25))
+        new_deck.remove_cards([11])
+        self.assertEqual(new_deck.cards_remaining(), 49, "TEST22: dead cards were left in the deck.")
+
+        drawn = new_deck.draw_cards(5)
+        self.assertEqual(len(drawn), 5, "TEST23: draw_cards did not deal five cards.")
+        self.assertFalse({card.index for card in drawn} & {11, 12, 25}, "TEST24: a dead card was drawn.")
+        self.assertEqual(new_deck.cards_remaining(), 44, "TEST25: draw_cards did not deal from the deck.")
+
+        # Every undealt card is still where the deck believes it is.
+        for position, card in enumerate(new_deck.cards):
+            self.assertEqual(new_deck._positions[card.index], position, "TEST26: a card position was lost.")
+        with self.assertRaises(IndexError, msg="TEST27: draw_cards dealt more cards than the deck holds."):
+            new_deck.draw_cards(45)
+
+        # Faces beyond the 52 cards of the deck, such as hidden or low ace faces, are rejected before any card moves.
+        with self.assertRaises(ValueError, msg="TEST28: a face outside the deck was accepted as a dead card."):
+            new_deck.remove_cards([deck.Card.from_face(deck.CARD_FACES[52])])
+        with self.assertRaises(ValueError, msg="TEST29: an index above 51 was accepted as a dead card."):
+            new_deck.remove_cards([0, 60])
+        self.assertEqual(new_deck.cards_remaining(), 44, "TEST30: a rejected call removed cards.")
+
+
+if __name__ == "__main__":
+    unittest.main()
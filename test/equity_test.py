@@ -0,0 +1,135 @@
+###############################################################################
+#
+# Testing file to verify equity functions are working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import unittest
+from itertools import combinations
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Package imports.
+from poker import card
+from poker import evaluator
+
+if np is not None:
+    from poker import equity
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestMonteCarloEquity(unittest.TestCase):
+    def test_aces_against_kings(self):
+        result = equity.monte_carlo_equity([12, 25], [[11, 24]], trials=200000, seed=1)
+        self.assertAlmostEqual(result.equity, 0.82, delta=0.01, msg="TEST1: Aces did not hold about 82% against "
+                                                                    "Kings.")
+        self.assertEqual(result.trials, 200000, "TEST2: result did not count every trial.")
+
+    def test_complete_board(self):
+        # Royal flush on the board splits every runout, whatever the pockets.
+        result = equity.monte_carlo_equity([0, 13], [[1, 14], [2, 15]], board=[8, 9, 10, 11, 12], trials=1000)
+        self.assertEqual(result.ties, 1000, "TEST3: a board royal flush did not tie every runout.")
+        self.assertAlmostEqual(result.equity, 1 / 3, msg="TEST4: a three way split did not give a third of the pot.")
+
+    def test_seed_and_cards(self):
+        hero = [card.Card.from_index(12), card.Card.from_index(11)]
+        first = equity.monte_carlo_equity(hero, [[0, 13]], dead=[1], trials=5000, seed=7)
+        second = equity.monte_carlo_equity([12, 11], [[0, 13]], dead=[1], trials=5000, seed=7)
+        self.assertEqual((first.wins, first.ties, first.losses), (second.wins, second.ties, second.losses),
+                         "TEST5: the same seed did not reproduce the same counts.")
+
+    def test_duplicate_cards(self):
+        with self.assertRaises(ValueError, msg="TEST6: monte_carlo_equity accepted a card dealt twice."):
+            equity.monte_carlo_equity([12, 11], [[12, 13]])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestExactEquity(unittest.TestCase):
+    def _brute_force(self, hero, villain, board):
+        """
+        Enumerates every runout without suit reduction.
+
+        :return: Tuple of (wins, ties, losses).
+        """
+        live = [index for index in range(52) if index not in hero + villain + board]
+        counts = [0, 0, 0]
+        for runout in combinations(live, 5 - len(board)):
+            hero_value = evaluator.evaluate(hero + board + list(runout))
+            villain_value = evaluator.evaluate(villain + board + list(runout))
+            counts[0 if hero_value > villain_value else 1 if hero_value == villain_value else 2] += 1
+        return tuple(counts)
+
+    def test_symmetric_turn(self):
+        # Aces of Spades and Hearts against Kings of Spades and Hearts on Two, Two, Nine, Nine of every other suit.
+        hero, villain, board = [12, 25], [11, 24], [26, 39, 7, 20]
+        result = equity.exact_equity(hero, [villain], board=board)
+        self.assertEqual((result.wins, result.ties, result.losses), self._brute_force(hero, villain, board),
+                         "TEST7: exact_equity disagrees with brute force enumeration.")
+
+        runouts, weights = equity._canonical_runouts([hero, villain, board, []],
+                                                     [i for i in range(52) if i not in hero + villain + board], 1)
+        self.assertLess(len(runouts), 44, "TEST8: suit symmetry did not reduce the runouts.")
+        self.assertEqual(weights.sum(), 44, "TEST9: runout weights did not cover every runout.")
+
+    def test_no_symmetry(self):
+        # Aces of Spades and Hearts against Kings of Spades and Diamonds leave every suit distinguishable.
+        hero, villain, board = [12, 25], [11, 37], [0, 14]
+        live = [i for i in range(52) if i not in hero + villain + board]
+        runouts, weights = equity._canonical_runouts([hero, villain, board, []], live, 2)
+        self.assertEqual(sorted(map(tuple, runouts.tolist())), list(combinations(live, 2)),
+                         "TEST21: runouts without suit symmetry were not every combination.")
+        self.assertTrue((weights == 1).all(), "TEST22: runouts without suit symmetry were weighted.")
+
+    def test_flop(self):
+        hero, villain, board = [12, 11], [0, 13], [4, 17, 33]
+        result = equity.exact_equity(hero, [villain], board=board)
+        self.assertEqual((result.wins, result.ties, result.losses), self._brute_force(hero, villain, board),
+                         "TEST10: exact_equity disagrees with brute force enumeration on the flop.")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestAdaptiveEquity(unittest.TestCase):
+    def test_target_precision(self):
+        # Exact equity of Aces of Spades and Hearts against Kings of Spades and Hearts is about 0.8264.
+        for options in ({}, {"stratified": True}):
+            result = equity.adaptive_equity([12, 25], [[11, 24]], half_width=0.003, seed=4, **options)
+            self.assertTrue(result.converged, "TEST11: adaptive_equity did not reach the target with " + str(options))
+            self.assertLessEqual(result.half_width, 0.003, "TEST12: the reported half-width missed the target.")
+            self.assertAlmostEqual(result.equity, 0.8264, delta=0.006,
+                                   msg="TEST13: the estimate left its interval with " + str(options))
+
+    def test_stratified_spread(self):
+        def spread(board, stratified):
+            estimates = [equity.adaptive_equity([12, 11], [[0, 13]], board=board, half_width=0.0, max_trials=8192,
+                                                batch_size=2048, seed=seed, stratified=stratified).equity
+                         for seed in range(30)]
+            return np.std(estimates)
+
+        # With one card to come, a stratified batch deals every river once, so every seed gives the exact equity,
+        # while plain sampling varies from seed to seed.
+        self.assertGreater(spread([4, 17, 33, 40], False), 0.0, "TEST19: plain sampling did not vary across seeds.")
+        self.assertAlmostEqual(spread([4, 17, 33, 40], True), 0.0, places=12,
+                               msg="TEST20: stratified sampling did not lower the spread.")
+
+    def test_stopping(self):
+        result = equity.adaptive_equity([12, 25], [[11, 24]], half_width=0.0, time_budget=0.0, batch_size=1000)
+        self.assertFalse(result.converged, "TEST14: an unreachable target was reported as reached.")
+        self.assertEqual(result.trials, 1000, "TEST15: a spent time budget did not stop after one batch.")
+
+        result = equity.adaptive_equity([12, 25], [[11, 24]], half_width=0.0, max_trials=5000, batch_size=1000)
+        self.assertEqual(result.trials, 5000, "TEST16: max_trials did not cap the trials.")
+
+        # Every runout of a complete board is the same, so the standard error is zero.
+        result = equity.adaptive_equity([0, 13], [[1, 14]], board=[8, 9, 10, 11, 12], batch_size=100)
+        self.assertEqual(result.standard_error, 0.0, "TEST17: a complete board had a standard error.")
+        self.assertEqual(result.trials, 100 * equity.MIN_BATCHES, "TEST18: a certain spot did not stop early.")
+
+
+if __name__ == "__main__":
+    unittest.main()
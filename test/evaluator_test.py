@@ -0,0 +1,115 @@
+###############################################################################
+#
+# Testing file to verify the lookup table evaluator agrees with the hand search algorithms.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import os
+import random
+import tempfile
+import unittest
+
+
+# Package imports.
+from poker import evaluator
+from poker import hand
+from poker import card
+
+
+def _make_cards(indices):
+    """
+    Creates revealed Card objects from card indices.
+
+    :param indices: Iterable of integer card indices.
+    :return: List of revealed Card objects.
+    """
+    card_list = []
+    for index in indices:
+        new_card = card.Card(index // 13 + 1, index % 13 + 2)
+        new_card.reveal_card()
+        card_list.append(new_card)
+    return card_list
+
+
+class TestEvaluator(unittest.TestCase):
+    def test_card_index(self):
+        indices = [new_card.index for new_card in _make_cards(range(52))]
+        self.assertEqual(indices, list(range(52)), "TEST1: card index did not follow the deck order.")
+
+    def test_royal_flush_value(self):
+        value = evaluator.evaluate([8, 9, 10, 11, 12, 13, 26])     # Ten through Ace of Spades, Two of Hearts, Clubs.
+        self.assertEqual(evaluator.get_category(value), hand.HandType.ROYAL_FLUSH.value,
+                         "TEST2: evaluate did not detect a royal flush.")
+
+    def test_kicker_ordering(self):
+        # Pair of kings with an ace kicker beats a pair of kings with a queen kicker.
+        ace_kicker = evaluator.evaluate([11, 24, 12, 0, 2])
+        queen_kicker = evaluator.evaluate([11, 24, 10, 0, 2])
+        self.assertGreater(ace_kicker, queen_kicker, "TEST3: evaluate did not order hands by kicker.")
+
+    def test_wheel_below_six_high(self):
+        wheel = evaluator.evaluate([12, 13, 27, 41, 3])
+        six_high = evaluator.evaluate([0, 14, 28, 42, 4])
+        self.assertGreater(six_high, wheel, "TEST4: evaluate did not rank the wheel as the lowest straight.")
+
+    def test_agrees_with_search(self):
+        rng = random.Random(1234)
+        for _ in range(3000):
+            indices = rng.sample(range(52), rng.randint(5, 7))
+
+            table_hand = hand.Hand()
+            table_hand.append_card_list(_make_cards(indices))
+            table_hand.evaluate_hand()
+
+            search_hand = hand.Hand(use_lookup_table=False)
+            search_hand.append_card_list(_make_cards(indices))
+            search_hand.evaluate_hand()
+
+            self.assertEqual(table_hand.get_hand_type(), search_hand.get_hand_type(),
+                             "TEST5: lookup table and search disagree on " + str(search_hand.card_list))
+
+            # The packed card types must match the best hand the search algorithms build.
+            self.assertEqual(table_hand.get_hand_rank(), search_hand.get_hand_rank(),
+                             "TEST6: packed card types do not match best_hand for " + str(search_hand.card_list))
+
+            # The lazily built best hand must hold the same cards the search algorithms pick.
+            self.assertEqual([best.face for best in table_hand.best_hand],
+                             [best.face for best in search_hand.best_hand],
+                             "TEST7: lazy best_hand does not match the search best_hand for "
+                             + str(search_hand.card_list))
+
+    def test_table_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tables.bin")
+            evaluator.load_tables(path)
+            self.assertFalse(os.path.exists(path), "TEST12: load_tables wrote a table file without being asked.")
+            rank_keys, rank_values, flush_values = evaluator.load_tables(path, write=True)
+            self.assertTrue(os.path.exists(path), "TEST8: load_tables did not write a missing table file.")
+            self.assertEqual(dict(zip(rank_keys, rank_values)), evaluator.RANK_TABLE,
+                             "TEST9: table file rank table does not match the loaded rank table.")
+            self.assertEqual(list(flush_values), list(evaluator.FLUSH_TABLE),
+                             "TEST10: table file flush table does not match the loaded flush table.")
+            del rank_keys, rank_values, flush_values
+
+            # Flip a byte of the payload so the checksum no longer matches.
+            with open(path, "r+b") as table_file:
+                table_file.seek(-1, os.SEEK_END)
+                last_byte = table_file.read(1)
+                table_file.seek(-1, os.SEEK_END)
+                table_file.write(bytes([last_byte[0] ^ 0xFF]))
+            self.assertIsNone(evaluator._read_tables(path), "TEST11: corrupt table file passed the checksum.")
+
+    def test_unwritable_table_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # A path inside a missing directory cannot be written, as in a read only install.
+            path = os.path.join(directory, "missing", "tables.bin")
+            rank_keys, rank_values, flush_values = evaluator.load_tables(path, write=True)
+            self.assertEqual(len(rank_keys), len(evaluator.RANK_KEYS), "TEST13: tables were not built in memory "
+                                                                       "when the write failed.")
+            self.assertEqual(os.listdir(directory), [], "TEST14: a failed write left files behind.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+###############################################################################
+#
+# Testing file to verify the HandRange class is working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Package imports.
+from poker import card
+
+if np is not None:
+    from poker import equity
+    from poker import hand_range
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestHandRangeParse(unittest.TestCase):
+    def test_notation(self):
+        # TT+ is 5 pairs of 6 combos, AQs+ is 2 classes of 4 combos and KJo is 12 combos.
+        self.assertEqual(len(hand_range.HandRange.parse("TT+, AQs+, KJo")), 50,
+                         "TEST1: 'TT+, AQs+, KJo' did not parse to 50 combos.")
+        self.assertEqual(len(hand_range.HandRange.parse("22-55")), 24, "TEST2: '22-55' did not parse to 24 combos.")
+        self.assertEqual(len(hand_range.HandRange.parse("A5s-A2s")), 16,
+                         "TEST3: 'A5s-A2s' did not parse to 16 combos.")
+        self.assertEqual(len(hand_range.HandRange.parse("QT")), 16, "TEST4: 'QT' did not parse to 16 combos.")
+
+        # Ace of Hearts is index 25 and King of Hearts is index 24.
+        combo = hand_range.HandRange.parse("AhKh")
+        self.assertEqual(sorted(combo.combos[0].tolist()), [24, 25], "TEST5: 'AhKh' did not parse to its cards.")
+
+    def test_weights(self):
+        weighted = hand_range.HandRange.parse("AA:0.5, KK, AA:0.25")
+        self.assertEqual(len(weighted), 12, "TEST6: a repeated class added duplicate combos.")
+        self.assertAlmostEqual(weighted.weights.sum(), 6 * 0.25 + 6, msg="TEST7: the last weight of a combo was "
+                                                                         "not kept.")
+
+    def test_invalid(self):
+        for text in ("AAs", "AX", "KQs-J9s", "AsAs", "AK:-1"):
+            with self.assertRaises(ValueError, msg="TEST8: HandRange parsed invalid range '" + text + "'."):
+                hand_range.HandRange.parse(text)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestHandRangeCombos(unittest.TestCase):
+    def test_remove_blocked(self):
+        kings = hand_range.HandRange.parse("KK")
+        # King of Spades, as a card object and as an index.
+        self.assertEqual(len(kings.remove_blocked([card.Card.from_index(11)])), 3,
+                         "TEST9: a known King did not block three combos.")
+        self.assertEqual(len(kings.remove_blocked([11, 24])), 1, "TEST10: two known Kings did not leave one combo.")
+        self.assertEqual(len(kings), 6, "TEST11: remove_blocked changed the original range.")
+
+    def test_sampling(self):
+        # Zero weight combos are never drawn.
+        weighted = hand_range.HandRange.parse("AA, KK:0")
+        positions = weighted.sample_indices(np.random.default_rng(3), 10000)
+        self.assertTrue((weighted.weights[positions] > 0).all(), "TEST12: a zero weight combo was drawn.")
+
+        pocket = hand_range.HandRange.parse("AhKh").sample_pocket(5)
+        self.assertEqual(sorted(c.index for c in pocket), [24, 25], "TEST13: sample_pocket did not give the combo.")
+        self.assertEqual(hand_range.HandRange.from_pocket(pocket).combos.tolist(), [[25, 24]],
+                         "TEST14: from_pocket did not hold the pocket.")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestRangeEquity(unittest.TestCase):
+    def test_single_combo(self):
+        # A range of one combo gives the same equity as the known pocket.
+        result = equity.monte_carlo_equity([12, 25], [hand_range.HandRange.parse("KsKh")], trials=200000, seed=1)
+        self.assertAlmostEqual(result.equity, 0.82, delta=0.01, msg="TEST15: Aces did not hold about 82% against "
+                                                                    "a range of one Kings combo.")
+
+    def test_blocking(self):
+        # Hero holds the Kings of Spades and Hearts, so only the Kings of Clubs and Diamonds are left in the range,
+        # and they lose every runout to hero's King high flush.
+        kings = hand_range.HandRange.parse("KK")
+        result = equity.monte_carlo_equity([11, 24], [kings], board=[2, 3, 4, 5, 8], trials=500)
+        self.assertEqual(result.wins, 500, "TEST16: a blocked combo was dealt against hero's Kings.")
+
+        with self.assertRaises(ValueError, msg="TEST17: a fully blocked range was accepted."):
+            equity.monte_carlo_equity([11, 24], [kings, [37, 50]], trials=10)
+
+    def test_two_ranges(self):
+        # Two villains holding Aces can never both hold the same Ace.
+        aces = hand_range.HandRange.parse("AA")
+        result = equity.monte_carlo_equity([0, 1], [aces, aces], trials=20000, seed=2)
+        self.assertEqual(result.trials, 20000, "TEST18: colliding range combos were not redrawn.")
+        self.assertLess(result.equity, 0.2, "TEST19: two pairs of Aces did not dominate Two, Three.")
+
+    def test_impossible_ranges(self):
+        # Hero holds two Aces, so two villains cannot both hold the other two.
+        aces = hand_range.HandRange.parse("AA")
+        with self.assertRaises(ValueError, msg="TEST20: ranges that cannot be dealt together were accepted."):
+            equity.monte_carlo_equity([12, 25], [aces, aces], trials=10)
+        with self.assertRaises(ValueError, msg="TEST21: adaptive_equity accepted ranges that cannot be dealt."):
+            equity.adaptive_equity([12, 25], [aces, aces], max_trials=10)
+
+    def test_redraw_cap(self):
+        aces = hand_range.HandRange.parse("AA")
+        with mock.patch.object(equity, "MAX_REDRAW_PASSES", 0):
+            with self.assertRaises(ValueError, msg="TEST22: redrawing did not stop at the pass limit."):
+                equity.monte_carlo_equity([0, 1], [aces, aces], trials=10, seed=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
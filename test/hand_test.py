@@ -312,6 +312,116 @@ class TestHand(unittest.TestCase):
         self.assertEqual(new_hand.get_hand_type(), hand.HandType.ROYAL_FLUSH, "TEST17: Expected HandType.ROYAL_FLUSH. "
                                                                         "Actual " + str(new_hand.get_hand_type()))
 
+    def test_hand_rank_kicker(self):
+        ranks = []
+        for kicker in (14, 12):
+            new_hand = hand.Hand()
+            for suit, card_type in ((1, 13), (2, 13), (1, kicker), (3, 7), (4, 4)):
+                new_card = card.Card(suit, card_type)   # Pair of Kings with an Ace or Queen kicker.
+                new_card.reveal_card()
+                new_hand.add_card(new_card)
+            new_hand.evaluate_hand()
+            ranks.append(new_hand.get_hand_rank())
+
+        self.assertGreater(ranks[0], ranks[1], "TEST18: Ace kicker did not outrank Queen kicker.")
+        self.assertEqual(ranks[0].hand_type, hand.HandType.PAIR, "TEST19: HandRank did not unpack HandType.PAIR.")
+        self.assertEqual(ranks[0].kickers, [card.CardType.KING, card.CardType.KING, card.CardType.ACE,
+                                            card.CardType.SEVEN, card.CardType.FOUR],
+                         "TEST20: HandRank did not unpack the kickers.")
+
+    def test_hand_rank_search(self):
+        hands = []
+        for use_lookup_table in (True, False):
+            new_hand = hand.Hand(use_lookup_table)
+            for i in range(1, 4):
+                new_card = card.Card(i, 11)     # Generate Jack of Spades, Hearts, and Clubs.
+                new_card.reveal_card()
+                new_hand.add_card(new_card)
+            for i in range(1, 3):
+                new_card = card.Card(i, 3)      # Generate Three of Spades and Hearts.
+                new_card.reveal_card()
+                new_hand.add_card(new_card)
+            new_hand.evaluate_hand()
+            hands.append(new_hand)
+
+        self.assertEqual(hands[0].get_hand_rank(), hands[1].get_hand_rank(), "TEST21: lookup table and search "
+                                                                             "returned different hand ranks.")
+
+    def test_incremental_streets(self):
+        new_hand = hand.Hand()
+
+        # Pocket pair of Sevens, then a board that adds a pair of Twos and a third Seven.
+        for suit, card_type in ((1, 7), (2, 7), (3, 2), (4, 2), (1, 12)):
+            new_card = card.Card(suit, card_type)
+            new_card.reveal_card()
+            new_hand.add_card(new_card)
+        results = []
+        for suit, card_type in ((2, 2), (3, 7)):
+            new_hand.evaluate_hand()
+            results.append(new_hand.get_hand_type())
+            new_card = card.Card(suit, card_type)
+            new_card.reveal_card()
+            new_hand.add_card(new_card)
+        new_hand.evaluate_hand()
+        results.append(new_hand.get_hand_type())
+
+        self.assertEqual(results, [hand.HandType.TWO_PAIR, hand.HandType.FULL_HOUSE, hand.HandType.FULL_HOUSE],
+                         "TEST22: incremental evaluation did not follow the added cards.")
+        new_hand.clear_card_list()
+        new_hand.evaluate_hand()
+        self.assertEqual(new_hand.get_hand_type(), hand.HandType.HIGH_CARD, "TEST23: clear_card_list did not reset the "
+                                                                            "running hand state.")
+
+    def test_revealed_after_add(self):
+        new_hand = hand.Hand()
+        hidden_card = card.Card(2, 9)               # Hidden Nine of Hearts.
+        new_hand.add_card(hidden_card)
+        for suit in (1, 3):
+            new_card = card.Card(suit, 9)           # Nine of Spades and Clubs.
+            new_card.reveal_card()
+            new_hand.add_card(new_card)
+
+        new_hand.evaluate_hand()
+        self.assertEqual(new_hand.get_hand_type(), hand.HandType.PAIR, "TEST24: hidden card was counted.")
+
+        hidden_card.reveal_card()
+        new_hand.evaluate_hand()
+        self.assertEqual(new_hand.get_hand_type(), hand.HandType.TRIPS, "TEST25: revealed card was not counted.")
+
+    def test_wheel_best_hand(self):
+        new_hand = hand.Hand()
+        card_list = []
+        for suit, card_type in ((1, 14), (2, 2), (3, 3), (4, 4), (1, 5), (2, 9)):
+            new_card = card.Card(suit, card_type)   # Ace through Five of mixed suits, and a Nine of Hearts.
+            new_card.reveal_card()
+            new_hand.add_card(new_card)
+            card_list.append(new_card)
+
+        new_hand.evaluate_hand()
+        self.assertEqual(new_hand.best_hand, card_list[4:0:-1] + card_list[:1], "TEST26: best_hand did not place the "
+                                                                                "ace last in a wheel.")
+        self.assertEqual(new_hand.card_list, card_list, "TEST27: building best_hand changed hand.card_list.")
+
+    def test_evaluation_cache(self):
+        cache = hand.enable_evaluation_cache(maxsize=1)
+        try:
+            hands = []
+            for card_type in (9, 9, 10):
+                new_hand = hand.Hand()
+                for suit in (1, 2):
+                    new_card = card.Card(suit, card_type)     # Pair of Nines, Nines again, then Tens.
+                    new_card.reveal_card()
+                    new_hand.add_card(new_card)
+                new_hand.evaluate_hand()
+                hands.append(new_hand)
+        finally:
+            hand.disable_evaluation_cache()
+
+        self.assertEqual((cache.hits, cache.misses), (1, 2), "TEST28: cache did not count hits and misses.")
+        self.assertEqual(len(cache), 1, "TEST29: cache grew past maxsize.")
+        self.assertEqual(hands[0].get_hand_rank(), hands[1].get_hand_rank(), "TEST30: cached rank did not match.")
+        self.assertIsNone(hand.get_evaluation_cache(), "TEST31: disable_evaluation_cache did not remove the cache.")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+###############################################################################
+#
+# Testing file to verify isomorphism functions are working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import unittest
+from itertools import combinations
+
+# Package imports.
+from poker import card
+from poker import isomorphism
+
+
+class TestCanonicalForm(unittest.TestCase):
+    def test_flop_count(self):
+        indices = {isomorphism.flop_index(flop)[0] for flop in combinations(range(52), 3)}
+        self.assertEqual(len(indices), isomorphism.CANONICAL_FLOPS, "TEST1: flops did not fall into 1,755 classes.")
+        self.assertEqual(indices, set(range(isomorphism.CANONICAL_FLOPS)), "TEST2: flop indices are not dense.")
+
+    def test_flop_permutation(self):
+        # Ace, King, Two of Spades and of Hearts are the same flop, and the permutation maps each onto its canonical
+        # representative.
+        flops = isomorphism.canonical_flops()
+        for flop in ([12, 11, 0], [25, 24, 13], [card.Card.from_index(38), 37, 26]):
+            index, permutation = isomorphism.flop_index(flop)
+            self.assertEqual(index, isomorphism.flop_index([12, 11, 0])[0], "TEST3: a monotone flop changed index.")
+            self.assertEqual(sorted(isomorphism.permute_cards(flop, permutation)), flops[index],
+                             "TEST4: the permutation did not map the flop to its representative.")
+
+        self.assertNotEqual(isomorphism.flop_index([12, 11, 0])[0], isomorphism.flop_index([12, 11, 13])[0],
+                            "TEST5: a monotone and a two tone flop shared an index.")
+        with self.assertRaises(ValueError, msg="TEST6: a flop with a repeated card was accepted."):
+            isomorphism.flop_index([0, 0, 1])
+
+    def test_hole_and_board(self):
+        # Ace, King of Spades on a spade turn board is the same spot in hearts, but not with offsuit hole cards.
+        spades_key = isomorphism.canonical_key([12, 11], [0, 1, 15, 30])[0]
+        hearts_key = isomorphism.canonical_key([25, 24], [13, 14, 2, 30])[0]
+        offsuit_key = isomorphism.canonical_key([12, 24], [0, 1, 15, 30])[0]
+        self.assertEqual(spades_key, hearts_key, "TEST7: relabelled suits changed the canonical key.")
+        self.assertNotEqual(spades_key, offsuit_key, "TEST8: different hole suits shared a canonical key.")
+
+        hole, board, permutation = isomorphism.canonicalize([25, 24], [13, 14, 2, 30, 51])
+        self.assertEqual(sorted(isomorphism.permute_cards([25, 24], permutation)), hole,
+                         "TEST9: the permutation did not give the canonical hole cards.")
+        self.assertEqual(sorted(isomorphism.permute_cards([13, 14, 2, 30, 51], permutation)), board,
+                         "TEST10: the permutation did not give the canonical river board.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+###############################################################################
+#
+# Testing file to verify parallel equity is working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Package imports.
+if np is not None:
+    from poker import parallel
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestParallelEquity(unittest.TestCase):
+    def test_worker_count_independent(self):
+        results = []
+        for processes in (1, 3):
+            result = parallel.parallel_equity([12, 25], [[11, 24]], trials=50000, seed=11, processes=processes,
+                                              task_size=8000)
+            results.append((result.wins, result.ties, result.losses, result.tie_share))
+
+        self.assertEqual(results[0], results[1], "TEST1: worker count changed the seeded result.")
+        self.assertEqual(sum(results[0][:3]), 50000, "TEST2: parallel_equity did not run every trial.")
+
+    def test_equity(self):
+        result = parallel.parallel_equity([12, 25], [[11, 24]], trials=100000, seed=3, processes=2)
+        self.assertAlmostEqual(result.equity, 0.82, delta=0.01, msg="TEST3: Aces did not hold about 82% against "
+                                                                    "Kings.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+###############################################################################
+#
+# Testing file to verify the poker game hand engine is working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import random
+import unittest
+
+# Package imports.
+from poker import deck
+from poker import player
+from poker import poker_game
+
+
+def fold_strategy(game, decision):
+    return poker_game.Action.FOLD, 0
+
+
+def random_strategy(game, decision):
+    roll = game.test_rng.random()
+    if roll < 0.15:
+        return poker_game.Action.FOLD, 0
+    if roll < 0.3:
+        return poker_game.Action.RAISE, decision.min_raise_to * 2
+    if roll < 0.35:
+        return poker_game.Action.ALL_IN, 0
+    return poker_game.Action.CALL, 0
+
+
+def rig_deck(game, order):
+    """
+    Replaces the game's deck with one that deals the given card indices first, for a single hand.
+    """
+    rigged = deck.Deck()
+    rigged.arrange(order + [index for index in range(52) if index not in order])
+    rigged.reset = lambda shuffle=True: None
+    game.deck = rigged
+
+
+class TestHandEngine(unittest.TestCase):
+    def test_heads_up_blinds(self):
+        game = poker_game.PokerGame(small_blind=1, big_blind=2, rng=1)
+        game.add_player(player.Player("Button", 100), fold_strategy)
+        game.add_player(player.Player("Big Blind", 100), fold_strategy)
+        # The button posts the small blind and acts first heads up, so folding loses the small blind.
+        self.assertEqual(game.play_hand(), [-1, 1], "TEST1: the button did not post and fold the small blind.")
+        self.assertEqual(game.play_hand(), [1, -1], "TEST2: the button did not move.")
+
+    def test_chip_conservation(self):
+        game = poker_game.PokerGame(rng=3)
+        game.test_rng = random.Random(4)
+        for seat in range(6):
+            game.add_player(player.Player("Player " + str(seat), 200), random_strategy)
+
+        for _ in range(2000):
+            result = game.play_hand()
+            if result is None:
+                for seated in game.player_list:
+                    seated.stack_units = player.to_units(200)
+                continue
+            # Results are chips, so they are summed back in exact minimum units.
+            self.assertEqual(sum(player.to_units(delta) for delta in result), 0,
+                             "TEST3: a hand created or destroyed chips.")
+            self.assertEqual(sum(seated.stack_units for seated in game.player_list), player.to_units(1200),
+                             "TEST4: stacks do not add up to the chips in play.")
+
+    def test_side_pots(self):
+        game = poker_game.PokerGame(rng=5)
+        stacks = [50, 100, 200]
+        for seat, stack in enumerate(stacks):
+            game.add_player(player.Player("Player " + str(seat), stack),
+                            lambda game, decision: (poker_game.Action.ALL_IN, 0))
+
+        for _ in range(50):
+            for seated, stack in zip(game.player_list, stacks):
+                seated.stack_units = player.to_units(stack)
+            result = game.play_hand()
+            # The short stack can win at most 50 from each opponent, and the big stack cannot lose its last 100.
+            self.assertLessEqual(result[0], 100, "TEST5: the short stack won more than it covered.")
+            self.assertGreaterEqual(result[2], -100, "TEST6: the big stack lost chips nobody matched.")
+            self.assertEqual(sum(result), 0, "TEST7: side pots did not pay out every chip.")
+
+    def test_split_pot_odd_chip(self):
+        game = poker_game.PokerGame(small_blind=0.01, big_blind=0.02)
+        game.add_player(player.Player("Button", 100))
+        game.add_player(player.Player("Small Blind", 100), fold_strategy)
+        game.add_player(player.Player("Big Blind", 100))
+        # Low pocket cards, burns, then a royal flush in spades on the board.
+        rig_deck(game, [13, 14, 15, 27, 28, 29, 40, 8, 9, 10, 41, 11, 42, 12])
+
+        # Button and big blind split 5 minimum units, and the odd one goes to the big blind, first left of the button.
+        self.assertEqual(game.play_hand(), [0, -0.01, 0.01], "TEST8: the odd chip of a split pot was misplaced.")
+
+    def test_min_raise(self):
+        decisions = []
+
+        def small_raise(game, decision):
+            decisions.append(decision)
+            return poker_game.Action.RAISE, 1
+
+        game = poker_game.PokerGame(small_blind=1, big_blind=2, rng=6)
+        game.add_player(player.Player("Button", 100), small_raise)
+        game.add_player(player.Player("Big Blind", 100), fold_strategy)
+        # A raise to 1 is lifted to the minimum raise, to 4, and the big blind folds.
+        self.assertEqual(game.play_hand(), [2, -2], "TEST9: a raise below the minimum was not corrected.")
+        self.assertEqual((decisions[0].to_call, decisions[0].min_raise_to), (1, 4),
+                         "TEST10: the first decision did not offer a call of 1 and a raise to 4.")
+
+    def test_integer_chips(self):
+        game = poker_game.PokerGame(small_blind=0.5, big_blind=1.0, rng=7)
+        game.test_rng = random.Random(8)
+        for seat in range(4):
+            game.add_player(player.Player("Player " + str(seat), 150.25), random_strategy)
+        for _ in range(200):
+            game.play_hand()
+        # Fractional chips are converted to minimum units on the way in, so every stack stays an exact integer.
+        for seated in game.player_list:
+            self.assertIs(type(seated.stack_units), int, "TEST11: a stack was not kept in integer minimum units.")
+        self.assertEqual(sum(seated.stack_units for seated in game.player_list), player.to_units(601),
+                         "TEST12: integer stacks do not add up to the chips in play.")
+
+        fractional = player.Player("Fractional", 10.5)
+        self.assertEqual(fractional.get_stack(), 10.5, "TEST13: a fractional stack was not returned in chips.")
+        self.assertEqual(fractional.bet(0.25), 0.25, "TEST14: a fractional bet was not returned in chips.")
+
+    def test_conservation_check(self):
+        def leaky_strategy(game, decision):
+            # Chips taken off the table mid-hand break conservation.
+            decision.player.stack_units -= 1
+            return poker_game.Action.CALL, 0
+
+        game = poker_game.PokerGame(rng=9)
+        game.add_player(player.Player("Leaky", 100), leaky_strategy)
+        game.add_player(player.Player("Honest", 100))
+        with self.assertRaises(RuntimeError, msg="TEST15: lost chips were not detected."):
+            game.play_hand()
+
+
+if __name__ == "__main__":
+    unittest.main()
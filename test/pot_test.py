@@ -0,0 +1,102 @@
+###############################################################################
+#
+# Testing file to verify side pot construction and settlement are working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import random
+import unittest
+
+# Package imports.
+from poker import player
+from poker import pot
+
+
+def make_players(count):
+    return [player.Player("Player " + str(seat), 0) for seat in range(count)]
+
+
+class TestSidePots(unittest.TestCase):
+    def test_layers(self):
+        players = make_players(4)
+        pots = pot.build_pots(players, [50, 200, 100, 200])
+
+        self.assertEqual([p.pot_units for p in pots], [200, 150, 200], "TEST1: wrong side pot sizes.")
+        self.assertEqual(pots[0].player_list, players, "TEST2: every player is not in the main pot.")
+        self.assertEqual(pots[1].player_list, [players[1], players[2], players[3]],
+                         "TEST3: the short all-in player is eligible for a side pot.")
+        self.assertEqual(pots[2].player_list, [players[1], players[3]], "TEST4: wrong players in the top side pot.")
+
+    def test_folded_players(self):
+        players = make_players(3)
+        players[1].fold()
+        pots = pot.build_pots(players, [100, 60, 100])
+        # The folded player's chips stay in one pot, and they are not eligible for it.
+        self.assertEqual(len(pots), 1, "TEST5: a folded player's contribution split the pot.")
+        self.assertEqual(pots[0].pot_units, 260, "TEST6: chips were lost from the pot.")
+        self.assertEqual(pots[0].player_list, [players[0], players[2]], "TEST7: a folded player is eligible.")
+
+        players = make_players(2)
+        players[1].fold()
+        pots = pot.build_pots(players, [40, 100])
+        self.assertEqual([p.pot_units for p in pots], [140], "TEST8: unmatched chips were not kept in the pot.")
+
+    def test_chip_amounts(self):
+        main_pot = pot.Pot()
+        main_pot.add_chips(2.5)
+        main_pot.add_units(1)
+        self.assertEqual(main_pot.pot_units, 2.5 * player.UNITS_PER_CHIP + 1, "TEST11: chips were not counted in "
+                                                                               "minimum units.")
+        self.assertEqual(main_pot.get_pot_total(), 2.5 + 1 / player.UNITS_PER_CHIP,
+                         "TEST12: the pot total was not returned in chips.")
+
+        self.assertEqual(player.to_units(0.29), 29, "TEST16: floating point error was not rounded away.")
+        with self.assertRaises(ValueError, msg="TEST17: a fraction of a minimum unit was rounded away."):
+            main_pot.add_chips(0.004)
+        with self.assertRaises(ValueError, msg="TEST18: a bet of a fraction of a minimum unit was accepted."):
+            player.Player("Player 1", 10).bet(0.004)
+
+    def test_random_contributions(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            players = make_players(rng.randint(2, 9))
+            contributions = [rng.choice([0, 10, 25, 40, 100]) for _ in players]
+            for entry in players:
+                if rng.random() < 0.3:
+                    entry.fold()
+            pots = pot.build_pots(players, contributions)
+
+            # Eligible players are active and keep the order of players, and every chip lands in a pot.
+            for side_pot in pots:
+                seats = [players.index(entry) for entry in side_pot.player_list]
+                self.assertEqual(seats, sorted(seats), "TEST13: eligible players were not kept in button order.")
+                self.assertTrue(all(entry.active for entry in side_pot.player_list),
+                                "TEST14: a folded player was eligible.")
+            if any(entry.active and contribution for entry, contribution in zip(players, contributions)):
+                self.assertEqual(sum(side_pot.pot_units for side_pot in pots), sum(contributions),
+                                 "TEST15: chips were lost building the pots.")
+
+    def test_settlement(self):
+        players = make_players(4)
+        pots = pot.build_pots(players, [50, 200, 100, 200])
+        ranks = {players[0]: 9, players[1]: 5, players[2]: 7, players[3]: 5}
+        winnings = pot.settle_pots(pots, ranks)
+        # The short stack wins the main pot, the next best hand the first side pot, and the last is split.
+        self.assertEqual(winnings, {players[0]: 200, players[2]: 150, players[1]: 100, players[3]: 100},
+                         "TEST9: pots were not paid to their best eligible hands.")
+
+    def test_odd_chips(self):
+        players = make_players(3)
+        main_pot = pot.Pot()
+        main_pot.add_units(7)
+        for entry in players:
+            main_pot.add_player(entry)
+        split = main_pot.split({players[0]: 1, players[1]: 3, players[2]: 3})
+        self.assertEqual(split, [(players[1], 4), (players[2], 3)], "TEST10: the odd chip did not go to the first "
+                                                                     "winner.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+###############################################################################
+#
+# Testing file to verify the preflop equity table is working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Package imports.
+from poker import card
+
+if np is not None:
+    from poker import preflop
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestHandClass(unittest.TestCase):
+    def test_classes(self):
+        self.assertEqual(len(set(preflop.CLASS_NAMES)), 169, "TEST1: class names are not distinct.")
+        for index, name in enumerate(preflop.CLASS_NAMES):
+            self.assertEqual(preflop.hand_class(name), index, "TEST2: class name did not map back to its index.")
+            self.assertEqual(preflop.hand_class(preflop._class_representative(index)), index,
+                             "TEST3: class representative is not in its class.")
+
+    def test_pockets(self):
+        # Ace of Spades with the Ace of Hearts, King of Hearts and King of Spades.
+        ace = card.Card.from_index(12)
+        self.assertEqual(preflop.CLASS_NAMES[preflop.hand_class([ace, card.Card.from_index(25)])], "AA",
+                         "TEST4: pocket Aces were not classed as AA.")
+        self.assertEqual(preflop.CLASS_NAMES[preflop.hand_class([24, 12])], "AKo", "TEST5: AKo was misclassed.")
+        self.assertEqual(preflop.CLASS_NAMES[preflop.hand_class([ace, 11])], "AKs", "TEST6: AKs was misclassed.")
+        with self.assertRaises(ValueError, msg="TEST7: an unmarked class name was accepted."):
+            preflop.hand_class("AK")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestPreflopTable(unittest.TestCase):
+    def test_heads_up_row(self):
+        totals = preflop._heads_up_task((preflop.hand_class("AA"), 1 << 19, np.random.SeedSequence(1)))
+        kings = preflop.hand_class("KK")
+        self.assertAlmostEqual(totals[0, kings] / totals[1, kings], 0.82, delta=0.03,
+                               msg="TEST8: Aces did not hold about 82% against Kings.")
+        self.assertAlmostEqual(totals[0].sum() / totals[1].sum(), 0.85, delta=0.01,
+                               msg="TEST9: Aces did not hold about 85% against a random pocket.")
+
+    def test_table_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "preflop.npy")
+            table = preflop.build_table(heads_up_trials=2000, multiway_trials=200, seed=3, processes=1)
+            previous_path = os.environ.get(preflop.TABLE_PATH_ENVIRONMENT)
+            os.environ[preflop.TABLE_PATH_ENVIRONMENT] = path
+            try:
+                preflop.write_table(table=table)
+                self.assertAlmostEqual(preflop.heads_up_equity("AA", "72o") + preflop.heads_up_equity("72o", "AA"),
+                                       1.0, places=5, msg="TEST10: heads up equities did not add up to one.")
+                self.assertEqual(preflop.heads_up_equity("QQ", "QQ"), 0.5, "TEST11: a mirror matchup was not even.")
+                self.assertGreater(preflop.random_equity("AA", 3), preflop.random_equity("72o", 3),
+                                   "TEST12: Aces did not beat Seven, Two against random hands.")
+                with self.assertRaises(ValueError, msg="TEST13: ten opponents were accepted."):
+                    preflop.random_equity("AA", 10)
+            finally:
+                preflop._table = None
+                if previous_path is None:
+                    del os.environ[preflop.TABLE_PATH_ENVIRONMENT]
+                else:
+                    os.environ[preflop.TABLE_PATH_ENVIRONMENT] = previous_path
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+###############################################################################
+#
+# Testing file to verify range against range equity functions are working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Package imports.
+if np is not None:
+    from poker import equity
+    from poker import hand_range
+    from poker import range_equity
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestRangeEquityMatrix(unittest.TestCase):
+    def test_matches_exact_equity(self):
+        # Six, Seven of Spades with the Ace of Hearts on the flop.
+        board = [4, 5, 25]
+        hero = hand_range.HandRange.parse("AKs, 99")
+        villain = hand_range.HandRange.parse("AQo, 88, 8s9s")
+        result = range_equity.range_equity_matrix(hero, villain, board)
+
+        self.assertEqual(result.matrix.shape, (len(result.hero_range), len(result.villain_range)),
+                         "TEST1: the matrix did not hold a row per hero combo and a column per villain combo.")
+        for row, hero_combo in enumerate(result.hero_range.combos.tolist()):
+            for column, villain_combo in enumerate(result.villain_range.combos.tolist()):
+                if set(hero_combo) & set(villain_combo):
+                    self.assertTrue(np.isnan(result.matrix[row, column]), "TEST2: a blocked pair had an equity.")
+                    continue
+                expected = equity.exact_equity(hero_combo, [villain_combo], board).equity
+                self.assertAlmostEqual(result.matrix[row, column], expected, places=9,
+                                       msg="TEST3: a pair disagrees with exact_equity.")
+
+    def test_aggregates(self):
+        board = [4, 5, 25]
+        hero = hand_range.HandRange.parse("AKs:0.5, 99, 76s")
+        villain = hand_range.HandRange.parse("AQo, 88, 8s9s")
+        result = range_equity.range_equity_matrix(hero, villain, board)
+        reverse = range_equity.range_equity_matrix(villain, hero, board)
+
+        self.assertAlmostEqual(result.equity + reverse.equity, 1.0, places=9,
+                               msg="TEST4: hero and villain equities did not add up to one.")
+        np.testing.assert_allclose(result.villain_equities, reverse.hero_equities,
+                                   err_msg="TEST5: villain combo equities disagree with the reversed matrix.")
+        # The Ace of Hearts and the Seven of Spades on the board block their combos.
+        self.assertEqual(len(result.hero_range), 3 + 6 + 3, "TEST6: board cards did not block hero combos.")
+
+    def test_sampled_runouts(self):
+        result = range_equity.range_equity_matrix(hand_range.HandRange.parse("AA"), hand_range.HandRange.parse("KK"),
+                                                  runouts=20000, seed=1)
+        self.assertAlmostEqual(result.equity, 0.82, delta=0.02, msg="TEST7: Aces did not hold about 82% against "
+                                                                    "Kings.")
+
+
+if __name__ == "__main__":
+    unittest.main()
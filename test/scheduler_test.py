@@ -0,0 +1,57 @@
+###############################################################################
+#
+# Testing file to verify the multi-table scheduler is working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import multiprocessing
+import unittest
+
+# Package imports.
+from poker import player
+from poker import poker_game
+from poker import scheduler
+
+
+def raise_strategy(game, decision):
+    if decision.can_raise and game.table_rng.random() < 0.2:
+        return poker_game.Action.RAISE, decision.min_raise_to
+    return poker_game.Action.CALL, 0
+
+
+def build_table(table_id, rng):
+    game = poker_game.PokerGame(rng=rng)
+    game.table_rng = rng
+    for seat in range(4):
+        game.add_player(player.Player("Seat " + str(seat), 100), raise_strategy)
+    return game
+
+
+class TestScheduler(unittest.TestCase):
+    def test_process_count_independent(self):
+        single = scheduler.run_simulation(build_table, 6, 40, processes=1, seed=5, tables_per_task=2)
+        pooled = scheduler.run_simulation(build_table, 6, 40, processes=2, seed=5, tables_per_task=2)
+
+        self.assertEqual(single.chip_deltas, pooled.chip_deltas, "TEST1: process count changed the seeded result.")
+        self.assertEqual(single.hands_played, pooled.hands_played, "TEST2: process count changed the hands played.")
+        self.assertEqual(pooled.tables, 6, "TEST3: not every table was played.")
+        self.assertEqual(sum(pooled.unit_deltas.values()), 0, "TEST4: chips were created or lost.")
+
+    def test_hand_budget(self):
+        results = list(scheduler.run_tables(build_table, 3, 5, processes=1))
+        self.assertEqual(sorted(result.table_id for result in results), [0, 1, 2], "TEST5: tables were skipped.")
+        for result in results:
+            self.assertLessEqual(result.hands_played, 5, "TEST6: a table played past its hand budget.")
+
+    def test_cancellation(self):
+        cancel_event = multiprocessing.Event()
+        cancel_event.set()
+        totals = scheduler.run_simulation(build_table, 8, 1000, processes=2, tables_per_task=1,
+                                          cancel_event=cancel_event)
+        self.assertEqual(totals.hands_played, 0, "TEST7: hands were played after cancellation.")
+
+
+if __name__ == "__main__":
+    unittest.main()
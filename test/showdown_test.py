@@ -0,0 +1,79 @@
+###############################################################################
+#
+# Testing file to verify showdown functions are working as intended.
+#
+# Author - Ryan Muetzel (@pretzelryan)
+#
+
+# Standard imports.
+import random
+import unittest
+
+
+# Package imports.
+from poker import card
+from poker import hand
+from poker import player
+from poker import showdown
+
+
+def _make_cards(indices):
+    """
+    Creates revealed Card objects from card indices.
+
+    :param indices: Iterable of integer card indices.
+    :return: List of revealed Card objects.
+    """
+    card_list = [card.Card.from_index(index) for index in indices]
+    for new_card in card_list:
+        new_card.reveal_card()
+    return card_list
+
+
+class TestShowdown(unittest.TestCase):
+    def test_rank_pockets_matches_hand(self):
+        rng = random.Random(99)
+        for _ in range(200):
+            indices = rng.sample(range(52), 11)
+            board = _make_cards(indices[:5])
+            pockets = [_make_cards(indices[i:i + 2]) for i in range(5, 11, 2)]
+
+            expected = []
+            for pocket in pockets:
+                new_hand = hand.Hand()
+                new_hand.append_card_list(board + pocket)
+                new_hand.evaluate_hand()
+                expected.append(new_hand.get_hand_rank())
+
+            self.assertEqual(showdown.rank_pockets(board, pockets), expected,
+                             "TEST1: rank_pockets disagrees with Hand for board " + str(board))
+
+    def test_split_and_fold(self):
+        board = _make_cards([12, 11, 10, 9, 8])             # Royal flush in Spades on the board.
+        players = []
+        for name, pocket in (("Player 1", [0, 13]), ("Player 2", [26, 39]), ("Player 3", [1, 14])):
+            new_player = player.Player(name, 100)
+            for new_card in _make_cards(pocket):
+                new_player.add_card(new_card)
+            players.append(new_player)
+        players[2].fold()
+
+        groups = showdown.showdown(board, players)
+        self.assertEqual(groups, [players[:2]], "TEST2: showdown did not split the board between active players.")
+
+    def test_ordering(self):
+        board = _make_cards([0, 14, 28, 42, 5])             # 2, 3, 4, 5 of mixed suits and Seven of Spades.
+        players = []
+        for name, pocket in (("Low", [22, 37]), ("Wheel", [12, 50]), ("High", [4, 44])):
+            new_player = player.Player(name, 100)
+            for new_card in _make_cards(pocket):
+                new_player.add_card(new_card)
+            players.append(new_player)
+
+        groups = showdown.showdown(board, players)
+        self.assertEqual(groups, [[players[2]], [players[1]], [players[0]]],
+                         "TEST3: showdown did not order players strongest first.")
+
+
+if __name__ == "__main__":
+    unittest.main()